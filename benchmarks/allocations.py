@@ -0,0 +1,85 @@
+# counts containers created per loop iteration under tree and unboxed engines
+# the difference between runs with different amount of iterations excludes containers of declarations
+from common import *
+
+from resolution.resolver import Resolver
+from interpreter.interpreter import Interpreter
+from interpreter.containers import Container
+from unboxed.interpreter import UnboxedInterpreter
+
+from builtin.builtin import *
+
+import tempfile
+
+ITERATIONS = [1000, 2000]
+
+# loop with arithmetic, comparisons, conditions, assignments and function calls
+def generate_program(iterations: int):
+  return (
+    'function scale(value, factor) {\n'
+    '  return value * factor + 1\n'
+    '}\n'
+    'var total = 0\n'
+    f'for (var i = 0; i < {iterations}; i++) {{\n'
+    '  if (i % 3 == 0 && i > 1) {\n'
+    '    total += scale(i, 2) - i / 2\n'
+    '  } else {\n'
+    '    total = total - 1\n'
+    '  }\n'
+    '}\n'
+  )
+
+INTERPRETERS = [
+  ('tree', Interpreter),
+  ('unboxed', UnboxedInterpreter),
+]
+
+# returns amount of containers created while callable is executed
+def count_containers(callable):
+  count = 0
+  initialize = Container.__init__
+
+  def counting_initialize(self, name, value):
+    nonlocal count
+    count += 1
+    initialize(self, name, value)
+
+  Container.__init__ = counting_initialize
+
+  try:
+    callable()
+  finally:
+    Container.__init__ = initialize
+
+  return count
+
+def execute(entrypoint: str, interpreter_class):
+  resolver = Resolver()
+  resolver.resolve_modules(entrypoint)
+
+  interpreter = interpreter_class(resolver)
+  interpreter.load_modules(resolver.sort_modules())
+  interpreter.register_builtins(builtins)
+  interpreter.execute()
+
+def benchmark_allocations():
+  with tempfile.TemporaryDirectory() as directory:
+    entrypoints = []
+
+    for iterations in ITERATIONS:
+      entrypoint = os.path.join(directory, f'module{iterations}.br')
+      entrypoints.append(entrypoint)
+
+      with open(entrypoint, 'w') as file:
+        file.write(generate_program(iterations))
+
+    report('engine', 'per iteration', 'time (s)')
+
+    for name, interpreter_class in INTERPRETERS:
+      small, large = (count_containers(lambda: execute(entrypoint, interpreter_class)) for entrypoint in entrypoints)
+      per_iteration = (large - small) / (ITERATIONS[1] - ITERATIONS[0])
+
+      report(name, f'{per_iteration:.1f}', f'{measure(lambda: execute(entrypoints[1], interpreter_class)):.3f}')
+
+if __name__ == '__main__':
+  benchmark_allocations()
@@ -0,0 +1,30 @@
+# compares cold and warm resolution with AST cache
+from common import *
+
+from resolution.resolver import Resolver
+from resolution.cache import Cache
+
+import tempfile
+
+SIZE = 1024 * 1024
+
+def resolve(entrypoint: str, cache: Cache | None):
+  resolver = Resolver(cache=cache)
+  resolver.resolve_modules(entrypoint)
+
+def benchmark_cache():
+  with tempfile.TemporaryDirectory() as directory:
+    entrypoint = os.path.join(directory, 'module.br')
+
+    with open(entrypoint, 'w') as file:
+      file.write(generate_module(SIZE))
+
+    cache = Cache(os.path.join(directory, 'cache'))
+
+    report('run', 'time (s)')
+    report('no cache', f'{measure(lambda: resolve(entrypoint, None), repeat=1):.3f}')
+    report('cold', f'{measure(lambda: resolve(entrypoint, cache), repeat=1):.3f}')
+    report('warm', f'{measure(lambda: resolve(entrypoint, cache)):.3f}')
+
+if __name__ == '__main__':
+  benchmark_cache()
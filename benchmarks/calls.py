@@ -0,0 +1,134 @@
+# measures overhead of function calls
+# binding: scope of parameters created by validation of parameters on every call (as before frame layouts)
+# and by frame layout computed once (see FrameLayout), calls: time of call under execution engines
+# (recursive calls are executed while the same function is executed, every call has its own activation)
+from common import *
+
+from resolution.resolver import Resolver
+from interpreter.interpreter import Interpreter
+from interpreter.frames import FrameLayout
+from interpreter.stack import Scope
+from interpreter.containers import ReadableContainer, TransformContainer
+from closures.interpreter import ClosureInterpreter
+from bytecode.interpreter import BytecodeInterpreter
+from unboxed.interpreter import UnboxedInterpreter
+
+from builtin.builtin import *
+
+import tempfile
+
+BINDINGS = 100000
+CALLS = 20000
+PARAMETERS = [1, 3, 6]
+
+# binds arguments as function did before frame layouts: parameters are scanned and declared one by one
+def bind_with_validation(names: tuple, optional: tuple, size: int, arguments: tuple):
+  for argument in arguments:
+    if not isinstance(argument, ReadableContainer):
+      raise ValueError('Argument is not readable')
+
+  required = len(names)
+  optional_found = False
+
+  for is_optional in optional:
+    if not is_optional and optional_found:
+      raise ValueError('Required argument cannot follow optional one')
+
+    if is_optional:
+      required -= 1
+      optional_found = True
+
+  if len(arguments) < required or len(arguments) > len(names):
+    raise ValueError('Invalid amount of arguments')
+
+  scope = Scope(size)
+
+  for index in range(len(names)):
+    scope.declare_container(TransformContainer(names[index], arguments[index].read()), index)
+
+  return scope
+
+def benchmark_binding():
+  report('parameters', 'validation (us)', 'layout (us)')
+
+  for amount in PARAMETERS:
+    names = tuple(f'p{index}' for index in range(amount))
+    optional = (False,) * amount
+    arguments = tuple(ReadableContainer('', index) for index in range(amount))
+    layout = FrameLayout(names, optional, amount)
+
+    def validate():
+      for _ in range(BINDINGS):
+        bind_with_validation(names, optional, amount, arguments)
+
+    def use_layout():
+      for _ in range(BINDINGS):
+        layout.bind_arguments(arguments)
+
+    report(amount, f'{measure(validate) / BINDINGS * 1e6:.2f}', f'{measure(use_layout) / BINDINGS * 1e6:.2f}')
+
+# calls of function with three parameters (one of them is optional)
+PROGRAM = (
+  'function add(a, b, c = 1) {\n'
+  '  return a + b + c\n'
+  '}\n'
+  f'for (var i = 0; i < {CALLS}; i++) {{\n'
+  '  add(i, 2)\n'
+  '}\n'
+)
+
+# recursive calls of function (every call makes two calls until depth is reached)
+DEPTH = 14
+RECURSIVE_CALLS = 2 ** (DEPTH + 1) - 1
+
+RECURSIVE_PROGRAM = (
+  'function walk(depth) {\n'
+  '  if (depth == 0) {\n'
+  '    return 1\n'
+  '  } else {\n'
+  '    return walk(depth - 1) + walk(depth - 1)\n'
+  '  }\n'
+  '}\n'
+  f'walk({DEPTH})\n'
+)
+
+INTERPRETERS = [
+  ('tree', Interpreter),
+  ('closure', ClosureInterpreter),
+  ('bytecode', BytecodeInterpreter),
+  ('unboxed', UnboxedInterpreter),
+]
+
+def execute(entrypoint: str, interpreter_class):
+  resolver = Resolver()
+  resolver.resolve_modules(entrypoint)
+
+  interpreter = interpreter_class(resolver)
+  interpreter.load_modules(resolver.sort_modules())
+  interpreter.register_builtins(builtins)
+  interpreter.execute()
+
+def benchmark_calls():
+  with tempfile.TemporaryDirectory() as directory:
+    entrypoint = os.path.join(directory, 'module.br')
+    recursive_entrypoint = os.path.join(directory, 'recursive.br')
+
+    with open(entrypoint, 'w') as file:
+      file.write(PROGRAM)
+
+    with open(recursive_entrypoint, 'w') as file:
+      file.write(RECURSIVE_PROGRAM)
+
+    report('engine', 'per call (us)', 'recursive (us)')
+
+    for name, interpreter_class in INTERPRETERS:
+      report(
+        name,
+        f'{measure(lambda: execute(entrypoint, interpreter_class)) / CALLS * 1e6:.2f}',
+        f'{measure(lambda: execute(recursive_entrypoint, interpreter_class)) / RECURSIVE_CALLS * 1e6:.2f}',
+      )
+
+if __name__ == '__main__':
+  benchmark_binding()
+  print()
+  benchmark_calls()
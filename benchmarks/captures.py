@@ -0,0 +1,78 @@
+# measures peak RSS of program that creates and keeps a million closures
+# every closure is returned by factory function that has big intermediate list,
+# functions capture only declarations that they use (see Environment), so scopes of factory calls are dropped
+# every engine is measured in separate process, because peak RSS is never decreased
+from common import *
+
+from shared.memory import get_peak_memory
+
+import subprocess
+import tempfile
+
+CLOSURES = 1000000
+
+ENGINES = ['tree', 'closure', 'bytecode', 'unboxed']
+
+# every closure captures previous one, so all closures are alive until the end of program
+PROGRAM = (
+  'function make(index, previous) {\n'
+  '  var items = [index, index, index, index, index, index, index, index]\n'
+  '  function get() {\n'
+  '    return previous\n'
+  '  }\n'
+  '  return get\n'
+  '}\n'
+  'var last = null\n'
+  f'for (var i = 0; i < {CLOSURES}; i++) {{\n'
+  '  last = make(i, last)\n'
+  '}\n'
+)
+
+# executes program with given engine and prints peak RSS (MB) and time (s)
+def execute(entrypoint: str, engine: str):
+  from resolution.resolver import Resolver
+  from interpreter.interpreter import Interpreter
+  from closures.interpreter import ClosureInterpreter
+  from bytecode.interpreter import BytecodeInterpreter
+  from unboxed.interpreter import UnboxedInterpreter
+
+  from builtin.builtin import builtins
+
+  interpreters = {
+    'tree': Interpreter,
+    'closure': ClosureInterpreter,
+    'bytecode': BytecodeInterpreter,
+    'unboxed': UnboxedInterpreter,
+  }
+
+  start = time.perf_counter()
+
+  resolver = Resolver()
+  resolver.resolve_modules(entrypoint)
+
+  interpreter = interpreters[engine](resolver)
+  interpreter.load_modules(resolver.sort_modules())
+  interpreter.register_builtins(builtins)
+  interpreter.execute()
+
+  print(get_peak_memory(), time.perf_counter() - start)
+
+def benchmark_closures():
+  with tempfile.TemporaryDirectory() as directory:
+    entrypoint = os.path.join(directory, 'module.br')
+
+    with open(entrypoint, 'w') as file:
+      file.write(PROGRAM)
+
+    report('engine', 'peak RSS (MB)', 'time (s)')
+
+    for engine in ENGINES:
+      output = subprocess.check_output([sys.executable, __file__, entrypoint, engine], text=True)
+      peak, elapsed = map(float, output.split())
+      report(engine, f'{peak:.1f}', f'{elapsed:.3f}')
+
+if __name__ == '__main__':
+  if len(sys.argv) == 3:
+    execute(sys.argv[1], sys.argv[2])
+  else:
+    benchmark_closures()
@@ -0,0 +1,40 @@
+# shared helpers for benchmark scripts
+# benchmarks are run from repository root: python benchmarks/<name>.py
+import os
+import sys
+import time
+
+# make interpreter packages importable
+LANG_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'lang')
+sys.path.insert(0, os.path.normpath(LANG_DIRECTORY))
+
+# returns best time (seconds) of several runs
+def measure(callable, repeat: int = 3):
+  best = float('inf')
+
+  for _ in range(repeat):
+    start = time.perf_counter()
+    callable()
+    best = min(best, time.perf_counter() - start)
+
+  return best
+
+# generates module source with given approximate size in bytes
+# module contains declarations, functions, loops and string literals
+def generate_module(size: int):
+  chunk = (
+    'const value = 10 * (20 + 30) - 40 / 5\n'
+    'var text = "line with \\"escapes\\" and spaces"\n'
+    'function compute(a, b = 2) {\n'
+    '  return a * b + value\n'
+    '}\n'
+    'for (var i = 0; i < 10; i++) {\n'
+    '  text = text + \'!\'\n'
+    '}\n'
+  )
+
+  return chunk * max(1, size // len(chunk))
+
+# prints table row with aligned columns
+def report(*columns):
+  print(''.join(f'{str(column):>16}' for column in columns))
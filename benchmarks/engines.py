@@ -0,0 +1,65 @@
+# compares execution time of loop-heavy module under execution engines
+from common import *
+
+from resolution.resolver import Resolver
+from optimizer.optimizer import Optimizer
+from interpreter.interpreter import Interpreter
+from closures.interpreter import ClosureInterpreter
+from bytecode.interpreter import BytecodeInterpreter
+from unboxed.interpreter import UnboxedInterpreter
+
+from builtin.builtin import *
+
+import tempfile
+
+ITERATIONS = 20000
+
+# loops with arithmetic, comparisons, conditions and function calls
+PROGRAM = (
+  'function scale(value, factor = 2) {\n'
+  '  return value * factor\n'
+  '}\n'
+  'var total = 0\n'
+  f'for (var i = 0; i < {ITERATIONS}; i++) {{\n'
+  '  if (i % 3 == 0) {\n'
+  '    total += scale(i)\n'
+  '  } else {\n'
+  '    total -= i >= 10\n'
+  '  }\n'
+  '}\n'
+  'var j = 0\n'
+  f'while (j < {ITERATIONS}) {{\n'
+  '  j++\n'
+  '}\n'
+)
+
+INTERPRETERS = [
+  ('tree', Interpreter),
+  ('closure', ClosureInterpreter),
+  ('bytecode', BytecodeInterpreter),
+  ('unboxed', UnboxedInterpreter),
+]
+
+def execute(entrypoint: str, interpreter_class):
+  resolver = Resolver(optimizer=Optimizer())
+  resolver.resolve_modules(entrypoint)
+
+  interpreter = interpreter_class(resolver)
+  interpreter.load_modules(resolver.sort_modules())
+  interpreter.register_builtins(builtins)
+  interpreter.execute()
+
+def benchmark_engines():
+  with tempfile.TemporaryDirectory() as directory:
+    entrypoint = os.path.join(directory, 'module.br')
+
+    with open(entrypoint, 'w') as file:
+      file.write(PROGRAM)
+
+    report('engine', 'time (s)')
+
+    for name, interpreter_class in INTERPRETERS:
+      report(name, f'{measure(lambda: execute(entrypoint, interpreter_class)):.3f}')
+
+if __name__ == '__main__':
+  benchmark_engines()
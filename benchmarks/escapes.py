@@ -0,0 +1,32 @@
+# compares escape decoding of every token with decoding of string literals only
+from common import *
+
+from lexer.lexer import Lexer
+from lexer.escapes import decode_escapes
+from shared.tokens import STRING_TOKEN
+
+SIZE = 1024 * 1024
+
+# previous approach: every token is transcoded
+def decode_every_token(codes: list[str]):
+  for code in codes:
+    code.encode('utf-8').decode('unicode_escape')
+
+# current approach: string literals only (cached, without escapes - unchanged)
+def decode_string_literals(codes: list[tuple[str, str]]):
+  for type, code in codes:
+    if type == STRING_TOKEN[0]:
+      decode_escapes(code)
+
+def benchmark_escapes():
+  tokens = Lexer().parse(generate_module(SIZE))
+
+  codes = [token.code for token in tokens]
+  typed_codes = [(token.type, token.code) for token in tokens]
+
+  report('decoding', 'tokens', 'time (s)')
+  report('every token', len(codes), f'{measure(lambda: decode_every_token(codes)):.3f}')
+  report('strings only', len(typed_codes), f'{measure(lambda: decode_string_literals(typed_codes)):.3f}')
+
+if __name__ == '__main__':
+  benchmark_escapes()
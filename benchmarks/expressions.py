@@ -0,0 +1,30 @@
+# measures parsing time of long operator chains and deep nesting
+from common import *
+
+from lexer.lexer import Lexer
+from parser.parser import Parser
+
+SIZES = [2500, 5000, 10000]
+
+# chains of generated expressions
+CHAINS = {
+  'sum': lambda size: ' + '.join(str(index) for index in range(size)),
+  'mixed': lambda size: ' + '.join(f'{index} * x' for index in range(size // 2)),
+  'calls': lambda size: 'f' + '(1)' * size,
+  'nested': lambda size: '(' * size + '1' + ')' * size,
+  'arguments': lambda size: 'f(' * size + '1' + ')' * size,
+}
+
+def parse(code: str):
+  tokens = Lexer(trivia=False).parse(code)
+  Parser(trivia=False).parse(tokens)
+
+def benchmark_expressions():
+  report('chain', *SIZES)
+
+  for name, generate in CHAINS.items():
+    codes = [f'const value = {generate(size)}\n' for size in SIZES]
+    report(name, *(f'{measure(lambda: parse(code)):.3f}' for code in codes))
+
+if __name__ == '__main__':
+  benchmark_expressions()
@@ -0,0 +1,50 @@
+# compares execution of loop with constant expressions with and without AST optimization
+from common import *
+
+from resolution.resolver import Resolver
+from optimizer.optimizer import Optimizer
+from interpreter.interpreter import Interpreter
+
+from builtin.builtin import *
+
+import tempfile
+
+ITERATIONS = 20000
+
+# loop body contains constant expressions and statically dead branch
+PROGRAM = (
+  'var total = 0\n'
+  'var i = 0\n'
+  f'while (i < {ITERATIONS}) {{\n'
+  '  total += 60 * 60 * 24 - 1000 / 8\n'
+  '  if (false) {\n'
+  '    total = 0\n'
+  '  } else {\n'
+  '    total -= 2 ** 10 % 7\n'
+  '  }\n'
+  '  i++\n'
+  '}\n'
+)
+
+def execute(entrypoint: str, optimizer: Optimizer | None):
+  resolver = Resolver(optimizer=optimizer)
+  resolver.resolve_modules(entrypoint)
+
+  interpreter = Interpreter(resolver)
+  interpreter.load_modules(resolver.sort_modules())
+  interpreter.register_builtins(builtins)
+  interpreter.execute()
+
+def benchmark_folding():
+  with tempfile.TemporaryDirectory() as directory:
+    entrypoint = os.path.join(directory, 'module.br')
+
+    with open(entrypoint, 'w') as file:
+      file.write(PROGRAM)
+
+    report('run', 'time (s)')
+    report('not optimized', f'{measure(lambda: execute(entrypoint, None)):.3f}')
+    report('optimized', f'{measure(lambda: execute(entrypoint, Optimizer())):.3f}')
+
+if __name__ == '__main__':
+  benchmark_folding()
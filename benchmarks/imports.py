@@ -0,0 +1,29 @@
+# compares discovery of module imports by scanning (see scan_import_paths) with full lexing and parsing
+from common import *
+
+from resolution.imports import scan_import_paths
+from lexer.lexer import Lexer
+from parser.parser import Parser
+
+SIZES = [16 * 1024, 64 * 1024, 256 * 1024]
+IMPORTS = 10
+
+def generate_code(size: int):
+  imports = ''.join(f'import * from "./module{index}.br"\n' for index in range(IMPORTS))
+
+  return imports + generate_module(size)
+
+def parse(code: str):
+  tokens = Lexer(trivia=False).parse(code)
+  Parser(trivia=False).parse(tokens)
+
+def benchmark_imports():
+  report('size (bytes)', 'scan (s)', 'parse (s)')
+
+  for size in SIZES:
+    code = generate_code(size)
+
+    report(size, f'{measure(lambda: scan_import_paths(code)):.4f}', f'{measure(lambda: parse(code)):.4f}')
+
+if __name__ == '__main__':
+  benchmark_imports()
@@ -0,0 +1,51 @@
+# measures scaling of declarations, exports and registry lookups with amount of names and modules
+# indexed lookups keep time per item constant when amount grows
+from common import *
+
+from interpreter.stack import Scope
+from interpreter.exports import Exports
+from interpreter.containers import TransformContainer
+from resolution.registry import Registry
+from resolution.module import Module
+from parser.types.statements import BlockStatement
+
+SIZES = [1000, 2000, 4000, 8000]
+
+def declare_names(size: int):
+  scope = Scope()
+
+  for index in range(size):
+    scope.add_container(TransformContainer(f'name_{index}', index))
+
+def export_names(size: int):
+  exports = Exports()
+
+  for index in range(size):
+    exports.add_container(TransformContainer(f'name_{index}', index))
+
+  for index in range(size):
+    exports.get_container_by_name(f'name_{index}')
+
+# every module depends on the previous one
+def register_modules(size: int):
+  registry = Registry()
+
+  for index in range(size):
+    registry.add_module(Module(f'/modules/module_{index}.br', [f'/modules/module_{index - 1}.br'] if index else [], BlockStatement([])))
+
+  for index in range(size):
+    registry.get_module_by_absolute_path(f'/modules/module_{index}.br')
+
+def benchmark_indexes():
+  report('size', 'scope (s)', 'exports (s)', 'registry (s)')
+
+  for size in SIZES:
+    report(
+      size,
+      f'{measure(lambda: declare_names(size)):.4f}',
+      f'{measure(lambda: export_names(size)):.4f}',
+      f'{measure(lambda: register_modules(size)):.4f}',
+    )
+
+if __name__ == '__main__':
+  benchmark_indexes()
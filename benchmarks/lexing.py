@@ -0,0 +1,22 @@
+# measures lexing time for generated modules of growing size
+# linear lexer keeps time per megabyte constant
+from common import *
+
+from lexer.lexer import Lexer
+
+SIZES = [1, 2, 4, 8]
+
+def benchmark_lexing():
+  lexer = Lexer()
+
+  report('size (MB)', 'tokens', 'time (s)', 's / MB')
+
+  for megabytes in SIZES:
+    code = generate_module(megabytes * 1024 * 1024)
+    tokens = lexer.parse(code)
+
+    elapsed = measure(lambda: lexer.parse(code), repeat=1)
+    report(megabytes, len(tokens), f'{elapsed:.3f}', f'{elapsed / megabytes:.3f}')
+
+if __name__ == '__main__':
+  benchmark_lexing()
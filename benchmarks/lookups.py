@@ -0,0 +1,45 @@
+# compares identifier lookup by name and by address (depth, slot) in deep stack with many declarations
+from common import *
+
+from interpreter.stack import Stack
+from interpreter.containers import TransformContainer
+
+LOOKUPS = 100000
+
+# stacks have given amount of scopes with given amount of names in every scope
+SHAPES = [(2, 10), (8, 10), (8, 50)]
+
+# creates stack with declarations in slots
+# returns stack and address of the first declaration of the first scope (the slowest lookup by name)
+def create_stack(scopes: int, names: int):
+  stack = Stack()
+
+  for scope_index in range(scopes):
+    stack.add_scope(names)
+
+    for slot in range(names):
+      stack.declare_container(TransformContainer(f'name_{scope_index}_{slot}', slot), slot)
+
+  return stack, ('name_0_0', scopes - 1, 0)
+
+def lookup_by_name(stack: Stack, name: str):
+  for _ in range(LOOKUPS):
+    stack.get_container_by_name(name)
+
+def lookup_by_address(stack: Stack, name: str, depth: int, slot: int):
+  for _ in range(LOOKUPS):
+    stack.get_container_by_address(name, depth, slot)
+
+def benchmark_lookups():
+  report('scopes', 'names', 'by name (s)', 'by address (s)')
+
+  for scopes, names in SHAPES:
+    stack, (name, depth, slot) = create_stack(scopes, names)
+
+    by_name = measure(lambda: lookup_by_name(stack, name))
+    by_address = measure(lambda: lookup_by_address(stack, name, depth, slot))
+
+    report(scopes, names, f'{by_name:.3f}', f'{by_address:.3f}')
+
+if __name__ == '__main__':
+  benchmark_lookups()
@@ -0,0 +1,54 @@
+# compares peak RSS of module resolution with read, streamed and memory-mapped files
+# every mode is measured in separate process, because peak RSS is never decreased
+from common import *
+
+from shared.memory import get_peak_memory
+
+import subprocess
+import tempfile
+
+SIZE = 4 * 1024 * 1024
+
+# generates data module with big object literals used as lookup tables
+def generate_data_module(size: int):
+  # every property is written on separate line with trailing comma
+  rows = ''.join(f'  key{index}: "value {index}",\n' for index in range(64))
+  chunk = f'const table = {{\n{rows}}}\n'
+
+  return chunk * max(1, size // len(chunk))
+
+# resolves module in given mode and prints peak RSS (MB) and time (s)
+def resolve(path: str, mode: str):
+  from resolution.resolver import Resolver
+
+  start = time.perf_counter()
+
+  if mode == 'read':
+    resolver = Resolver()
+    content = resolver.read_module_by_absolute_path(path)
+    tokens = resolver.lexer.tokenize(content)
+    resolver.parser.parse(tokens)
+  else:
+    resolver = Resolver(mmap=mode == 'mmap')
+    resolver.get_module_by_absolute_path(path)
+
+  print(get_peak_memory(), time.perf_counter() - start)
+
+def benchmark_resolution():
+  with tempfile.NamedTemporaryFile('w', suffix='.br', delete=False) as file:
+    file.write(generate_data_module(SIZE))
+
+  report('mode', 'peak RSS (MB)', 'time (s)')
+
+  for mode in ['read', 'stream', 'mmap']:
+    output = subprocess.check_output([sys.executable, __file__, file.name, mode], text=True)
+    peak, elapsed = map(float, output.split())
+    report(mode, f'{peak:.1f}', f'{elapsed:.3f}')
+
+  os.remove(file.name)
+
+if __name__ == '__main__':
+  if len(sys.argv) == 3:
+    resolve(sys.argv[1], sys.argv[2])
+  else:
+    benchmark_resolution()
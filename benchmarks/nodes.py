@@ -0,0 +1,33 @@
+# measures memory retained by AST of generated module
+from common import *
+
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from parser.accounting import *
+
+import gc
+import tracemalloc
+
+SIZE = 1024 * 1024
+
+def benchmark_nodes():
+  code = generate_module(SIZE)
+
+  # memory retained by AST (lexer and parser buffers are released)
+  gc.collect()
+  tracemalloc.start()
+
+  ast = Parser(trivia=False).parse(Lexer(trivia=False).tokenize(code))
+
+  gc.collect()
+  retained = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+
+  usage = compute_ast_usage(ast)
+  nodes = sum(count for type, (count, _) in usage.items() if issubclass(type, Node))
+
+  report('nodes', 'retained (MB)', 'bytes/node')
+  report(nodes, f'{retained / 1024 / 1024:.1f}', retained // nodes)
+
+if __name__ == '__main__':
+  benchmark_nodes()
@@ -0,0 +1,40 @@
+# compares serial and parallel resolution of project with many modules
+from common import *
+
+from resolution.resolver import Resolver
+
+import tempfile
+
+MODULES = 200
+SIZE = 16 * 1024
+
+# creates project where every module imports several previous modules
+# returns ABSOLUTE path to entry module
+def generate_project(directory: str, modules: int, size: int):
+  for index in range(modules):
+    imports = ''.join(f'import * from "./module{dependency}.br"\n' for dependency in range(max(0, index - 3), index))
+
+    with open(os.path.join(directory, f'module{index}.br'), 'w') as file:
+      file.write(imports + generate_module(size))
+
+  return os.path.join(directory, f'module{modules - 1}.br')
+
+def resolve(entrypoint: str, workers: int):
+  resolver = Resolver(workers=workers)
+  resolver.resolve_modules(entrypoint)
+
+  return [module.path for module in resolver.sort_modules()]
+
+def benchmark_parallel():
+  with tempfile.TemporaryDirectory() as directory:
+    entrypoint = generate_project(directory, MODULES, SIZE)
+    expected = resolve(entrypoint, 0)
+
+    report('workers', 'time (s)', 'same order')
+
+    for workers in [0, 1, 2, 4, os.cpu_count()]:
+      elapsed = measure(lambda: resolve(entrypoint, workers), repeat=1)
+      report(workers, f'{elapsed:.3f}', resolve(entrypoint, workers) == expected)
+
+if __name__ == '__main__':
+  benchmark_parallel()
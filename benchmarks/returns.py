@@ -0,0 +1,71 @@
+# measures calls of small functions that return values (recursion and closure of counter)
+# return completes function without exception (see Completion)
+from common import *
+
+from resolution.resolver import Resolver
+from interpreter.interpreter import Interpreter
+from closures.interpreter import ClosureInterpreter
+from bytecode.interpreter import BytecodeInterpreter
+from unboxed.interpreter import UnboxedInterpreter
+
+from builtin.builtin import *
+
+import tempfile
+
+ITERATIONS = 20000
+
+PROGRAM = (
+  'function counter() {\n'
+  '  var count = 0\n'
+  '  function increment() {\n'
+  '    count++\n'
+  '    return count\n'
+  '  }\n'
+  '  return increment\n'
+  '}\n'
+  'function depth(n) {\n'
+  '  if (n == 0) {\n'
+  '    return 0\n'
+  '  } else {\n'
+  '    return depth(n - 1) + 1\n'
+  '  }\n'
+  '}\n'
+  'const increment = counter()\n'
+  f'for (var i = 0; i < {ITERATIONS}; i++) {{\n'
+  '  increment()\n'
+  '}\n'
+  f'for (var j = 0; j < {ITERATIONS // 20}; j++) {{\n'
+  '  depth(20)\n'
+  '}\n'
+)
+
+INTERPRETERS = [
+  ('tree', Interpreter),
+  ('closure', ClosureInterpreter),
+  ('bytecode', BytecodeInterpreter),
+  ('unboxed', UnboxedInterpreter),
+]
+
+def execute(entrypoint: str, interpreter_class):
+  resolver = Resolver()
+  resolver.resolve_modules(entrypoint)
+
+  interpreter = interpreter_class(resolver)
+  interpreter.load_modules(resolver.sort_modules())
+  interpreter.register_builtins(builtins)
+  interpreter.execute()
+
+def benchmark_returns():
+  with tempfile.TemporaryDirectory() as directory:
+    entrypoint = os.path.join(directory, 'module.br')
+
+    with open(entrypoint, 'w') as file:
+      file.write(PROGRAM)
+
+    report('engine', 'time (s)')
+
+    for name, interpreter_class in INTERPRETERS:
+      report(name, f'{measure(lambda: execute(entrypoint, interpreter_class)):.3f}')
+
+if __name__ == '__main__':
+  benchmark_returns()
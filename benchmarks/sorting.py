@@ -0,0 +1,38 @@
+# measures topological sort of module graphs (see Registry.sort_topologically)
+# chain - every module depends on the previous one, wide - every module depends on the entry module and two previous ones
+from common import *
+
+from resolution.registry import Registry
+from resolution.module import Module
+from parser.types.statements import BlockStatement
+
+SIZES = [1000, 2000, 5000, 10000]
+
+def get_path(index: int):
+  return f'/modules/module_{index}.br'
+
+def create_registry(size: int, get_dependencies):
+  registry = Registry()
+
+  for index in range(size):
+    registry.add_module(Module(get_path(index), [get_path(dependency) for dependency in get_dependencies(index)], BlockStatement([])))
+
+  return registry
+
+def get_chain_dependencies(index: int):
+  return [index - 1] if index else []
+
+def get_wide_dependencies(index: int):
+  return [0] + [dependency for dependency in (index - 1, index - 2) if dependency > 0] if index else []
+
+def benchmark_sorting():
+  report('modules', 'chain (s)', 'wide (s)')
+
+  for size in SIZES:
+    chain = create_registry(size, get_chain_dependencies)
+    wide = create_registry(size, get_wide_dependencies)
+
+    report(size, f'{measure(chain.sort_topologically):.4f}', f'{measure(wide.sort_topologically):.4f}')
+
+if __name__ == '__main__':
+  benchmark_sorting()
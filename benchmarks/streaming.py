@@ -0,0 +1,46 @@
+# compares peak memory of list-based and streaming lexing + parsing
+from common import *
+
+from lexer.lexer import Lexer
+from parser.parser import Parser
+
+import tempfile
+import tracemalloc
+
+SIZE = 1024 * 1024
+
+# returns peak traced memory (MB) during callable execution
+def measure_peak_memory(callable):
+  tracemalloc.start()
+  callable()
+  peak = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+
+  return peak / 1024 / 1024
+
+def parse_list(path: str):
+  with open(path, 'r', encoding='utf-8') as file:
+    content = file.read()
+
+  tokens = Lexer().parse(content)
+  Parser().parse(tokens)
+
+def parse_stream(path: str):
+  with open(path, 'r', encoding='utf-8') as file:
+    Parser().parse(Lexer().stream(file))
+
+def benchmark_streaming():
+  with tempfile.NamedTemporaryFile('w', suffix='.br', delete=False) as file:
+    file.write(generate_module(SIZE))
+
+  report('pipeline', 'peak (MB)', 'time (s)')
+
+  for name, pipeline in [('list', parse_list), ('stream', parse_stream)]:
+    peak = measure_peak_memory(lambda: pipeline(file.name))
+    elapsed = measure(lambda: pipeline(file.name), repeat=1)
+    report(name, f'{peak:.1f}', f'{elapsed:.3f}')
+
+  os.remove(file.name)
+
+if __name__ == '__main__':
+  benchmark_streaming()
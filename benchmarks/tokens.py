@@ -0,0 +1,36 @@
+# measures per-token memory and construction time
+# compares list of Token objects with struct of arrays TokenBuffer
+from common import *
+
+from lexer.lexer import Lexer
+from lexer.buffer import TokenBuffer
+
+import tracemalloc
+
+SIZE = 1024 * 1024
+
+# returns result of callable and amount of memory (bytes) that it keeps allocated
+def measure_retained_memory(callable):
+  tracemalloc.start()
+  result = callable()
+  retained = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+
+  return result, retained
+
+def benchmark_tokens():
+  code = generate_module(SIZE)
+  lexer = Lexer()
+
+  tokens, list_memory = measure_retained_memory(lambda: lexer.parse(code))
+  buffer, buffer_memory = measure_retained_memory(lambda: TokenBuffer(lexer.tokenize(code)))
+
+  list_time = measure(lambda: lexer.parse(code), repeat=1)
+  buffer_time = measure(lambda: TokenBuffer(lexer.tokenize(code)), repeat=1)
+
+  report('storage', 'tokens', 'bytes / token', 'time (s)')
+  report('list', len(tokens), f'{list_memory / len(tokens):.1f}', f'{list_time:.3f}')
+  report('buffer', len(buffer), f'{buffer_memory / len(buffer):.1f}', f'{buffer_time:.3f}')
+
+if __name__ == '__main__':
+  benchmark_tokens()
@@ -0,0 +1,25 @@
+# compares token counts and parse time with and without trivia (spaces and blank lines)
+from common import *
+
+from lexer.lexer import Lexer
+from parser.parser import Parser
+
+SIZE = 256 * 1024
+
+def benchmark_trivia():
+  code = generate_module(SIZE)
+
+  report('trivia', 'tokens', 'lex (s)', 'parse (s)')
+
+  for trivia in [True, False]:
+    lexer = Lexer(trivia=trivia)
+    parser = Parser(trivia=trivia)
+
+    tokens = lexer.parse(code)
+
+    lex_time = measure(lambda: lexer.parse(code))
+    parse_time = measure(lambda: parser.parse(tokens))
+    report(trivia, len(tokens), f'{lex_time:.3f}', f'{parse_time:.3f}')
+
+if __name__ == '__main__':
+  benchmark_trivia()
@@ -2,25 +2,38 @@ from config.config import get_config
 from config.constants import *
 
 from resolution.resolver import Resolver
-from interpreter.interpreter import Interpreter
+from resolution.cache import Cache
+from resolution.constants import CACHE_DIRECTORY_NAME
+from optimizer.optimizer import Optimizer
+from engines import INTERPRETERS
 
 from builtin.builtin import *
 
+import os
+
 def execute_code():
   config = get_config()
 
+  # cache directory is created in working directory
+  cache = Cache(os.path.join(os.getcwd(), CACHE_DIRECTORY_NAME)) if config[CONFIGURATION_CACHE_KEY] else None
+
+  # ASTs are optimized after they are parsed (or loaded)
+  optimizer = Optimizer() if config[CONFIGURATION_OPTIMIZE_KEY] else None
+
   # resolve modules dependency graph
-  resolver = Resolver(config[CONFIGURATION_ALIASES_KEY])
+  resolver = Resolver(config[CONFIGURATION_ALIASES_KEY], config[CONFIGURATION_MMAP_KEY], config[CONFIGURATION_WORKERS_KEY], cache, optimizer)
   resolver.resolve_modules(config[CONFIGURATION_ENTRYPOINT_KEY])
   
   # get topologically sorted modules
   modules = resolver.sort_modules()
 
   # execute modules
-  interpreter = Interpreter(resolver)
+  interpreter = INTERPRETERS[config[CONFIGURATION_ENGINE_KEY]](resolver)
   interpreter.load_modules(modules)
   interpreter.register_builtins(builtins)
   interpreter.execute()
 
 # entry point of the interpreter
-execute_code()
+# guard is required, because worker processes of resolver import main module on some platforms
+if __name__ == '__main__':
+  execute_code()
@@ -0,0 +1,30 @@
+from config.config import get_config
+from config.constants import *
+
+from resolution.resolver import Resolver
+from resolution.compiled import *
+from optimizer.optimizer import Optimizer
+
+# compiles entry module and all its dependencies
+# compiled module (.brc) is written next to source module
+def build_modules():
+  config = get_config()
+
+  # compiled modules contain optimized ASTs if optimization is enabled
+  optimizer = Optimizer() if config[CONFIGURATION_OPTIMIZE_KEY] else None
+
+  # resolve modules dependency graph
+  resolver = Resolver(config[CONFIGURATION_ALIASES_KEY], config[CONFIGURATION_MMAP_KEY], config[CONFIGURATION_WORKERS_KEY], optimizer=optimizer)
+  resolver.resolve_modules(config[CONFIGURATION_ENTRYPOINT_KEY])
+
+  # write compiled modules
+  for module in resolver.sort_modules():
+    # module without source is already compiled
+    if module.compiled:
+      continue
+
+    write_compiled_module(module, get_compiled_module_path(module.path))
+
+# entry point of the build
+if __name__ == '__main__':
+  build_modules()
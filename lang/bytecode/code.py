@@ -0,0 +1,87 @@
+from array import array
+
+# code object of module or function
+# instructions is array of words (opcode, argument pairs)
+# constants is pool of values and objects referenced by instructions (function Code objects are constants too)
+# names is pool of identifiers
+# function code has parameters names and default value Code (or None) for every parameter,
+# amount of slots in scope of parameters, slot of function in declaring scope and captured declarations (see ScopeResolver)
+class Code:
+  __slots__ = ('name', 'instructions', 'constants', 'names', 'parameters', 'defaults', 'size', 'slot', 'captures', 'containers')
+
+  def __init__(self, name: str, instructions: list[int], constants: list, names: list[str], parameters: tuple[str, ...] = (), defaults: tuple = (), size: int = 0, slot: int = 0, captures: tuple = ()):
+    self.name = name
+    self.instructions = array('i', instructions)
+    self.constants = tuple(constants)
+    self.names = tuple(names)
+    self.parameters = parameters
+    self.defaults = defaults
+    self.size = size
+    self.slot = slot
+    self.captures = captures
+
+    # containers of constants
+    # created by virtual machine when code is executed first time
+    self.containers = None
+
+# collects instructions, constants and names of code object during compilation
+class CodeBuilder:
+  def __init__(self, name: str):
+    self.name = name
+
+    self.instructions: list[int] = []
+
+    self.constants = []
+    # maps constant key to index in pool (see get_constant_key)
+    self.constants_indexes = dict()
+
+    self.names: list[str] = []
+    # maps name to index in pool
+    self.names_indexes = dict()
+
+  # appends instruction
+  # returns index of instruction argument word (used to patch jumps)
+  def emit(self, opcode: int, argument: int = 0) -> int:
+    self.instructions.append(opcode)
+    self.instructions.append(argument)
+
+    return len(self.instructions) - 1
+
+  # sets argument of emitted instruction
+  def patch(self, argument_index: int, argument: int):
+    self.instructions[argument_index] = argument
+
+  # index of next instruction (jump target)
+  def get_position(self) -> int:
+    return len(self.instructions)
+
+  # returns index of constant in pool (adds constant if it is not added)
+  def add_constant(self, value) -> int:
+    key = get_constant_key(value)
+
+    if key not in self.constants_indexes:
+      self.constants_indexes[key] = len(self.constants)
+      self.constants.append(value)
+
+    return self.constants_indexes[key]
+
+  # returns index of name in pool (adds name if it is not added)
+  def add_name(self, name: str) -> int:
+    if name not in self.names_indexes:
+      self.names_indexes[name] = len(self.names)
+      self.names.append(name)
+
+    return self.names_indexes[name]
+
+  # creates code object
+  def build(self, parameters: tuple[str, ...] = (), defaults: tuple = (), size: int = 0, slot: int = 0, captures: tuple = ()) -> Code:
+    return Code(self.name, self.instructions, self.constants, self.names, parameters, defaults, size, slot, captures)
+
+# values are the same constant only if their types and representations are equal
+# (1.0 and true are equal in Python, but they are different constants)
+# objects (tokens, statements, code objects) are the same constant only if they are the same object
+def get_constant_key(value):
+  if value is None or isinstance(value, (bool, int, float, str)):
+    return (type(value), repr(value))
+
+  return (type(value), id(value))
@@ -0,0 +1,451 @@
+from bytecode.opcodes import *
+from bytecode.code import *
+
+from interpreter.interpreter import *
+from interpreter.operations import *
+
+# compiles AST of module to bytecode (Code objects)
+# every function declaration is compiled to its own Code object that is a constant of enclosing code
+# errors of invalid nodes are compiled to RAISE instructions, so they are raised when node is executed (as in Interpreter)
+class BytecodeCompiler:
+  def __init__(self):
+    # builder of currently compiled code
+    self.builder: CodeBuilder | None = None
+
+    # flag that indicates that function body is compiled
+    self.in_function = False
+
+    # amount of scopes entered in currently compiled code
+    self.scopes = 0
+
+    # break jumps, continue jumps and amount of entered scopes of enclosing loops (last is the innermost loop)
+    self.loops: list[tuple[list[int], list[int], int]] = []
+
+  # compiles module AST
+  # returns Code of module
+  def compile_module(self, ast: BlockStatement, name: str = '<module>', depth: int = BASE_DEPTH) -> Code:
+    def compile_body():
+      self.compile_statements(ast.statements, depth)
+      self.emit_null_return()
+
+    return self.compile_code(name, False, compile_body)
+
+  # compiles code object with separate builder
+  # compile callable emits instructions of code body (including return)
+  def compile_code(self, name: str, in_function: bool, compile, parameters: tuple[str, ...] = (), defaults: tuple = (), size: int = 0, slot: int = 0, captures: tuple = ()) -> Code:
+    # save state of enclosing code
+    enclosing = (self.builder, self.in_function, self.scopes, self.loops)
+
+    self.builder = CodeBuilder(name)
+    self.in_function = in_function
+    self.scopes = 0
+    self.loops = []
+
+    compile()
+
+    code = self.builder.build(parameters, defaults, size, slot, captures)
+
+    # restore state of enclosing code
+    self.builder, self.in_function, self.scopes, self.loops = enclosing
+
+    return code
+
+  # compile statements
+  # statement leaves stack unchanged
+
+  def compile_statements(self, statements: list[Statement], depth: int):
+    for statement in statements:
+      self.compile_statement(statement, depth)
+
+  # this methods delegates compilation based on statement type
+  def compile_statement(self, statement: Statement, depth: int):
+    if is_statement_of_class(statement, BlockStatement):
+      return self.compile_block_statement(statement, depth)
+    if is_statement_of_class(statement, VariableDeclarationStatement, ConstantDeclarationStatement, FunctionDeclarationStatement, ExpressionStatement):
+      # result of statement is not used
+      self.compile_valued_statement(statement, depth)
+      self.builder.emit(POP)
+      return
+    if is_statement_of_class(statement, ConditionStatement):
+      return self.compile_condition_statement(statement, depth)
+    if is_statement_of_class(statement, WhileStatement):
+      return self.compile_while_statement(statement, depth)
+    if is_statement_of_class(statement, ForStatement):
+      return self.compile_for_statement(statement, depth)
+    if is_statement_of_class(statement, BreakStatement):
+      return self.compile_break_statement(statement)
+    if is_statement_of_class(statement, ContinueStatement):
+      return self.compile_continue_statement(statement)
+    if is_statement_of_class(statement, ReturnStatement):
+      return self.compile_return_statement(statement)
+    if is_statement_of_class(statement, ImportStatement):
+      return self.compile_import_statement(statement, depth)
+    if is_statement_of_class(statement, ExportStatement):
+      return self.compile_export_statement(statement, depth)
+
+    # statements that are not executed by Interpreter
+    self.emit_error(StatementError(f'Invalid statement is used'))
+
+  # compiles statement that pushes its result container (declarations and expressions)
+  def compile_valued_statement(self, statement: Statement, depth: int):
+    if is_statement_of_class(statement, VariableDeclarationStatement):
+      return self.compile_variable_declaration_statement(statement)
+    if is_statement_of_class(statement, ConstantDeclarationStatement):
+      return self.compile_constant_declaration_statement(statement)
+    if is_statement_of_class(statement, FunctionDeclarationStatement):
+      return self.compile_function_declaration_statement(statement, depth)
+
+    self.compile_expression(statement.expression)
+
+  def compile_block_statement(self, statement: BlockStatement, depth: int):
+    # block of statements has new scope
+    self.enter_scope(statement.size)
+    self.compile_statements(statement.statements, depth + 1)
+    self.exit_scope()
+
+  def compile_variable_declaration_statement(self, statement: VariableDeclarationStatement):
+    # default variable value
+    if statement.initialization:
+      self.compile_expression(statement.initialization)
+    else:
+      self.emit_constant(None)
+
+    self.builder.emit(DECLARE_VARIABLE, self.builder.add_constant((statement.name.code, statement.slot)))
+
+  def compile_constant_declaration_statement(self, statement: ConstantDeclarationStatement):
+    self.compile_expression(statement.initialization)
+    self.builder.emit(DECLARE_CONSTANT, self.builder.add_constant((statement.name.code, statement.slot)))
+
+  def compile_condition_statement(self, statement: ConditionStatement, depth: int):
+    self.compile_expression(statement.condition)
+    else_jump = self.builder.emit(JUMP_IF_FALSE)
+
+    self.compile_statement(statement.then_branch, depth + 1)
+
+    if statement.else_branch:
+      end_jump = self.builder.emit(JUMP)
+      self.builder.patch(else_jump, self.builder.get_position())
+
+      self.compile_statement(statement.else_branch, depth + 1)
+      self.builder.patch(end_jump, self.builder.get_position())
+    else:
+      self.builder.patch(else_jump, self.builder.get_position())
+
+  def compile_while_statement(self, statement: WhileStatement, depth: int):
+    start = self.builder.get_position()
+
+    self.compile_expression(statement.condition)
+    end_jump = self.builder.emit(LOOP_IF_FALSE)
+
+    self.compile_loop_body(statement.body, depth)
+
+    # continue checks condition again
+    self.patch_loop_continue(start)
+    self.builder.emit(JUMP, start)
+
+    self.patch_loop_end(end_jump)
+
+  def compile_for_statement(self, statement: ForStatement, depth: int):
+    self.enter_scope(statement.size)
+    self.compile_statement(statement.initializer, depth + 1)
+
+    start = self.builder.get_position()
+
+    self.compile_expression(statement.condition)
+    end_jump = self.builder.emit(LOOP_IF_FALSE)
+
+    self.compile_loop_body(statement.body, depth)
+
+    # increment is evaluated after body (and after continue)
+    self.patch_loop_continue(self.builder.get_position())
+    self.compile_expression(statement.increment)
+    self.builder.emit(POP)
+    self.builder.emit(JUMP, start)
+
+    self.patch_loop_end(end_jump)
+    self.exit_scope()
+
+  # compiles loop body and collects its break and continue jumps (see patch_loop_continue and patch_loop_end)
+  def compile_loop_body(self, body: Statement, depth: int):
+    self.loops.append(([], [], self.scopes))
+    self.compile_statement(body, depth + 1)
+
+  # patches continue jumps of loop to the next iteration
+  def patch_loop_continue(self, position: int):
+    for jump in self.loops[-1][1]:
+      self.builder.patch(jump, position)
+
+  # patches loop condition jump and break jumps to the end of loop
+  def patch_loop_end(self, end_jump: int):
+    end = self.builder.get_position()
+
+    self.builder.patch(end_jump, end)
+
+    for jump in self.loops.pop()[0]:
+      self.builder.patch(jump, end)
+
+  def compile_break_statement(self, statement: BreakStatement):
+    # break outside of loop is not handled
+    if not self.loops:
+      return self.emit_error(BreakException())
+
+    self.emit_loop_jump(self.loops[-1][0])
+
+  def compile_continue_statement(self, statement: ContinueStatement):
+    # continue outside of loop is not handled
+    if not self.loops:
+      return self.emit_error(ContinueException())
+
+    self.emit_loop_jump(self.loops[-1][1])
+
+  # emits jump of break or continue (patched when loop is compiled)
+  def emit_loop_jump(self, jumps: list[int]):
+    scopes = self.loops[-1][2]
+
+    # scopes entered in loop body are removed before jump
+    for _ in range(self.scopes - scopes):
+      self.builder.emit(EXIT_SCOPE)
+
+    jumps.append(self.builder.emit(JUMP))
+
+  def compile_function_declaration_statement(self, statement: FunctionDeclarationStatement, depth: int):
+    parameters = tuple(param.name.code for param in statement.params)
+
+    # default values are evaluated in function scope, so every default value is code that returns it
+    defaults = tuple(
+      self.compile_code(f'{statement.name.code}:{param.name.code}', True, lambda param=param: self.compile_returned_expression(param.defaultValue)) if param.defaultValue else None
+      for param in statement.params
+    )
+
+    def compile_body():
+      self.compile_statement(statement.body, depth + 1)
+      self.emit_null_return()
+
+    code = self.compile_code(statement.name.code, True, compile_body, parameters, defaults, statement.size, statement.slot, statement.captures)
+
+    self.builder.emit(MAKE_FUNCTION, self.builder.add_constant(code))
+
+  def compile_returned_expression(self, expression: Expression):
+    self.compile_expression(expression)
+    self.builder.emit(RETURN_VALUE)
+
+  def compile_return_statement(self, statement: ReturnStatement):
+    self.compile_expression(statement.returns)
+
+    # return outside of function is not handled
+    self.builder.emit(RETURN_VALUE if self.in_function else RAISE_RETURN)
+
+  def compile_import_statement(self, statement: ImportStatement, depth: int):
+    # check statement depth
+    if depth > 0:
+      return self.emit_error(ExpressionError('Imports are only allowed on global level'))
+
+    self.builder.emit(IMPORT, self.builder.add_constant((statement.path.code, tuple(statement.imports), statement.slots)))
+
+  def compile_export_statement(self, statement: ExportStatement, depth: int):
+    # validate depth
+    if depth > 0:
+      return self.emit_error(ExpressionError('Exports are only allowed on global level'))
+
+    # only declarations and expressions have results
+    if not is_statement_of_class(statement.exports, VariableDeclarationStatement, ConstantDeclarationStatement, FunctionDeclarationStatement, ExpressionStatement):
+      self.compile_statement(statement.exports, depth)
+      return self.emit_error(ExpressionError('Invalid export statement'))
+
+    self.compile_valued_statement(statement.exports, depth)
+    self.builder.emit(EXPORT)
+
+  # compile expressions
+  # expression pushes its result container
+
+  # this methods delegates compilation based on expression type
+  def compile_expression(self, expression: Expression):
+    if is_expression_of_class(expression, ConstantExpression):
+      return self.emit_constant(expression.value)
+    if is_expression_of_class(expression, NullExpression):
+      return self.emit_constant(None)
+    if is_expression_of_class(expression, LiteralExpression):
+      return self.compile_literal_expression(expression)
+    if is_expression_of_class(expression, IdentifierExpression):
+      return self.compile_identifier_expression(expression)
+    if is_expression_of_class(expression, UnaryOperationExpression):
+      return self.compile_unary_expression(expression)
+    if is_expression_of_class(expression, BinaryOperationExpression):
+      return self.compile_binary_expression(expression)
+    if is_expression_of_class(expression, GroupingExpression):
+      return self.compile_grouping_expression(expression)
+    if is_expression_of_class(expression, GroupingApplicationExpression):
+      return self.compile_grouping_application_expression(expression)
+    if is_expression_of_class(expression, AssociationExpression):
+      return self.compile_curly_braces_expression(expression)
+
+    self.emit_error(SyntaxError('Invalid expression found'))
+
+  def compile_literal_expression(self, expression: LiteralExpression):
+    if is_token_of_type(expression.value, STRING_TOKEN):
+      return self.emit_constant(expression.value.code)
+    if is_token_of_type(expression.value, NUMBER_TOKEN):
+      return self.compile_number_literal(expression)
+    if is_token_of_type(expression.value, map_keyword_to_token(TRUE_KEYWORD)):
+      return self.emit_constant(True)
+    if is_token_of_type(expression.value, map_keyword_to_token(FALSE_KEYWORD)):
+      return self.emit_constant(False)
+    if is_token_of_type(expression.value, map_keyword_to_token(NULL_KEYWORD)):
+      return self.emit_constant(None)
+
+    self.emit_error(ExpressionError(f'Error during literal parsing: {expression.value}'))
+
+  # malformed number (for example "1.2.3") raises when instruction is executed, not when module is compiled
+  def compile_number_literal(self, expression: LiteralExpression):
+    try:
+      value = float(expression.value.code)
+    except Exception as error:
+      return self.emit_error(error)
+
+    self.emit_constant(value)
+
+  # unary expressions
+  def compile_unary_expression(self, expression: UnaryOperationExpression):
+    operator = expression.operator
+    operation = UNARY_OPERATIONS.get(operator.type)
+
+    if operation:
+      self.compile_expression(expression.operand)
+      return self.builder.emit(UNARY_OPERATION, self.builder.add_constant((operation, operator)))
+    if is_token_of_type(operator, INCREMENT_TOKEN):
+      self.compile_expression(expression.operand)
+      return self.builder.emit(INCREMENT, self.builder.add_constant(operator))
+    if is_token_of_type(operator, DECREMENT_TOKEN):
+      self.compile_expression(expression.operand)
+      return self.builder.emit(DECREMENT, self.builder.add_constant(operator))
+
+    self.emit_error(SyntaxError(f'Invalid operator used: {operator}'))
+
+  # binary expressions
+  def compile_binary_expression(self, expression: BinaryOperationExpression):
+    operator = expression.operator
+
+    if is_token_of_type(operator, ASSIGN_TOKEN):
+      return self.compile_assign_expression(expression)
+    if is_token_of_type(operator, DOT_TOKEN):
+      return self.compile_member_access_expression(expression)
+    if operator.type in BINARY_OPERATIONS:
+      self.compile_expression(expression.left)
+      self.compile_expression(expression.right)
+      return self.builder.emit(BINARY_OPERATION, self.builder.add_constant((BINARY_OPERATIONS[operator.type], operator)))
+    if operator.type in ASSIGNMENT_OPERATIONS:
+      # left operand is checked before right one is evaluated
+      self.compile_expression(expression.left)
+      self.builder.emit(CHECK_TRANSFORM)
+      self.compile_expression(expression.right)
+      return self.builder.emit(ASSIGN_OPERATION, self.builder.add_constant((ASSIGNMENT_OPERATIONS[operator.type], operator)))
+    if is_token_of_type(operator, OR_TOKEN):
+      return self.compile_logical_expression(expression, JUMP_IF_TRUE_OR_POP)
+    if is_token_of_type(operator, AND_TOKEN):
+      return self.compile_logical_expression(expression, JUMP_IF_FALSE_OR_POP)
+
+    self.emit_error(SyntaxError(f'Invalid operator used: {operator}'))
+
+  def compile_assign_expression(self, expression: BinaryOperationExpression):
+    # left operand is checked before right one is evaluated
+    self.compile_expression(expression.left)
+    self.builder.emit(CHECK_WRITABLE)
+    self.compile_expression(expression.right)
+    self.builder.emit(ASSIGN)
+
+  def compile_member_access_expression(self, expression: BinaryOperationExpression):
+    self.compile_expression(expression.left)
+
+    if not is_expression_of_class(expression.right, IdentifierExpression):
+      return self.emit_error(SyntaxError('Object member accessed by dot has to be a literal'))
+
+    self.builder.emit(MEMBER_ACCESS, self.builder.add_name(expression.right.name.code))
+
+  # logical operators return one of operands (right one is evaluated only if left does not decide)
+  def compile_logical_expression(self, expression: BinaryOperationExpression, jump_opcode: int):
+    self.compile_expression(expression.left)
+    end_jump = self.builder.emit(jump_opcode)
+
+    self.compile_expression(expression.right)
+    self.builder.emit(ENSURE_READABLE)
+
+    self.builder.patch(end_jump, self.builder.get_position())
+
+  # grouping expressions
+  def compile_grouping_expression(self, expression: GroupingExpression):
+    # parentheses without application indicate tuple literal
+    if is_token_of_type(expression.operator, LEFT_PARENTHESES_TOKEN):
+      return self.compile_elements(expression.expressions, BUILD_TUPLE)
+    # square brackets without application indicate LIST literal
+    if is_token_of_type(expression.operator, LEFT_SQUARE_BRACKET_TOKEN):
+      return self.compile_elements(expression.expressions, BUILD_LIST)
+
+    self.emit_error(SyntaxError(f'Invalid operator used: {expression.operator}'))
+
+  def compile_elements(self, expressions: list[Expression], opcode: int):
+    for exp in expressions:
+      self.compile_expression(exp)
+
+    self.builder.emit(opcode, len(expressions))
+
+  # grouping application expressions
+  def compile_grouping_application_expression(self, expression: GroupingApplicationExpression):
+    # parentheses in application is function call
+    if is_token_of_type(expression.right.operator, LEFT_PARENTHESES_TOKEN):
+      self.compile_expression(expression.left)
+      self.builder.emit(CHECK_CALLABLE)
+
+      for exp in expression.right.expressions:
+        self.compile_expression(exp)
+
+      return self.builder.emit(CALL, len(expression.right.expressions))
+
+    # square brackets in application is obj member access
+    if is_token_of_type(expression.right.operator, LEFT_SQUARE_BRACKET_TOKEN):
+      self.compile_expression(expression.left)
+      self.builder.emit(CHECK_OBJECT)
+      self.compile_expression(expression.right)
+      return self.builder.emit(SUBSCRIPT)
+
+    self.emit_error(SyntaxError(f'Invalid operator used by application: {expression.right.operator}'))
+
+  # address of identifier is resolved before execution (see ScopeResolver)
+  def compile_identifier_expression(self, expression: IdentifierExpression):
+    depth, slot = expression.address
+
+    # scope is indexed from the end of stack
+    self.builder.emit(LOAD_SLOT, self.builder.add_constant((expression.name.code, -1 - depth, slot)))
+
+  # association expression
+  def compile_curly_braces_expression(self, expression: AssociationExpression):
+    # objects with other keys than identifiers are rare, so Interpreter evaluates them
+    if not all(is_expression_of_class(key, IdentifierExpression) for key, _ in expression.entries):
+      return self.builder.emit(EVALUATE, self.builder.add_constant(expression))
+
+    # curly braces without application indicate OBJECT literal
+    for _, value in expression.entries:
+      self.compile_expression(value)
+
+    keys = tuple(key.name.code for key, _ in expression.entries)
+    self.builder.emit(BUILD_OBJECT, self.builder.add_constant(keys))
+
+  # utils
+
+  def emit_constant(self, value):
+    self.builder.emit(LOAD_CONST, self.builder.add_constant(value))
+
+  def enter_scope(self, size: int):
+    self.builder.emit(ENTER_SCOPE, size)
+    self.scopes += 1
+
+  def exit_scope(self):
+    self.builder.emit(EXIT_SCOPE)
+    self.scopes -= 1
+
+  # code returns null if it is finished without return
+  def emit_null_return(self):
+    self.emit_constant(None)
+    self.builder.emit(RETURN_VALUE)
+
+  def emit_error(self, error: Exception):
+    self.builder.emit(RAISE, self.builder.add_constant(error))
@@ -0,0 +1,58 @@
+from bytecode.opcodes import *
+from bytecode.code import *
+
+# returns readable listing of code and its nested codes (functions and default values)
+# every line contains position of instruction, opcode name, argument and its meaning
+def disassemble(code: Code) -> str:
+  lines = [f'code {code.name}' + (f' ({", ".join(code.parameters)})' if code.parameters else '')]
+  # codes that are listed after this one
+  nested = [default for default in code.defaults if default]
+
+  for position in range(0, len(code.instructions), 2):
+    opcode = code.instructions[position]
+    argument = code.instructions[position + 1]
+
+    lines.append(f'{position:>6} {OPCODE_NAMES.get(opcode, opcode):<22}{describe_argument(code, opcode, argument)}')
+
+    if opcode == MAKE_FUNCTION:
+      nested.append(code.constants[argument])
+
+  for nested_code in nested:
+    lines.append('')
+    lines.append(disassemble(nested_code))
+
+  return '\n'.join(lines)
+
+# returns argument of instruction with its meaning
+def describe_argument(code: Code, opcode: int, argument: int) -> str:
+  if opcode == IMPORT:
+    return f'{argument} ({describe_import(code.constants[argument])})'
+  if opcode in CONSTANT_OPCODES:
+    return f'{argument} ({describe_constant(code.constants[argument])})'
+  if opcode in NAME_OPCODES:
+    return f'{argument} ({code.names[argument]})'
+  if opcode in JUMP_OPCODES:
+    return f'to {argument}'
+  if opcode in COUNT_OPCODES:
+    return str(argument)
+
+  return ''
+
+# path and imported names of import constant
+def describe_import(constant: tuple) -> str:
+  path, imports, slots = constant
+
+  return f'{", ".join(import_item.code for import_item in imports)} from {path}'
+
+def describe_constant(constant) -> str:
+  if isinstance(constant, Code):
+    return f'code {constant.name}'
+  # operation and operator token
+  if isinstance(constant, tuple) and len(constant) == 2 and callable(constant[0]):
+    return constant[1].code
+  if isinstance(constant, BaseException):
+    return f'{type(constant).__name__}: {constant}'
+  if hasattr(constant, 'code'):
+    return constant.code
+
+  return repr(constant) if isinstance(constant, (type(None), bool, int, float, str, tuple)) else type(constant).__name__
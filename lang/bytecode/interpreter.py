@@ -0,0 +1,18 @@
+from bytecode.compiler import *
+from bytecode.vm import *
+
+# interpreter that executes modules compiled to bytecode (see BytecodeCompiler and VirtualMachine)
+# loading of modules, builtins, imports and exports are the same as in Interpreter
+class BytecodeInterpreter(Interpreter):
+  def __init__(self, resolver: Resolver):
+    super().__init__(resolver)
+
+    # compiler of modules
+    self.compiler = BytecodeCompiler()
+    # machine that executes compiled modules
+    self.vm = VirtualMachine(self)
+
+  # compiles module root and executes its code
+  # module is compiled right before execution
+  def execute_module_content(self, module: Module):
+    self.vm.run(self.compiler.compile_module(module.content, module.path))
@@ -0,0 +1,71 @@
+# operation codes of bytecode instructions
+# every instruction is two words: opcode and argument (0 if opcode has no argument)
+# stack of the virtual machine contains containers (as results of expressions in Interpreter)
+
+# values
+LOAD_CONST = 0 # pushes container of constant (argument - constant index)
+LOAD_SLOT = 1 # pushes container by address of identifier (argument - index of (name, scope index, slot) constant)
+POP = 2 # removes container from top of stack
+
+# declarations
+DECLARE_VARIABLE = 3 # declares variable initialized by container on top (argument - index of (name, slot) constant), pushes variable container
+DECLARE_CONSTANT = 4 # declares constant initialized by container on top (argument - index of (name, slot) constant), pushes constant container
+MAKE_FUNCTION = 5 # declares function (argument - index of function Code constant), pushes function container
+
+# scopes
+ENTER_SCOPE = 6 # adds scope to current stack (argument - amount of slots)
+EXIT_SCOPE = 7 # removes last scope of current stack
+
+# jumps (argument - index of target instruction word)
+JUMP = 8 # jumps unconditionally
+JUMP_IF_FALSE = 9 # pops condition of condition statement, jumps if it is false
+LOOP_IF_FALSE = 10 # pops condition of loop, jumps if it is false
+JUMP_IF_TRUE_OR_POP = 11 # keeps left operand of || and jumps if it is true, otherwise pops it
+JUMP_IF_FALSE_OR_POP = 12 # keeps left operand of && and jumps if it is false, otherwise pops it
+ENSURE_READABLE = 13 # checks that right operand of || and && is readable
+
+# operations (argument - index of (operation, operator token) constant)
+UNARY_OPERATION = 14 # replaces operand with result of operation
+BINARY_OPERATION = 15 # replaces operands with result of operation
+ASSIGN_OPERATION = 16 # pops right operand and writes result of operation to left operand
+INCREMENT = 17 # increments operand (argument - index of operator token constant)
+DECREMENT = 18 # decrements operand (argument - index of operator token constant)
+
+# assignments
+CHECK_WRITABLE = 19 # checks that left operand of = is writable
+CHECK_TRANSFORM = 20 # checks that left operand of assignment with operation is readable and writable
+ASSIGN = 21 # pops right operand and writes its value to left operand
+
+# composite values
+MEMBER_ACCESS = 22 # replaces object with its member (argument - name index)
+BUILD_TUPLE = 23 # replaces containers with tuple (argument - amount of containers)
+BUILD_LIST = 24 # replaces containers with list (argument - amount of containers)
+BUILD_OBJECT = 25 # replaces values with object (argument - index of keys tuple constant)
+CHECK_OBJECT = 26 # checks that container on top is object
+SUBSCRIPT = 27 # replaces object and selector list with object member
+
+# functions
+CHECK_CALLABLE = 28 # checks that container on top is function
+CALL = 29 # replaces function and arguments with returned value (argument - amount of arguments)
+RETURN_VALUE = 30 # returns container on top from code
+RAISE_RETURN = 31 # raises return outside of function (as Interpreter does)
+
+# modules
+IMPORT = 32 # declares imported containers (argument - index of (path, import tokens, slots) constant)
+EXPORT = 33 # pops container and adds it to exports of current module
+
+# fallbacks
+RAISE = 34 # raises error (argument - index of error constant)
+EVALUATE = 35 # evaluates expression with Interpreter (argument - index of expression constant), used for objects with non-identifier keys
+
+# names of opcodes for disassembly
+OPCODE_NAMES = {code: name for name, code in list(globals().items()) if name.isupper() and isinstance(code, int)}
+
+# kinds of opcode arguments
+CONSTANT_OPCODES = frozenset([
+  LOAD_CONST, LOAD_SLOT, DECLARE_VARIABLE, DECLARE_CONSTANT, MAKE_FUNCTION, UNARY_OPERATION, BINARY_OPERATION, ASSIGN_OPERATION,
+  INCREMENT, DECREMENT, BUILD_OBJECT, IMPORT, RAISE, EVALUATE,
+])
+NAME_OPCODES = frozenset([MEMBER_ACCESS])
+JUMP_OPCODES = frozenset([JUMP, JUMP_IF_FALSE, LOOP_IF_FALSE, JUMP_IF_TRUE_OR_POP, JUMP_IF_FALSE_OR_POP])
+COUNT_OPCODES = frozenset([ENTER_SCOPE, BUILD_TUPLE, BUILD_LIST, CALL])
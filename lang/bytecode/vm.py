@@ -0,0 +1,362 @@
+from bytecode.opcodes import *
+from bytecode.code import *
+
+from interpreter.interpreter import *
+
+# executes bytecode (see BytecodeCompiler) with stack of containers
+# state of runtime (Interpreter instance) is used as by Interpreter: current stack, exports and modules
+# every instruction behaves the same as the corresponding method of Interpreter (the same containers and errors)
+# dispatch loop checks opcodes in order of their frequency and keeps hot state in local variables
+class VirtualMachine:
+  def __init__(self, runtime: Interpreter):
+    self.runtime = runtime
+
+  # executes code on current stack of runtime
+  # returns container returned by code
+  def run(self, code: Code) -> ReadableContainer:
+    runtime = self.runtime
+    instructions = code.instructions
+    constants = code.constants
+    names = code.names
+
+    # constants are readable containers that cannot be changed, so they are created once per code
+    containers = code.containers
+    if containers is None:
+      containers = code.containers = tuple(ReadableContainer('', constant) for constant in constants)
+
+    stack = []
+    push = stack.append
+    pop = stack.pop
+
+    # index of current instruction word
+    position = 0
+
+    while True:
+      opcode = instructions[position]
+      argument = instructions[position + 1]
+      position += 2
+
+      if opcode == LOAD_SLOT:
+        name, index, slot = constants[argument]
+        container = runtime.current_stack.scopes[index].slots[slot]
+
+        # declaration is not executed yet (see Stack.get_container_by_address)
+        push(container if container is not None else runtime.current_stack.get_container_by_name(name))
+
+      elif opcode == LOAD_CONST:
+        push(containers[argument])
+
+      elif opcode == BINARY_OPERATION:
+        right_container = pop()
+        left_container = stack[-1]
+
+        if not isinstance(left_container, ReadableContainer):
+          raise ExpressionError('Left value is not readable')
+        if not isinstance(right_container, ReadableContainer):
+          raise ExpressionError('Right container is not readable')
+
+        operation, operator = constants[argument]
+        stack[-1] = ReadableContainer('', operation(operator, left_container.read(), right_container.read()))
+
+      elif opcode == POP:
+        pop()
+
+      elif opcode == JUMP:
+        position = argument
+
+      elif opcode == LOOP_IF_FALSE:
+        container = pop()
+        if not isinstance(container, ReadableContainer):
+          raise ExpressionError('Condition is not readable')
+
+        if not container.read():
+          position = argument
+
+      elif opcode == JUMP_IF_FALSE:
+        container = pop()
+        if not isinstance(container, ReadableContainer):
+          raise ExpressionError('Condition is not a readable container')
+
+        if not container.read():
+          position = argument
+
+      elif opcode == ENTER_SCOPE:
+        runtime.current_stack.add_scope(argument)
+
+      elif opcode == EXIT_SCOPE:
+        runtime.current_stack.remove_scope()
+
+      elif opcode == CHECK_WRITABLE:
+        if not isinstance(stack[-1], WriteableContainer):
+          raise ExpressionError('Left value is not writable')
+
+      elif opcode == ASSIGN:
+        right_container = pop()
+        if not isinstance(right_container, ReadableContainer):
+          raise ExpressionError('Right container is not readable')
+
+        stack[-1].write(right_container.read())
+
+      elif opcode == CHECK_TRANSFORM:
+        if not isinstance(stack[-1], TransformContainer):
+          raise ExpressionError('Left value is not readable and writable')
+
+      elif opcode == ASSIGN_OPERATION:
+        right_container = pop()
+        if not isinstance(right_container, ReadableContainer):
+          raise ExpressionError('Right container is not readable')
+
+        left_container = stack[-1]
+        operation, operator = constants[argument]
+        left_container.write(operation(operator, left_container.read(), right_container.read()))
+
+      elif opcode == INCREMENT or opcode == DECREMENT:
+        container = stack[-1]
+        if not isinstance(container, TransformContainer):
+          raise ExpressionError('Operand value is not readable and writable')
+
+        value = container.read()
+        if not is_value_of_type(value, NUMBER_TYPE):
+          raise TypeError(f'Unary operator {constants[argument].code} with type {get_value_type(value)} is not supported')
+
+        container.write(value + 1 if opcode == INCREMENT else value - 1)
+
+      elif opcode == CHECK_CALLABLE:
+        container = stack[-1]
+        if not isinstance(container, ReadableContainer):
+          raise ExpressionError('Left value is not readable')
+
+        function_value: FunctionValue = container.read()
+        if not is_value_of_type(function_value, FUNCTION_TYPE):
+          raise ValueError(f'{function_value} is not callable')
+
+        # function is read before arguments are evaluated
+        stack[-1] = function_value
+
+      elif opcode == CALL:
+        arguments = stack[len(stack) - argument:]
+        del stack[len(stack) - argument:]
+
+        for container in arguments:
+          if not is_container_of_type(container, ReadableContainer):
+            raise ExpressionError('Argument is not readable')
+
+        # execute function
+        return_value: ReadableContainer = stack[-1].callable(*arguments)
+        if not isinstance(return_value, ReadableContainer):
+          raise ExpressionError('Returned value is not readable')
+
+        stack[-1] = ReadableContainer('', return_value.read())
+
+      elif opcode == RETURN_VALUE:
+        return pop()
+
+      elif opcode == DECLARE_VARIABLE:
+        container = stack[-1]
+        if not isinstance(container, ReadableContainer):
+          raise ValueError('Variable initializer is not readable')
+
+        name, slot = constants[argument]
+        stack[-1] = TransformContainer(name, container.read())
+        runtime.current_stack.declare_container(stack[-1], slot)
+
+      elif opcode == JUMP_IF_TRUE_OR_POP or opcode == JUMP_IF_FALSE_OR_POP:
+        container = stack[-1]
+        if not isinstance(container, ReadableContainer):
+          raise ExpressionError('Left value is not readable')
+
+        # left operand decides result of || (if true) and && (if false)
+        if bool(container.read()) == (opcode == JUMP_IF_TRUE_OR_POP):
+          position = argument
+        else:
+          pop()
+
+      elif opcode == ENSURE_READABLE:
+        if not isinstance(stack[-1], ReadableContainer):
+          raise ExpressionError('Right container is not readable')
+
+      elif opcode == UNARY_OPERATION:
+        container = stack[-1]
+        if not isinstance(container, ReadableContainer):
+          raise ExpressionError('Operand value is not readable')
+
+        operation, operator = constants[argument]
+        stack[-1] = ReadableContainer('', operation(operator, container.read()))
+
+      elif opcode == MEMBER_ACCESS:
+        container = stack[-1]
+        if not isinstance(container, ReadableContainer):
+          raise ExpressionError('Left value is not readable')
+
+        value_container = container.read().get(names[argument])
+        if not isinstance(value_container, ReadableContainer):
+          raise ValueError('Accessed value is not readable')
+
+        stack[-1] = value_container
+
+      elif opcode == CHECK_OBJECT:
+        container = stack[-1]
+        if not isinstance(container, ReadableContainer):
+          raise ExpressionError('Left value is not readable')
+
+        obj = container.read()
+        if not is_value_of_type(obj, OBJECT_TYPE):
+          raise SyntaxError('Cannot access members of non-object type')
+
+        # object is read before selector is evaluated
+        stack[-1] = obj
+
+      elif opcode == SUBSCRIPT:
+        right_value = pop().read()
+        if not is_value_of_type(right_value, LIST_TYPE):
+          raise SyntaxError('Invalid member access')
+
+        if len(right_value) != 1:
+          raise SyntaxError('Member access has to be evaluated as a literal')
+
+        selector: ReadableContainer = right_value[0]
+        if not isinstance(selector, ReadableContainer):
+          raise ExpressionError('Member access expression is not readable')
+
+        selector_value = selector.read()
+        if not is_value_of_type(selector_value, *OBJECT_KEY_TYPES):
+          raise SyntaxError(f'Key expression has to be literal but {get_value_type(selector_value)} received')
+
+        stack[-1] = stack[-1][selector_value]
+
+      elif opcode == BUILD_LIST:
+        elements = stack[len(stack) - argument:]
+        del stack[len(stack) - argument:]
+        push(ReadableContainer('', elements))
+
+      elif opcode == BUILD_TUPLE:
+        elements = tuple(stack[len(stack) - argument:])
+        del stack[len(stack) - argument:]
+        push(ReadableContainer('', elements))
+
+      elif opcode == BUILD_OBJECT:
+        keys = constants[argument]
+        values = stack[len(stack) - len(keys):]
+        del stack[len(stack) - len(keys):]
+
+        for value_container in values:
+          if not isinstance(value_container, ReadableContainer):
+            raise ExpressionError('Value is not readable')
+
+        push(ReadableContainer('', dict(zip(keys, values))))
+
+      elif opcode == DECLARE_CONSTANT:
+        container = stack[-1]
+        if not isinstance(container, ReadableContainer):
+          raise ValueError('Constant initializer is not readable')
+
+        name, slot = constants[argument]
+        stack[-1] = ReadableContainer(name, container.read())
+        runtime.current_stack.declare_container(stack[-1], slot)
+
+      elif opcode == MAKE_FUNCTION:
+        push(self.make_function(constants[argument]))
+
+      elif opcode == RAISE_RETURN:
+        raise ReturnException(pop()) # return outside of function is not handled
+
+      elif opcode == IMPORT:
+        self.import_containers(*constants[argument])
+
+      elif opcode == EXPORT:
+        container = pop()
+        if not isinstance(container, ReadableContainer):
+          raise ExpressionError('Invalid export statement')
+
+        runtime.current_exports.add_container(container)
+
+      elif opcode == EVALUATE:
+        push(runtime.evaluate_expression(constants[argument]))
+
+      elif opcode == RAISE:
+        raise constants[argument]
+
+      else:
+        raise StatementError(f'Invalid opcode is used: {opcode}')
+
+  # declares imported containers in slots of current module scope
+  # containers are read from exports of dependency module (shared registry of runtime)
+  def import_containers(self, path: str, imports: tuple[Token, ...], slots: dict[str, int]):
+    runtime = self.runtime
+    stack = runtime.current_stack
+
+    dependency_path = runtime.resolver.resolve_absolute_path(runtime.current_module.path, path)
+    exports = runtime.get_imported_exports(path)
+
+    for import_item in imports:
+      # asterisk imports everything (other imports in list are not checked)
+      if is_token_of_type(import_item, MULTIPLICATION_TOKEN):
+        for container in exports.containers.values():
+          if not is_container_of_type(container, ReadableContainer):
+            raise ImportError(f'Symbol {import_item} is not exported by module {dependency_path}')
+
+          # imported containers are constant copies
+          stack.declare_container(ReadableContainer(container.name, container.read()), slots[container.name])
+
+        break
+
+      container = exports.get_container_by_name(import_item.code)
+      if not container:
+        raise ImportError(f'Symbol {import_item} is not exported by module {dependency_path}')
+
+      stack.declare_container(ReadableContainer(container.name, container.read()), slots[container.name])
+
+  # declares function of code in current stack
+  # returns function container
+  def make_function(self, code: Code) -> TransformContainer:
+    runtime = self.runtime
+    run = self.run
+
+    defaults = code.defaults
+
+    # layout of call frame (parameters order is checked when function is declared)
+    layout = FrameLayout(code.parameters, tuple(bool(default) for default in defaults), code.size)
+    layout.validate()
+
+    # capture containers of declarations used by function
+    environment = Environment(runtime.current_stack, code.captures)
+
+    # create function callable
+    def declared_function(*arguments: ReadableContainer):
+      # create scope for function with passed arguments
+      frame = layout.bind_arguments(arguments)
+
+      # remember origin stack where function was called
+      origin_stack = runtime.current_stack
+
+      # switch scope to stack of call (every call has its own scopes)
+      runtime.current_stack = environment.create_call_stack(frame)
+
+      try:
+        # evaluate default values of parameters that are not passed
+        for param_index in range(len(arguments), layout.amount):
+          layout.bind_default(frame, param_index, run(defaults[param_index]))
+
+        # execute function (scopes entered by code are dropped with stack of call)
+        returned_value = run(code)
+
+        if not isinstance(returned_value, ReadableContainer):
+          raise ExpressionError('Returned value is not readable')
+
+      # switch scope back to origin
+      finally:
+        runtime.current_stack = origin_stack
+
+      return returned_value
+
+    # create container
+    function_value: FunctionValue = FunctionValue(declared_function, environment)
+    function_container = TransformContainer(code.name, function_value)
+
+    # save function
+    runtime.current_stack.declare_container(function_container, code.slot)
+
+    # function can capture itself (recursion)
+    environment.resolve()
+
+    return function_container
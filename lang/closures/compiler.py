@@ -0,0 +1,726 @@
+from interpreter.interpreter import *
+from interpreter.operations import *
+
+# compiles AST nodes to Python closures
+# every node is analyzed once: dispatch by node class and operator type is done during compilation,
+# so the closure of node only evaluates its children closures and performs its operation
+# closures work with the state of runtime (Interpreter instance): current stack, exports and modules
+# closures behave the same as the corresponding methods of Interpreter (the same containers and errors)
+# containers are checked with isinstance directly, because closures are executed in hot loops
+class ClosureCompiler:
+  def __init__(self, runtime: Interpreter):
+    self.runtime = runtime
+
+  # compiles module AST
+  # returns list of statement closures
+  def compile_module(self, ast: BlockStatement, depth: int = BASE_DEPTH):
+    return [self.compile_statement(statement, depth) for statement in ast.statements]
+
+  # compile statements
+  # statement closure receives no arguments
+  # statement closure that transfers control returns completion (see Completion)
+  # depth of statement is known during compilation
+
+  # this methods delegates compilation based on statement type
+  def compile_statement(self, statement: Statement, depth: int):
+    if is_statement_of_class(statement, BlockStatement):
+      return self.compile_block_statement(statement, depth)
+    if is_statement_of_class(statement, VariableDeclarationStatement):
+      return self.compile_variable_declaration_statement(statement)
+    if is_statement_of_class(statement, ConstantDeclarationStatement):
+      return self.compile_constant_declaration_statement(statement)
+    if is_statement_of_class(statement, ConditionStatement):
+      return self.compile_condition_statement(statement, depth)
+    if is_statement_of_class(statement, WhileStatement):
+      return self.compile_while_statement(statement, depth)
+    if is_statement_of_class(statement, ForStatement):
+      return self.compile_for_statement(statement, depth)
+    if is_statement_of_class(statement, BreakStatement):
+      return self.compile_break_statement(statement)
+    if is_statement_of_class(statement, ContinueStatement):
+      return self.compile_continue_statement(statement)
+    if is_statement_of_class(statement, FunctionDeclarationStatement):
+      return self.compile_function_declaration_statement(statement, depth)
+    if is_statement_of_class(statement, ReturnStatement):
+      return self.compile_return_statement(statement)
+    if is_statement_of_class(statement, ImportStatement):
+      return self.compile_import_statement(statement, depth)
+    if is_statement_of_class(statement, ExportStatement):
+      return self.compile_export_statement(statement, depth)
+    if is_statement_of_class(statement, ExpressionStatement):
+      return self.compile_expression_statement(statement)
+
+    # statements that are not executed by Interpreter
+    return self.compile_error(StatementError(f'Invalid statement is used'))
+
+  def compile_block_statement(self, statement: BlockStatement, depth: int):
+    runtime = self.runtime
+    size = statement.size
+    # nested statements have increased depth
+    statements = [self.compile_statement(stat, depth + 1) for stat in statement.statements]
+
+    def execute_block_statement():
+      # block of statements has new scope
+      runtime.current_stack.add_scope(size)
+
+      try:
+        for execute in statements:
+          completion = execute()
+
+          # leave block with break, continue or return
+          if isinstance(completion, Completion):
+            return completion
+
+      # remove scope afterwards (even if block is left by return or break)
+      finally:
+        runtime.current_stack.remove_scope()
+
+    return execute_block_statement
+
+  def compile_variable_declaration_statement(self, statement: VariableDeclarationStatement):
+    runtime = self.runtime
+    name = statement.name.code
+    slot = statement.slot
+    initialization = self.compile_expression(statement.initialization) if statement.initialization else None
+
+    def execute_variable_declaration_statement():
+      # default variable value
+      value = None
+
+      if initialization:
+        container: ReadableContainer = initialization()
+        if not isinstance(container, ReadableContainer):
+          raise ValueError('Variable initializer is not readable')
+
+        value = container.read()
+
+      variable_container = TransformContainer(name, value)
+      runtime.current_stack.declare_container(variable_container, slot)
+
+      return variable_container
+
+    return execute_variable_declaration_statement
+
+  def compile_constant_declaration_statement(self, statement: ConstantDeclarationStatement):
+    runtime = self.runtime
+    name = statement.name.code
+    slot = statement.slot
+    initialization = self.compile_expression(statement.initialization)
+
+    def execute_constant_declaration_statement():
+      container: ReadableContainer = initialization()
+      if not isinstance(container, ReadableContainer):
+        raise ValueError('Constant initializer is not readable')
+
+      constant_container = ReadableContainer(name, container.read())
+      runtime.current_stack.declare_container(constant_container, slot)
+
+      return constant_container
+
+    return execute_constant_declaration_statement
+
+  def compile_condition_statement(self, statement: ConditionStatement, depth: int):
+    condition = self.compile_expression(statement.condition)
+    then_branch = self.compile_statement(statement.then_branch, depth + 1)
+    else_branch = self.compile_statement(statement.else_branch, depth + 1) if statement.else_branch else None
+
+    def execute_condition_statement():
+      container: ReadableContainer = condition()
+      if not isinstance(container, ReadableContainer):
+        raise ExpressionError('Condition is not a readable container')
+
+      if container.read():
+        return then_branch()
+
+      elif else_branch:
+        return else_branch()
+
+    return execute_condition_statement
+
+  def compile_while_statement(self, statement: WhileStatement, depth: int):
+    condition = self.compile_expression(statement.condition)
+    body = self.compile_statement(statement.body, depth + 1)
+
+    def execute_while_statement():
+      while True:
+        container: ReadableContainer = condition()
+        if not isinstance(container, ReadableContainer):
+          raise ExpressionError('Condition is not readable')
+
+        if not container.read():
+          break
+
+        completion = body()
+
+        # handle breaks and continues, pass return to function
+        if isinstance(completion, Completion):
+          if completion is BREAK:
+            break
+          if completion is not CONTINUE:
+            return completion
+
+    return execute_while_statement
+
+  def compile_for_statement(self, statement: ForStatement, depth: int):
+    runtime = self.runtime
+    size = statement.size
+    initializer = self.compile_statement(statement.initializer, depth + 1)
+    condition = self.compile_expression(statement.condition)
+    increment = self.compile_expression(statement.increment)
+    body = self.compile_statement(statement.body, depth + 1)
+
+    def execute_for_statement():
+      runtime.current_stack.add_scope(size)
+
+      try:
+        initializer()
+
+        while True:
+          container: ReadableContainer = condition()
+          if not isinstance(container, ReadableContainer):
+            raise ExpressionError('Condition is not readable')
+
+          if not container.read():
+            break
+
+          completion = body()
+
+          # handle breaks and continues, pass return to function
+          if isinstance(completion, Completion):
+            if completion is BREAK:
+              break
+            if completion is not CONTINUE:
+              return completion
+
+          increment()
+
+      # remove scope afterwards (even if loop is left by return)
+      finally:
+        runtime.current_stack.remove_scope()
+
+    return execute_for_statement
+
+  def compile_break_statement(self, statement: BreakStatement):
+    def execute_break_statement():
+      return BREAK # will be handled in loop
+
+    return execute_break_statement
+
+  def compile_continue_statement(self, statement: ContinueStatement):
+    def execute_continue_statement():
+      return CONTINUE # will be handled in loop
+
+    return execute_continue_statement
+
+  def compile_function_declaration_statement(self, statement: FunctionDeclarationStatement, depth: int):
+    runtime = self.runtime
+    name = statement.name.code
+    slot = statement.slot
+    params = statement.params
+    captures = statement.captures
+    # layout of call frame and default values are compiled once for all calls
+    layout = FrameLayout(tuple(param.name.code for param in params), tuple(bool(param.defaultValue) for param in params), statement.size)
+    defaults = [self.compile_expression(param.defaultValue) if param.defaultValue else None for param in params]
+    body = self.compile_statement(statement.body, depth + 1)
+
+    def execute_function_declaration_statement():
+      # parameters order is checked when function is declared
+      layout.validate()
+
+      # capture containers of declarations used by function
+      environment = Environment(runtime.current_stack, captures)
+
+      # create function callable
+      def declared_function(*arguments: ReadableContainer):
+        # create scope for function with passed arguments
+        frame = layout.bind_arguments(arguments)
+
+        # remember origin stack where function was called
+        origin_stack = runtime.current_stack
+
+        # switch scope to stack of call (every call has its own scopes)
+        runtime.current_stack = environment.create_call_stack(frame)
+
+        try:
+          # evaluate default values of parameters that are not passed
+          for param_index in range(len(arguments), layout.amount):
+            layout.bind_default(frame, param_index, defaults[param_index]())
+
+          # initialize returned value
+          returned_value = ReadableContainer('', None)
+
+          # execute function
+          completion = body()
+
+          if isinstance(completion, Completion):
+            # break and continue are not handled outside of loop
+            if completion.kind != RETURN_COMPLETION:
+              raise create_completion_exception(completion)
+
+            # read function return value
+            returned_value = completion.value
+
+            if not isinstance(returned_value, ReadableContainer):
+              raise ExpressionError('Returned value is not readable')
+
+        # switch scope back to origin (scopes of call are dropped)
+        finally:
+          runtime.current_stack = origin_stack
+
+        return returned_value
+
+      # create container
+      function_value: FunctionValue = FunctionValue(declared_function, environment)
+      function_container = TransformContainer(name, function_value)
+
+      # save function
+      runtime.current_stack.declare_container(function_container, slot)
+
+      # function can capture itself (recursion)
+      environment.resolve()
+
+      return function_container
+
+    return execute_function_declaration_statement
+
+  def compile_return_statement(self, statement: ReturnStatement):
+    returns = self.compile_expression(statement.returns)
+
+    def execute_return_statement():
+      return Completion(RETURN_COMPLETION, returns()) # will be handled by function
+
+    return execute_return_statement
+
+  def compile_import_statement(self, statement: ImportStatement, depth: int):
+    runtime = self.runtime
+
+    # imports are executed once per module, so Interpreter executes them
+    def execute_import_statement():
+      return runtime.execute_import_statement(statement, depth)
+
+    return execute_import_statement
+
+  def compile_export_statement(self, statement: ExportStatement, depth: int):
+    runtime = self.runtime
+    exports = self.compile_statement(statement.exports, depth)
+
+    def execute_export_statement():
+      # validate depth
+      if depth > 0:
+        raise ExpressionError('Exports are only allowed on global level')
+
+      # execute statement
+      container: ReadableContainer = exports()
+      if not isinstance(container, ReadableContainer):
+        raise ExpressionError('Invalid export statement')
+
+      # add container to exports
+      runtime.current_exports.add_container(container)
+
+    return execute_export_statement
+
+  def compile_expression_statement(self, statement: ExpressionStatement):
+    return self.compile_expression(statement.expression)
+
+  # compile expressions
+  # expression closure receives no arguments and returns container
+
+  # this methods delegates compilation based on expression type
+  def compile_expression(self, expression: Expression):
+    if is_expression_of_class(expression, ConstantExpression):
+      return self.compile_constant_expression(expression)
+    if is_expression_of_class(expression, NullExpression):
+      return self.compile_constant_value(None)
+    if is_expression_of_class(expression, LiteralExpression):
+      return self.compile_literal_expression(expression)
+    if is_expression_of_class(expression, IdentifierExpression):
+      return self.compile_identifier_expression(expression)
+    if is_expression_of_class(expression, UnaryOperationExpression):
+      return self.compile_unary_expression(expression)
+    if is_expression_of_class(expression, BinaryOperationExpression):
+      return self.compile_binary_expression(expression)
+    if is_expression_of_class(expression, GroupingExpression):
+      return self.compile_grouping_expression(expression)
+    if is_expression_of_class(expression, GroupingApplicationExpression):
+      return self.compile_grouping_application_expression(expression)
+    if is_expression_of_class(expression, AssociationExpression):
+      return self.compile_curly_braces_expression(expression)
+
+    return self.compile_error(SyntaxError('Invalid expression found'))
+
+  # unary expressions
+  def compile_unary_expression(self, expression: UnaryOperationExpression):
+    operator = expression.operator
+    operation = UNARY_OPERATIONS.get(operator.type)
+
+    if operation:
+      return self.compile_pure_unary_expression(expression, operation)
+    if is_token_of_type(operator, INCREMENT_TOKEN):
+      return self.compile_update_expression(expression, 1)
+    if is_token_of_type(operator, DECREMENT_TOKEN):
+      return self.compile_update_expression(expression, -1)
+
+    return self.compile_error(SyntaxError(f'Invalid operator used: {operator}'))
+
+  # compiles unary operation that does not change operand (see interpreter/operations.py)
+  def compile_pure_unary_expression(self, expression: UnaryOperationExpression, operation):
+    operator = expression.operator
+    operand = self.compile_expression(expression.operand)
+
+    def evaluate_unary_expression():
+      container: ReadableContainer = operand()
+      if not isinstance(container, ReadableContainer):
+        raise ExpressionError('Operand value is not readable')
+
+      return ReadableContainer('', operation(operator, container.read()))
+
+    return evaluate_unary_expression
+
+  # compiles increment (step is 1) and decrement (step is -1)
+  def compile_update_expression(self, expression: UnaryOperationExpression, step: int):
+    operator = expression.operator
+    operand = self.compile_expression(expression.operand)
+
+    def evaluate_update_expression():
+      container: TransformContainer = operand()
+      if not isinstance(container, TransformContainer):
+        raise ExpressionError('Operand value is not readable and writable')
+
+      value = container.read()
+
+      if is_value_of_type(value, NUMBER_TYPE):
+        container.write(value + step)
+        return container
+
+      raise TypeError(f'Unary operator {operator.code} with type {get_value_type(value)} is not supported')
+
+    return evaluate_update_expression
+
+  # binary expressions
+  def compile_binary_expression(self, expression: BinaryOperationExpression):
+    operator = expression.operator
+
+    if is_token_of_type(operator, ASSIGN_TOKEN):
+      return self.compile_assign_expression(expression)
+    if is_token_of_type(operator, DOT_TOKEN):
+      return self.compile_member_access_expression(expression)
+    if operator.type in BINARY_OPERATIONS:
+      return self.compile_pure_binary_expression(expression, BINARY_OPERATIONS[operator.type])
+    if operator.type in ASSIGNMENT_OPERATIONS:
+      return self.compile_operation_and_assign_expression(expression, ASSIGNMENT_OPERATIONS[operator.type])
+    if is_token_of_type(operator, OR_TOKEN):
+      return self.compile_or_expression(expression)
+    if is_token_of_type(operator, AND_TOKEN):
+      return self.compile_and_expression(expression)
+
+    return self.compile_error(SyntaxError(f'Invalid operator used: {operator}'))
+
+  def compile_assign_expression(self, expression: BinaryOperationExpression):
+    left = self.compile_expression(expression.left)
+    right = self.compile_expression(expression.right)
+
+    def evaluate_assign_expression():
+      left_container: WriteableContainer = left()
+      if not isinstance(left_container, WriteableContainer):
+        raise ExpressionError('Left value is not writable')
+
+      right_container: ReadableContainer = right()
+      if not isinstance(right_container, ReadableContainer):
+        raise ExpressionError('Right container is not readable')
+
+      left_container.write(right_container.read())
+
+      return left_container
+
+    return evaluate_assign_expression
+
+  def compile_member_access_expression(self, expression: BinaryOperationExpression):
+    left = self.compile_expression(expression.left)
+
+    if not is_expression_of_class(expression.right, IdentifierExpression):
+      invalid_member = self.compile_error(SyntaxError('Object member accessed by dot has to be a literal'))
+    else:
+      invalid_member = None
+      key = expression.right.name.code
+
+    def evaluate_member_access_expression():
+      obj_container: ReadableContainer = left()
+      if not isinstance(obj_container, ReadableContainer):
+        raise ExpressionError('Left value is not readable')
+
+      if invalid_member:
+        invalid_member()
+
+      value_container = obj_container.read().get(key)
+
+      if not isinstance(value_container, ReadableContainer):
+        raise ValueError('Accessed value is not readable')
+
+      return value_container
+
+    return evaluate_member_access_expression
+
+  # compiles binary operation that does not change operands (see interpreter/operations.py)
+  def compile_pure_binary_expression(self, expression: BinaryOperationExpression, operation):
+    operator = expression.operator
+    left = self.compile_expression(expression.left)
+    right = self.compile_expression(expression.right)
+
+    def evaluate_binary_expression():
+      left_container: ReadableContainer = left()
+      if not isinstance(left_container, ReadableContainer):
+        raise ExpressionError('Left value is not readable')
+
+      right_container: ReadableContainer = right()
+      if not isinstance(right_container, ReadableContainer):
+        raise ExpressionError('Right container is not readable')
+
+      return ReadableContainer('', operation(operator, left_container.read(), right_container.read()))
+
+    return evaluate_binary_expression
+
+  # compiles assignment with operation (+=, -= etc.)
+  def compile_operation_and_assign_expression(self, expression: BinaryOperationExpression, operation):
+    operator = expression.operator
+    left = self.compile_expression(expression.left)
+    right = self.compile_expression(expression.right)
+
+    def evaluate_operation_and_assign_expression():
+      left_container: TransformContainer = left()
+      if not isinstance(left_container, TransformContainer):
+        raise ExpressionError('Left value is not readable and writable')
+
+      right_container: ReadableContainer = right()
+      if not isinstance(right_container, ReadableContainer):
+        raise ExpressionError('Right container is not readable')
+
+      left_container.write(operation(operator, left_container.read(), right_container.read()))
+      return left_container
+
+    return evaluate_operation_and_assign_expression
+
+  def compile_or_expression(self, expression: BinaryOperationExpression):
+    left = self.compile_expression(expression.left)
+    right = self.compile_expression(expression.right)
+
+    def evaluate_or_expression():
+      left_container: ReadableContainer = left()
+      if not isinstance(left_container, ReadableContainer):
+        raise ExpressionError('Left value is not readable')
+
+      # if left is true - return and skip right
+      if left_container.read(): return left_container
+
+      right_container: ReadableContainer = right()
+      if not isinstance(right_container, ReadableContainer):
+        raise ExpressionError('Right container is not readable')
+
+      return right_container
+
+    return evaluate_or_expression
+
+  def compile_and_expression(self, expression: BinaryOperationExpression):
+    left = self.compile_expression(expression.left)
+    right = self.compile_expression(expression.right)
+
+    def evaluate_and_expression():
+      left_container: ReadableContainer = left()
+      if not isinstance(left_container, ReadableContainer):
+        raise ExpressionError('Left value is not readable')
+
+      # if left is false - return and skip right
+      if not left_container.read(): return left_container
+
+      right_container: ReadableContainer = right()
+      if not isinstance(right_container, ReadableContainer):
+        raise ExpressionError('Right container is not readable')
+
+      return right_container
+
+    return evaluate_and_expression
+
+  # grouping expressions
+  def compile_grouping_expression(self, expression: GroupingExpression):
+    if is_token_of_type(expression.operator, LEFT_PARENTHESES_TOKEN):
+      return self.compile_parentheses_expression(expression)
+    if is_token_of_type(expression.operator, LEFT_SQUARE_BRACKET_TOKEN):
+      return self.compile_square_brackets_expression(expression)
+
+    return self.compile_error(SyntaxError(f'Invalid operator used: {expression.operator}'))
+
+  def compile_parentheses_expression(self, expression: GroupingExpression):
+    # parentheses without application indicate tuple literal
+    elements = [self.compile_expression(exp) for exp in expression.expressions]
+
+    def evaluate_parentheses_expression():
+      return ReadableContainer('', tuple([element() for element in elements]))
+
+    return evaluate_parentheses_expression
+
+  def compile_square_brackets_expression(self, expression: GroupingExpression):
+    # square brackets without application indicate LIST literal
+    elements = [self.compile_expression(exp) for exp in expression.expressions]
+
+    def evaluate_square_brackets_expression():
+      return ReadableContainer('', [element() for element in elements])
+
+    return evaluate_square_brackets_expression
+
+  # grouping application expressions
+  def compile_grouping_application_expression(self, expression: GroupingApplicationExpression):
+    if is_token_of_type(expression.right.operator, LEFT_PARENTHESES_TOKEN):
+      return self.compile_parentheses_application_expression(expression)
+    if is_token_of_type(expression.right.operator, LEFT_SQUARE_BRACKET_TOKEN):
+      return self.compile_square_brackets_application_expression(expression)
+
+    return self.compile_error(SyntaxError(f'Invalid operator used by application: {expression.right.operator}'))
+
+  def compile_parentheses_application_expression(self, expression: GroupingApplicationExpression):
+    # parentheses in application is function call
+    left = self.compile_expression(expression.left)
+    # arguments are elements of tuple literal
+    arguments = [self.compile_expression(exp) for exp in expression.right.expressions]
+
+    def evaluate_parentheses_application_expression():
+      left_container: ReadableContainer = left()
+      if not isinstance(left_container, ReadableContainer):
+        raise ExpressionError('Left value is not readable')
+
+      left_value: FunctionValue = left_container.read()
+      if not is_value_of_type(left_value, FUNCTION_TYPE):
+        raise ValueError(f'{left_value} is not callable')
+
+      argument_containers = [argument() for argument in arguments]
+
+      for argument in argument_containers:
+        if not isinstance(argument, ReadableContainer):
+          raise ExpressionError('Argument is not readable')
+
+      # execute function
+      return_value: ReadableContainer = left_value.callable(*argument_containers)
+      if not isinstance(return_value, ReadableContainer):
+        raise ExpressionError('Returned value is not readable')
+
+      return ReadableContainer('', return_value.read())
+
+    return evaluate_parentheses_application_expression
+
+  def compile_square_brackets_application_expression(self, expression: GroupingApplicationExpression):
+    # square brackets in application is obj member access
+    left = self.compile_expression(expression.left)
+    right = self.compile_expression(expression.right)
+
+    def evaluate_square_brackets_application_expression():
+      left_container: ReadableContainer = left()
+      if not isinstance(left_container, ReadableContainer):
+        raise ExpressionError('Left value is not readable')
+
+      left_value = left_container.read()
+      if not is_value_of_type(left_value, OBJECT_TYPE):
+        raise SyntaxError('Cannot access members of non-object type')
+
+      right_value = right().read()
+      if not is_value_of_type(right_value, LIST_TYPE):
+        raise SyntaxError('Invalid member access')
+
+      if len(right_value) != 1:
+        raise SyntaxError('Member access has to be evaluated as a literal')
+
+      selector: ReadableContainer = right_value[0]
+      if not isinstance(selector, ReadableContainer):
+        raise ExpressionError('Member access expression is not readable')
+
+      selector_value = selector.read()
+      if not is_value_of_type(selector_value, *OBJECT_KEY_TYPES):
+        raise SyntaxError(f'Key expression has to be literal but {get_value_type(selector_value)} received')
+
+      return left_value[selector_value]
+
+    return evaluate_square_brackets_application_expression
+
+  # association expression
+  def compile_curly_braces_expression(self, expression: AssociationExpression):
+    runtime = self.runtime
+
+    # objects with other keys than identifiers are rare, so Interpreter evaluates them
+    if not all(is_expression_of_class(key, IdentifierExpression) for key, _ in expression.entries):
+      return lambda: runtime.evaluate_curly_braces_expression(expression)
+
+    # curly braces without application indicate OBJECT literal
+    entries = [(key.name.code, self.compile_expression(value)) for key, value in expression.entries]
+
+    def evaluate_curly_braces_expression():
+      obj = {}
+
+      for key, value in entries:
+        value_container = value()
+        if not isinstance(value_container, ReadableContainer):
+          raise ExpressionError('Value is not readable')
+
+        obj[key] = value_container
+
+      return ReadableContainer('', obj)
+
+    return evaluate_curly_braces_expression
+
+  # fundamental expressions
+  # address of identifier is resolved before execution (see ScopeResolver)
+  # slot is read directly (see Stack.get_container_by_address)
+  def compile_identifier_expression(self, expression: IdentifierExpression):
+    runtime = self.runtime
+    name = expression.name.code
+    depth, slot = expression.address
+    index = -1 - depth
+
+    def evaluate_identifier_expression():
+      container = runtime.current_stack.scopes[index].slots[slot]
+
+      # declaration is not executed yet
+      if container is None:
+        return runtime.current_stack.get_container_by_name(name)
+
+      return container
+
+    return evaluate_identifier_expression
+
+  def compile_literal_expression(self, expression: LiteralExpression):
+    if is_token_of_type(expression.value, STRING_TOKEN):
+      return self.compile_constant_value(expression.value.code)
+    if is_token_of_type(expression.value, NUMBER_TOKEN):
+      return self.compile_number_literal(expression)
+    if is_token_of_type(expression.value, map_keyword_to_token(TRUE_KEYWORD)):
+      return self.compile_constant_value(True)
+    if is_token_of_type(expression.value, map_keyword_to_token(FALSE_KEYWORD)):
+      return self.compile_constant_value(False)
+    if is_token_of_type(expression.value, map_keyword_to_token(NULL_KEYWORD)):
+      return self.compile_constant_value(None)
+
+    return self.compile_error(ExpressionError(f'Error during literal parsing: {expression.value}'))
+
+  # malformed number (for example "1.2.3") fails when it is evaluated, not when module is compiled
+  def compile_number_literal(self, expression: LiteralExpression):
+    try:
+      value = float(expression.value.code)
+    except Exception as error:
+      return self.compile_error(error)
+
+    return self.compile_constant_value(value)
+
+  def compile_constant_expression(self, expression: ConstantExpression):
+    return self.compile_constant_value(expression.value)
+
+  # readable container cannot be changed, so one container is returned by every evaluation
+  def compile_constant_value(self, value):
+    container = ReadableContainer('', value)
+
+    def evaluate_constant():
+      return container
+
+    return evaluate_constant
+
+  # errors of invalid nodes are raised when node is executed (as in Interpreter)
+  def compile_error(self, error: Exception):
+    def raise_error():
+      raise error
+
+    return raise_error
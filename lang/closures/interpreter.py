@@ -0,0 +1,20 @@
+from closures.compiler import *
+
+# interpreter that executes modules compiled to closures (see ClosureCompiler)
+# loading of modules, builtins, imports and exports are the same as in Interpreter
+class ClosureInterpreter(Interpreter):
+  def __init__(self, resolver: Resolver):
+    super().__init__(resolver)
+
+    # compiler of modules
+    self.compiler = ClosureCompiler(self)
+
+  # compiles statements of module root and executes them
+  # module is compiled right before execution
+  def execute_module_content(self, module: Module):
+    for execute in self.compiler.compile_module(module.content):
+      completion = execute()
+
+      # break, continue and return are not handled in module root
+      if isinstance(completion, Completion):
+        raise create_completion_exception(completion)
@@ -16,11 +16,21 @@ def get_config(directory: str = os.getcwd()):
   # load fields
   entry = get_config_entry(configuration_file, directory)
   aliases = get_config_aliases(configuration_file)
+  mmap = get_config_mmap(configuration_file)
+  workers = get_config_workers(configuration_file)
+  cache = get_config_cache(configuration_file)
+  optimize = get_config_optimize(configuration_file)
+  engine = get_config_engine(configuration_file)
 
   # return normalized config
   return ({
     CONFIGURATION_ENTRYPOINT_KEY: entry,
-    CONFIGURATION_ALIASES_KEY: aliases
+    CONFIGURATION_ALIASES_KEY: aliases,
+    CONFIGURATION_MMAP_KEY: mmap,
+    CONFIGURATION_WORKERS_KEY: workers,
+    CONFIGURATION_CACHE_KEY: cache,
+    CONFIGURATION_OPTIMIZE_KEY: optimize,
+    CONFIGURATION_ENGINE_KEY: engine
   })
 
 # load fields methods
@@ -59,4 +69,58 @@ def get_config_aliases(configuration_file: dict):
     raise ConfigError(f'"{CONFIGURATION_ALIASES_KEY}" has to be an object')  
   
   return aliases
-    
\ No newline at end of file
+
+def get_config_mmap(configuration_file: dict):
+  # module files are read by default
+  if CONFIGURATION_MMAP_KEY not in configuration_file:
+    return False
+
+  mmap = configuration_file[CONFIGURATION_MMAP_KEY]
+  if not isinstance(mmap, bool):
+    raise ConfigError(f'"{CONFIGURATION_MMAP_KEY}" has to be a boolean')
+
+  return mmap
+
+def get_config_workers(configuration_file: dict):
+  # modules are parsed in main process by default
+  if CONFIGURATION_WORKERS_KEY not in configuration_file:
+    return 0
+
+  workers = configuration_file[CONFIGURATION_WORKERS_KEY]
+  if not isinstance(workers, int) or isinstance(workers, bool) or workers < 0:
+    raise ConfigError(f'"{CONFIGURATION_WORKERS_KEY}" has to be a non-negative integer')
+
+  return workers
+
+def get_config_cache(configuration_file: dict):
+  # ASTs are not cached by default
+  if CONFIGURATION_CACHE_KEY not in configuration_file:
+    return False
+
+  cache = configuration_file[CONFIGURATION_CACHE_KEY]
+  if not isinstance(cache, bool):
+    raise ConfigError(f'"{CONFIGURATION_CACHE_KEY}" has to be a boolean')
+
+  return cache
+
+def get_config_optimize(configuration_file: dict):
+  # ASTs are optimized by default
+  if CONFIGURATION_OPTIMIZE_KEY not in configuration_file:
+    return True
+
+  optimize = configuration_file[CONFIGURATION_OPTIMIZE_KEY]
+  if not isinstance(optimize, bool):
+    raise ConfigError(f'"{CONFIGURATION_OPTIMIZE_KEY}" has to be a boolean')
+
+  return optimize
+
+def get_config_engine(configuration_file: dict):
+  # AST is walked by default
+  if CONFIGURATION_ENGINE_KEY not in configuration_file:
+    return TREE_ENGINE
+
+  engine = configuration_file[CONFIGURATION_ENGINE_KEY]
+  if engine not in ENGINES:
+    raise ConfigError(f'"{CONFIGURATION_ENGINE_KEY}" has to be one of: {", ".join(ENGINES)}')
+
+  return engine
@@ -3,3 +3,19 @@ CONFIGURATION_FILE_NAME = 'configuration.json'
 # configurations keys
 CONFIGURATION_ENTRYPOINT_KEY = 'entry'
 CONFIGURATION_ALIASES_KEY = 'aliases'
+CONFIGURATION_MMAP_KEY = 'mmap'
+CONFIGURATION_WORKERS_KEY = 'workers'
+CONFIGURATION_CACHE_KEY = 'cache'
+CONFIGURATION_OPTIMIZE_KEY = 'optimize'
+CONFIGURATION_ENGINE_KEY = 'engine'
+
+# execution engines
+# tree engine walks AST, closure engine compiles AST to closures,
+# bytecode engine compiles AST to bytecode executed by virtual machine,
+# unboxed engine walks AST and evaluates temporary values without containers
+TREE_ENGINE = 'tree'
+CLOSURE_ENGINE = 'closure'
+BYTECODE_ENGINE = 'bytecode'
+UNBOXED_ENGINE = 'unboxed'
+
+ENGINES = [TREE_ENGINE, CLOSURE_ENGINE, BYTECODE_ENGINE, UNBOXED_ENGINE]
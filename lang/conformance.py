@@ -0,0 +1,151 @@
+from config.config import get_config
+from config.constants import *
+
+from resolution.resolver import Resolver
+from lexer.lexer import Lexer
+from lexer.token import Token
+from parser.parser import Parser
+from parser.types.node import Node
+from optimizer.optimizer import Optimizer
+from engines import INTERPRETERS
+
+from builtin.builtin import *
+
+from contextlib import redirect_stdout
+import glob
+import io
+import os
+import re
+import sys
+
+# pattern of object addresses in representations of objects
+ADDRESS_PATTERN = r'0x[0-9a-f]+'
+
+# root directory of repository
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# conformance corpus (programs in subdirectories are imported modules)
+CORPUS_DIRECTORY = os.path.join(ROOT_DIRECTORY, 'conformance')
+
+# aliases of corpus programs
+CORPUS_ALIASES = {'std': os.path.join(ROOT_DIRECTORY, 'stdlib')}
+
+# executes program with engine
+# returns printed output and error (type and message) that stopped execution
+def run_program(entrypoint: str, engine: str, aliases: dict, optimize: bool):
+  output = io.StringIO()
+  error = None
+
+  try:
+    with redirect_stdout(output):
+      resolver = Resolver(aliases, optimizer=Optimizer() if optimize else None)
+      resolver.resolve_modules(os.path.abspath(entrypoint))
+
+      interpreter = INTERPRETERS[engine](resolver)
+      interpreter.load_modules(resolver.sort_modules())
+      interpreter.register_builtins(builtins)
+      interpreter.execute()
+  except Exception as exception:
+    error = f'{type(exception).__name__}: {exception}'
+
+  # addresses of objects differ between runs
+  return re.sub(ADDRESS_PATTERN, '0x', output.getvalue()), error and re.sub(ADDRESS_PATTERN, '0x', error)
+
+# returns tokens (type, code, row and column) of module read as text and memory-mapped
+def tokenize_module(path: str, trivia: bool, mapped: bool) -> list[tuple]:
+  if mapped:
+    with open(path, 'rb') as file:
+      tokens = list(Lexer(trivia).map(file))
+  else:
+    with open(path, encoding='utf-8') as file:
+      tokens = list(Lexer(trivia).tokenize(file.read()))
+
+  return [(token.type, token.code, token.position.row, token.position.column) for token in tokens]
+
+# compares tokens of text and memory-mapped lexing (with and without trivia)
+# both modes have to accept the same symbols (mmap configuration key does not change accepted programs)
+# returns amount of mismatches
+def check_lexer_modes(path: str) -> int:
+  mismatches = 0
+
+  for trivia in (True, False):
+    results = []
+
+    for mapped in (False, True):
+      try:
+        results.append(tokenize_module(path, trivia, mapped))
+      except Exception as exception:
+        results.append(f'{type(exception).__name__}: {exception}')
+
+    if results[0] != results[1]:
+      mismatches += 1
+      print(f'{path}: memory-mapped lexing (trivia {str(trivia).lower()}) differs from text lexing')
+
+  return mismatches
+
+# returns comparable structure of AST node (attributes of slots, tokens as type, code and position)
+def describe_node(node):
+  if isinstance(node, Token):
+    return (node.type, node.code, node.position.row, node.position.column)
+  if isinstance(node, (list, tuple)):
+    return [describe_node(item) for item in node]
+  if not isinstance(node, Node):
+    return node
+
+  names = [name for cls in type(node).__mro__ for name in getattr(cls, '__slots__', ())]
+  return (type(node).__name__, *[(name, describe_node(getattr(node, name))) for name in names])
+
+# compares ASTs of module parsed with and without trivia (trivia-free mode has to build the same AST)
+# returns amount of mismatches
+def check_parser_modes(path: str) -> int:
+  with open(path, encoding='utf-8') as file:
+    code = file.read()
+
+  results = []
+
+  for trivia in (True, False):
+    try:
+      results.append(describe_node(Parser(trivia).parse(Lexer(trivia).tokenize(code))))
+    except Exception as exception:
+      results.append(f'{type(exception).__name__}: {exception}')
+
+  if results[0] == results[1]:
+    return 0
+
+  print(f'{path}: trivia-free parsing differs from parsing with trivia')
+  return 1
+
+# runs programs under every engine (with and without optimization)
+# and compares results with tree engine without optimization
+# programs passed as arguments use aliases of configuration, conformance corpus is checked by default
+# returns amount of mismatches
+def check_conformance(programs: list[str]) -> int:
+  if programs:
+    aliases = get_config()[CONFIGURATION_ALIASES_KEY]
+  else:
+    programs = sorted(glob.glob(os.path.join(CORPUS_DIRECTORY, '*.br')))
+    aliases = CORPUS_ALIASES
+
+  mismatches = 0
+
+  for program in programs:
+    mismatches += check_lexer_modes(program)
+    mismatches += check_parser_modes(program)
+
+    expected = run_program(program, TREE_ENGINE, aliases, False)
+
+    for engine in ENGINES:
+      for optimize in (False, True):
+        if run_program(program, engine, aliases, optimize) == expected:
+          continue
+
+        mismatches += 1
+        print(f'{program}: {engine} engine (optimize {str(optimize).lower()}) differs from tree engine')
+
+    print(f'{program}: checked')
+
+  return mismatches
+
+# entry point of the conformance check
+if __name__ == '__main__':
+  sys.exit(1 if check_conformance(sys.argv[1:]) else 0)
@@ -0,0 +1,76 @@
+from config.config import get_config
+from config.constants import *
+
+from resolution.resolver import Resolver
+from optimizer.optimizer import Optimizer
+from scopes.resolver import *
+from bytecode.compiler import BytecodeCompiler
+from bytecode.disassembler import disassemble
+
+from builtin.builtin import *
+
+# returns names declared by export statements of module root
+# exports are not executed, so only declarations and identifiers are named (see Interpreter.get_imported_names)
+def get_exported_names(ast: BlockStatement) -> list[str]:
+  names = []
+
+  for statement in ast.statements:
+    if not is_statement_of_class(statement, ExportStatement):
+      continue
+
+    exports = statement.exports
+
+    if is_statement_of_class(exports, VariableDeclarationStatement, ConstantDeclarationStatement, FunctionDeclarationStatement):
+      names.append(exports.name.code)
+    elif is_statement_of_class(exports, ExpressionStatement) and is_expression_of_class(exports.expression, IdentifierExpression):
+      names.append(exports.expression.name.code)
+
+  return names
+
+# prints bytecode of every module of the application (in order of execution)
+# modules are optimized if optimization is enabled in configuration
+# identifiers are resolved before compilation, as engines do before execution
+def disassemble_modules():
+  config = get_config()
+
+  optimizer = Optimizer() if config[CONFIGURATION_OPTIMIZE_KEY] else None
+
+  # resolve modules dependency graph
+  resolver = Resolver(config[CONFIGURATION_ALIASES_KEY], config[CONFIGURATION_MMAP_KEY], config[CONFIGURATION_WORKERS_KEY], optimizer=optimizer)
+  resolver.resolve_modules(config[CONFIGURATION_ENTRYPOINT_KEY])
+
+  # exported names by absolute paths of disassembled modules
+  exported_names: dict[str, list[str]] = {}
+  current_path = None
+
+  # returns names declared by import statement of current module (imported module is disassembled already)
+  def get_imported_names(statement: ImportStatement) -> list[str]:
+    names = []
+
+    for import_item in statement.imports:
+      if is_token_of_type(import_item, MULTIPLICATION_TOKEN):
+        names.extend(exported_names[resolver.resolve_absolute_path(current_path, statement.path.code)])
+        break
+
+      names.append(import_item.code)
+
+    return names
+
+  builtins_scope = StaticScope()
+  for declaration in builtins:
+    builtins_scope.declare(declaration.name)
+
+  scope_resolver = ScopeResolver(builtins_scope, get_imported_names)
+  compiler = BytecodeCompiler()
+
+  for module in resolver.sort_modules():
+    current_path = module.path
+    scope_resolver.resolve_module(module.content)
+    exported_names[module.path] = get_exported_names(module.content)
+
+    print(disassemble(compiler.compile_module(module.content, module.path)))
+    print()
+
+# entry point of the disassembler
+if __name__ == '__main__':
+  disassemble_modules()
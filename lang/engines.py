@@ -0,0 +1,14 @@
+from config.constants import *
+
+from interpreter.interpreter import Interpreter
+from closures.interpreter import ClosureInterpreter
+from bytecode.interpreter import BytecodeInterpreter
+from unboxed.interpreter import UnboxedInterpreter
+
+# maps engine name to interpreter class (used by app and conformance check)
+INTERPRETERS = {
+  TREE_ENGINE: Interpreter,
+  CLOSURE_ENGINE: ClosureInterpreter,
+  BYTECODE_ENGINE: BytecodeInterpreter,
+  UNBOXED_ENGINE: UnboxedInterpreter,
+}
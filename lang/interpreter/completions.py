@@ -0,0 +1,32 @@
+from interpreter.containers import *
+from interpreter.exceptions import *
+
+# kinds of abrupt completions
+BREAK_COMPLETION = 'break'
+CONTINUE_COMPLETION = 'continue'
+RETURN_COMPLETION = 'return'
+
+# status record of statement that transfers control (break, continue and return)
+# statement returns completion instead of raising exception, blocks pass it to enclosing statement
+# loops handle break and continue, functions handle return
+# statements that complete normally do not return completion
+class Completion:
+  __slots__ = ('kind', 'value')
+
+  def __init__(self, kind: str, value: Container | None = None):
+    self.kind = kind
+    # returned container
+    self.value = value
+
+# break and continue have no values, so their completions are shared
+BREAK = Completion(BREAK_COMPLETION)
+CONTINUE = Completion(CONTINUE_COMPLETION)
+
+# returns exception of completion that is not handled (break outside of loop, return outside of function)
+def create_completion_exception(completion: Completion) -> Exception:
+  if completion.kind == BREAK_COMPLETION:
+    return BreakException()
+  if completion.kind == CONTINUE_COMPLETION:
+    return ContinueException()
+
+  return ReturnException(completion.value)
@@ -5,24 +5,18 @@ class Container:
     self.name = name
     self.value = value
 
+# subclasses are initialized by Container directly (containers are created for every parameter and temporary value)
 class ReadableContainer(Container):
-  def __init__(self, name, value):
-    super().__init__(name, value)
-
   def read(self):
     return self.value
 
 class WriteableContainer(Container):
-  def __init__(self, name, value):
-    super().__init__(name, value)
-
   def write(self, value):
     self.value = value
 
 # both readable and writeable
 class TransformContainer(ReadableContainer, WriteableContainer):
-  def __init__(self, name, value):
-    super().__init__(name, value)
+  pass
 
 
 def is_container_of_type(container, *types: Container):
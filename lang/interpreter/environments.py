@@ -0,0 +1,61 @@
+from interpreter.stack import *
+
+# environment of function (outer scope of every call of function)
+# function holds only containers (cells) of declarations that it uses instead of copy of stack where it is declared,
+# captures are names and addresses of these declarations relative to scope of function declaration (see ScopeResolver)
+# containers are shared with declaring scopes, so assignments are visible both ways
+# environment is shared by all calls of function, every call has its own activation (see create_call_stack),
+# so recursive and nested calls do not share scopes
+class Environment:
+  __slots__ = ('captures', 'slots', 'stack')
+
+  def __init__(self, stack: Stack, captures: tuple[tuple[str, int, int], ...]):
+    self.captures = captures
+    # slots of environment are indexes of captures
+    self.slots: list[Container | None] = [stack.scopes[-1 - depth].slots[slot] for name, depth, slot in captures]
+
+    # stack of declaration is kept only while some captured declaration is not executed yet
+    # (function can use declarations that follow it)
+    self.stack = stack.copy() if None in self.slots else None
+
+  # fills captured slots of declarations executed after function is declared
+  # stack of declaration is dropped when all slots are filled
+  # slots are only filled, so resolution started by any call gives the same slots
+  def resolve(self):
+    stack = self.stack
+
+    if stack is None:
+      return
+
+    slots = self.slots
+
+    for index, (name, depth, slot) in enumerate(self.captures):
+      if slots[index] is None:
+        slots[index] = stack.scopes[-1 - depth].slots[slot]
+
+    if None not in slots:
+      self.stack = None
+
+  # called when slot of identifier is empty (see Stack.get_container_by_address)
+  # name is searched in stack of declaration until captured declaration is executed, so shadowed declarations are found as before
+  # return None if container is not found
+  def get_container_by_name(self, name):
+    # stack is read once (it can be dropped by resolution)
+    stack = self.stack
+
+    if stack is not None:
+      self.resolve()
+
+    for index, capture in enumerate(self.captures):
+      if capture[0] == name and self.slots[index] is not None:
+        return self.slots[index]
+
+    if stack is not None:
+      return stack.get_container_by_name(name)
+
+    return None
+
+  # creates activation of function call: stack of environment and scope of parameters
+  # scopes entered by call are added to its activation only, so function can be called while it is executed
+  def create_call_stack(self, frame: Scope) -> Stack:
+    return Stack([self, frame])
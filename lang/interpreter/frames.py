@@ -0,0 +1,71 @@
+from interpreter.stack import *
+
+# layout of function call frame (scope of parameters) computed once when function is declared
+# slots of parameters are their positions (see ScopeResolver)
+# frame is created with passed arguments bound to slots, default values are bound by engine in order of parameters
+# (default values are evaluated in scope of parameters)
+class FrameLayout:
+  __slots__ = ('names', 'optional', 'size', 'amount', 'required', 'unique')
+
+  def __init__(self, names: tuple[str, ...], optional: tuple[bool, ...], size: int):
+    self.names = names
+    # flags of parameters with default values
+    self.optional = optional
+    # amount of slots in scope of parameters
+    self.size = size
+
+    self.amount = len(names)
+    self.required = self.amount - sum(optional)
+
+    # duplicated parameter fails when frame is created (as declaration of the same name in scope)
+    self.unique = len(set(names)) == self.amount
+
+  # required parameter cannot follow optional one
+  # checked when function is declared
+  def validate(self):
+    if any(not optional and any(self.optional[:index]) for index, optional in enumerate(self.optional)):
+      raise ParameterError('Required argument cannot follow optional one')
+
+  # checks passed arguments and creates scope of parameters with them
+  # parameters that are not passed have empty slots until their default values are bound
+  def bind_arguments(self, arguments: tuple) -> Scope:
+    # validate arguments containers
+    for argument in arguments:
+      if not isinstance(argument, ReadableContainer):
+        raise ExpressionError('Argument is not readable')
+
+    passed_arguments = len(arguments)
+
+    # check if arguments are less than enough
+    if passed_arguments < self.required:
+      raise ValueError(f'{self.required} parameters are required but {passed_arguments} are received')
+
+    # check if arguments are more than possible
+    if passed_arguments > self.amount:
+      raise ValueError(f'{self.amount} can be passed but {passed_arguments} are received')
+
+    if not self.unique:
+      scope = Scope(self.size)
+
+      for index in range(passed_arguments):
+        scope.declare_container(TransformContainer(self.names[index], arguments[index].read()), index)
+
+      return scope
+
+    # parameters are variables initialized by values of arguments
+    slots = [TransformContainer(name, argument.read()) for name, argument in zip(self.names, arguments)]
+
+    # slots and names of containers are filled without checks (names are unique)
+    scope = Scope.from_bound(dict(zip(self.names, slots)), slots)
+
+    if passed_arguments < self.size:
+      slots.extend([None] * (self.size - passed_arguments))
+
+    return scope
+
+  # binds default value of parameter by index
+  def bind_default(self, scope: Scope, index: int, value: ReadableContainer):
+    if not isinstance(value, ReadableContainer):
+      raise ExpressionError('Default value is not readable')
+
+    scope.declare_container(TransformContainer(self.names[index], value.read()), index)
@@ -2,8 +2,13 @@ from interpreter.stack import *
 from interpreter.exports import *
 from interpreter.exceptions import *
 from interpreter.types import *
+from interpreter.operations import *
+from interpreter.completions import *
+from interpreter.frames import *
+from interpreter.environments import *
 
 from resolution.resolver import *
+from scopes.resolver import *
 from resolution.module import *
 
 from builtin.declarations import *
@@ -64,9 +69,12 @@ class Interpreter:
 
   # Step 2) Register builtins 
   def register_builtins(self, builtins: list[BuiltInDeclaration]):
-    for builtin in builtins:
+    # every builtin has slot in builtins scope
+    self.builtins = Scope(len(builtins))
+
+    for slot in range(len(builtins)):
       # insert builtin in scope
-      self.execute_builtin_declaration(builtin)
+      self.execute_builtin_declaration(builtins[slot], slot)
 
     for stack in self.stacks:
       # insert builtins scope to all stacks
@@ -78,6 +86,9 @@ class Interpreter:
     # initialize pointer
     self.current_module_index = 0
 
+    # identifiers are resolved in scopes of builtins
+    scope_resolver = ScopeResolver(self.get_builtins_static_scope(), self.get_imported_names)
+
     # execute each module
     for module in self.modules:
       # define aliases
@@ -85,17 +96,29 @@ class Interpreter:
       self.current_stack = self.stacks[self.current_module_index]
       self.current_exports = self.exports[self.current_module_index]
 
+      # resolve identifiers of module before execution (modules it imports are executed already)
+      scope_resolver.resolve_module(module.content)
+
       # create initial scope for current stack
-      self.current_stack.add_scope()
+      self.current_stack.add_scope(module.content.size)
 
       # execute statements in module root
-      for statement in module.content.statements:
-        self.execute_statement(statement, BASE_DEPTH)
+      self.execute_module_content(module)
 
       # go to next module
       self.current_module_index += 1
 
+  # executes statements of module root
+  def execute_module_content(self, module: Module):
+    for statement in module.content.statements:
+      completion = self.execute_statement(statement, BASE_DEPTH)
+
+      # break, continue and return are not handled in module root
+      if isinstance(completion, Completion):
+        raise create_completion_exception(completion)
+
   # execute statements
+  # statement that transfers control returns completion (see Completion)
 
   def execute_statement(self, statement: Statement, depth: int):
     if is_statement_of_class(statement, BlockStatement):
@@ -112,7 +135,7 @@ class Interpreter:
       return self.execute_for_statement(statement, depth)
     if is_statement_of_class(statement, BreakStatement):
       return self.execute_break_statement(statement)
-    if is_statement_of_class(statement, ConditionStatement):
+    if is_statement_of_class(statement, ContinueStatement):
       return self.execute_continue_statement(statement)
     if is_statement_of_class(statement, FunctionDeclarationStatement):
       return self.execute_function_declaration_statement(statement, depth)
@@ -129,14 +152,20 @@ class Interpreter:
 
   def execute_block_statement(self, statement: BlockStatement, depth: int):
     # block of statements has new scope
-    self.current_stack.add_scope()
+    self.current_stack.add_scope(statement.size)
 
-    for stat in statement.statements:
-      # increment depth
-      self.execute_statement(stat, depth + 1)
+    try:
+      for stat in statement.statements:
+        # increment depth
+        completion = self.execute_statement(stat, depth + 1)
 
-    # remove scope afterwards
-    self.current_stack.remove_scope()
+        # leave block with break, continue or return
+        if isinstance(completion, Completion):
+          return completion
+
+    # remove scope afterwards (even if block is left by return or break)
+    finally:
+      self.current_stack.remove_scope()
 
   def execute_variable_declaration_statement(self, statement: VariableDeclarationStatement):
     # default variable value
@@ -148,7 +177,7 @@ class Interpreter:
         raise ValueError('Variable initializer is not readable')
 
     variable_container = TransformContainer(statement.name.code, initialization.read())
-    self.current_stack.add_container(variable_container)
+    self.current_stack.declare_container(variable_container, statement.slot)
 
     return variable_container
 
@@ -158,7 +187,7 @@ class Interpreter:
       raise ValueError('Constant initializer is not readable')
     
     constant_container = ReadableContainer(statement.name.code, initialization.read())
-    self.current_stack.add_container(constant_container)
+    self.current_stack.declare_container(constant_container, statement.slot)
 
     return constant_container
 
@@ -168,10 +197,10 @@ class Interpreter:
       raise ExpressionError('Condition is not a readable container')
 
     if condition.read():
-      self.execute_statement(statement.then_branch, depth + 1)
+      return self.execute_statement(statement.then_branch, depth + 1)
 
     elif statement.else_branch:
-      self.execute_statement(statement.else_branch, depth + 1)
+      return self.execute_statement(statement.else_branch, depth + 1)
 
   def execute_while_statement(self, statement: WhileStatement, depth: int):
     while True:
@@ -182,144 +211,114 @@ class Interpreter:
       if not condition.read():
         break
 
-      # handle breaks and continues
-      try:
-        self.execute_statement(statement.body, depth + 1)
+      completion = self.execute_statement(statement.body, depth + 1)
 
-      except BreakException:
-        break
-      except ContinueException:
-        continue
+      # handle breaks and continues, pass return to function
+      if isinstance(completion, Completion):
+        if completion is BREAK:
+          break
+        if completion is not CONTINUE:
+          return completion
 
   def execute_for_statement(self, statement: ForStatement, depth: int):
-    self.current_stack.add_scope()
+    self.current_stack.add_scope(statement.size)
 
-    self.execute_statement(statement.initializer, depth + 1)
+    try:
+      self.execute_statement(statement.initializer, depth + 1)
 
-    while True:
-      condition: ReadableContainer = self.evaluate_expression(statement.condition)
-      if not is_container_of_type(condition, ReadableContainer):
-        raise ExpressionError('Condition is not readable')
-      
-      if not condition.read():
-        break
+      while True:
+        condition: ReadableContainer = self.evaluate_expression(statement.condition)
+        if not is_container_of_type(condition, ReadableContainer):
+          raise ExpressionError('Condition is not readable')
+        
+        if not condition.read():
+          break
 
-      # handle breaks and continues
-      try:
-        self.execute_statement(statement.body, depth + 1)
+        completion = self.execute_statement(statement.body, depth + 1)
 
-      except BreakException:
-        break
-      except ContinueException:
-        self.evaluate_expression(statement.increment)
-        continue
+        # handle breaks and continues, pass return to function
+        if isinstance(completion, Completion):
+          if completion is BREAK:
+            break
+          if completion is not CONTINUE:
+            return completion
 
-      self.evaluate_expression(statement.increment)
+        self.evaluate_expression(statement.increment)
 
-    self.current_stack.remove_scope()
+    # remove scope afterwards (even if loop is left by return)
+    finally:
+      self.current_stack.remove_scope()
 
   def execute_break_statement(self, statement: BreakStatement):
-    raise BreakException() # will be handled in loop
+    return BREAK # will be handled in loop
   
   def execute_continue_statement(self, statement: ContinueStatement):
-    raise ContinueException() # will be handled in loop
+    return CONTINUE # will be handled in loop
 
   def execute_function_declaration_statement(self, statement: FunctionDeclarationStatement, depth: int):
-    # remember current stack as reference
-    closure = self.current_stack.copy()
+    params = statement.params
+
+    # layout of call frame (parameters order is checked when function is declared)
+    layout = FrameLayout(tuple(param.name.code for param in params), tuple(bool(param.defaultValue) for param in params), statement.size)
+    layout.validate()
+
+    # capture containers of declarations used by function
+    environment = Environment(self.current_stack, statement.captures)
 
     # create function callable
     def declared_function(*arguments: ReadableContainer):
-      # validate arguments containers
-      for argument in arguments:
-        if not is_container_of_type(argument, ReadableContainer):
-          raise ExpressionError('Argument is not readable')
+      # create scope for function with passed arguments
+      frame = layout.bind_arguments(arguments)
 
-      parameters_amount = len(statement.params)
-      required_parameters_amount = parameters_amount
-      passed_arguments = len(arguments)
+      # remember origin stack where function was called
+      origin_stack = self.current_stack
 
-      # flag that indicates that all next parameters are optional
-      optional_argument_found = False
+      # switch scope to stack of call (every call has its own scopes)
+      self.current_stack = environment.create_call_stack(frame)
 
-      # mention that parameters with default values are optional
-      for param in statement.params:
-        # prevent required parameter follow optional
-        if not param.defaultValue and optional_argument_found:
-          raise ParameterError('Required argument cannot follow optional one')
+      try:
+        # evaluate default values of parameters that are not passed
+        for param_index in range(len(arguments), layout.amount):
+          layout.bind_default(frame, param_index, self.evaluate_expression(params[param_index].defaultValue))
 
-        if param.defaultValue:  
-          required_parameters_amount -= 1
-          optional_argument_found = True
-        
-      # check if arguments are less than enough
-      if passed_arguments < required_parameters_amount:
-        raise ValueError(f'{required_parameters_amount} parameters are required but {passed_arguments} are received')
+        # initialize returned value
+        returned_value = self.create_readable_container(None)
 
-      # check if arguments are more than possible 
-      if passed_arguments > parameters_amount:
-        raise ValueError(f'{parameters_amount} can be passed but {passed_arguments} are received')
-      
-      # remember origin stack where function was called
-      origin_stack = self.current_stack
+        # execute function
+        completion = self.execute_statement(statement.body, depth + 1)
 
-      # switch scope to function closure
-      self.current_stack = closure
-      # create scope for function
-      self.current_stack.add_scope()
-
-      # initialize parameters
-      for param_index in range(len(statement.params)):
-        param = statement.params[param_index]
-
-        # compute argument value
-        if param_index < passed_arguments:
-          # assign passed value
-          value: ReadableContainer = arguments[param_index]
-        else:
-          # evaluate default value
-          value: ReadableContainer = self.evaluate_expression(statement.params[param_index].defaultValue)
-          if not is_container_of_type(value, ReadableContainer):
-            raise ExpressionError('Default value is not readable')
-          
-        # compose parameter as variable
-        parameter_container = TransformContainer(param.name.code, value.read())
-
-        # save variable
-        self.current_stack.add_container(parameter_container)
-
-      # initialize returned value
-      returned_value = self.create_readable_container(None)
-
-      # execute function
-      try:
-        self.execute_statement(statement.body, depth + 1)
-      except ReturnException as returned:
-        # read function return value
-        returned_value = returned.value
+        if isinstance(completion, Completion):
+          # break and continue are not handled outside of loop
+          if completion.kind != RETURN_COMPLETION:
+            raise create_completion_exception(completion)
 
-        if not is_container_of_type(returned_value, ReadableContainer):
-          raise ExpressionError('Returned value is not readable')
+          # read function return value
+          returned_value = completion.value
 
-      # clear function scope
-      self.current_stack.remove_scope()
-      # switch scope back to origin
-      self.current_stack = origin_stack
+          if not is_container_of_type(returned_value, ReadableContainer):
+            raise ExpressionError('Returned value is not readable')
+
+      # switch scope back to origin (scopes of call are dropped)
+      finally:
+        self.current_stack = origin_stack
 
       return returned_value
 
     # create container
-    function_value: FunctionValue = FunctionValue(declared_function, closure)
+    function_value: FunctionValue = FunctionValue(declared_function, environment)
     function_container = TransformContainer(statement.name.code, function_value)
 
     # save function
-    self.current_stack.add_container(function_container)
+    self.current_stack.declare_container(function_container, statement.slot)
+
+    # function can capture itself (recursion)
+    environment.resolve()
 
     return function_container
 
   def execute_return_statement(self, statement: ReturnStatement):
     returned_container = self.evaluate_expression(statement.returns)
-    raise ReturnException(returned_container) # will be caught by function
+    return Completion(RETURN_COMPLETION, returned_container) # will be handled by function
 
   def execute_import_statement(self, statement: ImportStatement, depth: int):
     # check statement depth
@@ -328,23 +327,15 @@ class Interpreter:
 
     # resolve dependency absolute path
     dependency_path = self.resolver.resolve_absolute_path(self.current_module.path, statement.path.code)
-
-    # search module by ABSOLUTE path among resolved modules
-    for index in range(len(self.modules)):
-      if self.modules[index].path == dependency_path:
-        dependency_module_index = index
-
-        break
-      
     # get dependency exports registry
-    exports = self.exports[dependency_module_index]
+    exports = self.get_imported_exports(statement.path.code)
 
     # load all imports
     for import_item in statement.imports:
       # check if asterisk import is used
       if is_token_of_type(import_item, MULTIPLICATION_TOKEN):
         # import everything
-        for container in exports.containers:
+        for container in exports.containers.values():
           # check container
           if not is_container_of_type(container, ReadableContainer):
             raise ImportError(f'Symbol {import_item} is not exported by module {dependency_path}')
@@ -352,7 +343,7 @@ class Interpreter:
           # make constant container copy
           readable = ReadableContainer(container.name, container.read())
           # add constant to stack
-          self.current_stack.add_container(readable)
+          self.current_stack.declare_container(readable, statement.slots[container.name])
 
         # do not check other imports if asterisk is in list
         break
@@ -365,7 +356,36 @@ class Interpreter:
       # make constant container copy
       readable = ReadableContainer(container.name, container.read())
       # add constant to stack
-      self.current_stack.add_container(readable)
+      self.current_stack.declare_container(readable, statement.slots[container.name])
+
+  # returns exports of module imported by path (as written in import statement) of current module
+  def get_imported_exports(self, path: str) -> Exports:
+    # resolve dependency absolute path
+    dependency_path = self.resolver.resolve_absolute_path(self.current_module.path, path)
+
+    # search module by ABSOLUTE path among resolved modules
+    for index in range(len(self.modules)):
+      if self.modules[index].path == dependency_path:
+        dependency_module_index = index
+
+        break
+      
+    return self.exports[dependency_module_index]
+
+  # returns names declared by import statement of current module (see ScopeResolver)
+  # imported module is executed already, so names of asterisk import are known
+  def get_imported_names(self, statement: ImportStatement) -> list[str]:
+    names = []
+
+    for import_item in statement.imports:
+      # asterisk import declares everything
+      if is_token_of_type(import_item, MULTIPLICATION_TOKEN):
+        names.extend(self.get_imported_exports(statement.path.code).containers)
+        break
+
+      names.append(import_item.code)
+
+    return names
 
   def execute_export_statement(self, statement: ExportStatement, depth: int):
     # validate depth
@@ -387,6 +407,8 @@ class Interpreter:
   
   # this methods delegates evaluation based on expression type
   def evaluate_expression(self, expression: Expression):
+    if is_expression_of_class(expression, ConstantExpression):
+      return self.evaluate_constant_expression(expression)
     if is_expression_of_class(expression, NullExpression):
       return self.create_readable_container(None)
     if is_expression_of_class(expression, LiteralExpression):
@@ -424,19 +446,14 @@ class Interpreter:
     if not is_container_of_type(container, ReadableContainer):
       raise ExpressionError('Operand value is not readable')
 
-    return self.create_readable_container(not container.read())
+    return self.create_readable_container(compute_not(expression.operator, container.read()))
   
   def evaluate_bit_not_expression(self, expression: UnaryOperationExpression):
     container: ReadableContainer = self.evaluate_expression(expression.operand)
     if not is_container_of_type(container, ReadableContainer):
       raise ExpressionError('Operand value is not readable')
-    
-    value = container.read()
 
-    if self.is_value_of_type(value, NUMBER_TYPE):
-      return self.create_readable_container(~round(value))
-
-    raise TypeError(f'Unary operator {expression.operator.code} with type {get_value_type(value)} is not supported')
+    return self.create_readable_container(compute_bit_not(expression.operator, container.read()))
 
   def evaluate_increment_expression(self, expression: UnaryOperationExpression):
     container: TransformContainer = self.evaluate_expression(expression.operand)
@@ -445,7 +462,7 @@ class Interpreter:
     
     value = container.read()
 
-    if self.is_value_of_type(value, NUMBER_TYPE):
+    if is_value_of_type(value, NUMBER_TYPE):
       container.write(value + 1)
       return container
     
@@ -458,7 +475,7 @@ class Interpreter:
     
     value = container.read()
 
-    if self.is_value_of_type(value, NUMBER_TYPE):
+    if is_value_of_type(value, NUMBER_TYPE):
       container.write(value - 1)
       return container
     
@@ -575,18 +592,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-
-    # handle number addition
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(left_value + right_value)
-    
-    # handle string concatenation
-    if self.is_value_of_type(left_value, STRING_TYPE) and self.is_value_of_type(right_value, STRING_TYPE):
-      return self.create_readable_container(left_value + right_value)
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_addition(expression.operator, left.read(), right.read()))
 
   def evaluate_subtraction_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -597,14 +603,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-
-    # handle number subtraction
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(left_value - right_value)
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_subtraction(expression.operator, left.read(), right.read()))
 
   def evaluate_multiplication_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -615,14 +614,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-
-    # handle number multiplication
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(left_value * right_value)
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_multiplication(expression.operator, left.read(), right.read()))
 
   def evaluate_division_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -633,17 +625,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-
-    # handle number division
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      if right_value == 0:
-        raise ValueError('Division by zero is not allowed')
-      
-      return self.create_readable_container(left_value / right_value)
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_division(expression.operator, left.read(), right.read()))
 
   def evaluate_exponential_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -654,17 +636,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-
-    # handle exponential
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      if left_value < 0:
-        raise ValueError('Exponential with negative base is not allowed')
-      
-      return self.create_readable_container(left_value ** right_value)
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_exponential(expression.operator, left.read(), right.read()))
 
   def evaluate_remainder_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -675,14 +647,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-
-    # handle remainder
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(left_value % right_value)
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_remainder(expression.operator, left.read(), right.read()))
 
   def evaluate_bit_and_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -693,13 +658,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(round(left_value) & round(right_value))
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_bit_and(expression.operator, left.read(), right.read()))
 
   def evaluate_bit_or_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -710,13 +669,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(round(left_value) | round(right_value))
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_bit_or(expression.operator, left.read(), right.read()))
 
   def evaluate_bit_xor_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -727,13 +680,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(round(left_value) ^ round(right_value))
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_bit_xor(expression.operator, left.read(), right.read()))
 
   def evaluate_left_shift_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -744,13 +691,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(round(left_value) << round(right_value))
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_left_shift(expression.operator, left.read(), right.read()))
 
   def evaluate_right_shift_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -761,13 +702,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(round(left_value) >> round(right_value))
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_right_shift(expression.operator, left.read(), right.read()))
 
   def evaluate_addition_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
@@ -778,20 +713,8 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    # handle number addition
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      left.write(left_value + right_value)
-      return left
-    
-    # handle string concatenation
-    if self.is_value_of_type(left_value, STRING_TYPE) and self.is_value_of_type(right_value, STRING_TYPE):
-      left.write(left_value + right_value)
-      return left
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    left.write(compute_addition(expression.operator, left.read(), right.read()))
+    return left
 
   def evaluate_subtraction_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
@@ -802,15 +725,9 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      left.write(left_value - right_value)
-      return left
+    left.write(compute_subtraction(expression.operator, left.read(), right.read()))
+    return left
 
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
   def evaluate_multiplication_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, TransformContainer):
@@ -820,15 +737,9 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      left.write(left_value * right_value)
-      return left
+    left.write(compute_multiplication(expression.operator, left.read(), right.read()))
+    return left
 
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
   def evaluate_division_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, TransformContainer):
@@ -838,18 +749,9 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      if right_value == 0:
-        raise ValueError('Division by zero is not allowed')
-    
-      left.write(left_value / right_value)
-      return left
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
+    left.write(compute_division(expression.operator, left.read(), right.read()))
+    return left
+
   def evaluate_exponential_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, TransformContainer):
@@ -859,18 +761,9 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      if left_value < 0:
-        raise ValueError('Exponential with negative base is not allowed')
-    
-      left.write(left_value ** right_value)
-      return left
+    left.write(compute_exponential(expression.operator, left.read(), right.read()))
+    return left
 
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
   def evaluate_remainder_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, TransformContainer):
@@ -880,15 +773,9 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      left.write(left_value % right_value)
-      return left
+    left.write(compute_remainder(expression.operator, left.read(), right.read()))
+    return left
 
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
   def evaluate_bit_and_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, TransformContainer):
@@ -898,15 +785,9 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      left.write(round(left_value) & round(right_value))
-      return left
+    left.write(compute_bit_and(expression.operator, left.read(), right.read()))
+    return left
 
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
   def evaluate_bit_or_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, TransformContainer):
@@ -916,15 +797,9 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      left.write(round(left_value) | round(right_value))
-      return left
+    left.write(compute_bit_or(expression.operator, left.read(), right.read()))
+    return left
 
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
   def evaluate_bit_xor_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, TransformContainer):
@@ -934,15 +809,9 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
+    left.write(compute_bit_xor(expression.operator, left.read(), right.read()))
+    return left
 
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      left.write(round(left_value) ^ round(right_value))
-      return left
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
   def evaluate_left_shift_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, TransformContainer):
@@ -952,15 +821,9 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
+    left.write(compute_left_shift(expression.operator, left.read(), right.read()))
+    return left
 
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      left.write(round(left_value) << round(right_value))
-      return left
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
   def evaluate_right_shift_and_assign_expression(self, expression: BinaryOperationExpression):
     left: TransformContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, TransformContainer):
@@ -970,14 +833,8 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      left.write(round(left_value) >> round(right_value))
-      return left
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    left.write(compute_right_shift(expression.operator, left.read(), right.read()))
+    return left
 
   def evaluate_or_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -1016,7 +873,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    return self.create_readable_container(left.read() == right.read())
+    return self.create_readable_container(compute_equal(expression.operator, left.read(), right.read()))
   
   def evaluate_not_equal_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -1027,7 +884,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    return self.create_readable_container(left.read() != right.read())
+    return self.create_readable_container(compute_not_equal(expression.operator, left.read(), right.read()))
   
   def evaluate_greater_than_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
@@ -1038,14 +895,8 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(left_value > right_value)
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
+    return self.create_readable_container(compute_greater_than(expression.operator, left.read(), right.read()))
+
   def evaluate_less_than_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, ReadableContainer):
@@ -1055,14 +906,8 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(left_value < right_value)
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
+    return self.create_readable_container(compute_less_than(expression.operator, left.read(), right.read()))
+
   def evaluate_greater_than_or_equal_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, ReadableContainer):
@@ -1072,14 +917,8 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(left_value >= right_value)
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
-  
+    return self.create_readable_container(compute_greater_than_or_equal(expression.operator, left.read(), right.read()))
+
   def evaluate_less_than_or_equal_expression(self, expression: BinaryOperationExpression):
     left: ReadableContainer = self.evaluate_expression(expression.left)
     if not is_container_of_type(left, ReadableContainer):
@@ -1089,13 +928,7 @@ class Interpreter:
     if not is_container_of_type(right, ReadableContainer):
       raise ExpressionError('Right container is not readable')
     
-    left_value = left.read()
-    right_value = right.read()
-    
-    if self.is_value_of_type(left_value, NUMBER_TYPE) and self.is_value_of_type(right_value, NUMBER_TYPE):
-      return self.create_readable_container(left_value <= right_value)
-    
-    raise TypeError(f'Binary operation {expression.operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+    return self.create_readable_container(compute_less_than_or_equal(expression.operator, left.read(), right.read()))
 
   # grouping expressions
   def evaluate_grouping_expression(self, expression: GroupingExpression):
@@ -1143,7 +976,7 @@ class Interpreter:
       raise ExpressionError('Left value is not readable')
     
     left_value: FunctionValue = left.read()
-    if not self.is_value_of_type(left_value, FUNCTION_TYPE):
+    if not is_value_of_type(left_value, FUNCTION_TYPE):
       raise ValueError(f'{left_value} is not callable')
     
     right: ReadableContainer = self.evaluate_expression(expression.right)
@@ -1151,7 +984,7 @@ class Interpreter:
       raise ExpressionError('Right value is not readable')
     
     right_value: list[ReadableContainer] = right.read()
-    if not self.is_value_of_type(right_value, TUPLE_TYPE):
+    if not is_value_of_type(right_value, TUPLE_TYPE):
       raise SyntaxError('Invalid composition')
     
     for argument in list(right_value):
@@ -1173,7 +1006,7 @@ class Interpreter:
       raise ExpressionError('Left value is not readable')
     
     left_value = left.read()
-    if not self.is_value_of_type(left_value, OBJECT_TYPE):
+    if not is_value_of_type(left_value, OBJECT_TYPE):
       raise SyntaxError('Cannot access members of non-object type')
     
     right: ReadableContainer = self.evaluate_expression(expression.right)
@@ -1181,7 +1014,7 @@ class Interpreter:
       raise ExpressionError('Right value is not readable')
     
     right_value = right.read()
-    if not self.is_value_of_type(right_value, LIST_TYPE):
+    if not is_value_of_type(right_value, LIST_TYPE):
       raise SyntaxError('Invalid member access')
     
     if len(right_value) != 1:
@@ -1192,7 +1025,7 @@ class Interpreter:
       raise ExpressionError('Member access expression is not readable')
     
     selector_value = selector.read()
-    if not self.is_value_of_type(selector_value, *OBJECT_KEY_TYPES):
+    if not is_value_of_type(selector_value, *OBJECT_KEY_TYPES):
       raise SyntaxError(f'Key expression has to be literal but {get_value_type(selector_value)} received')
     
     return left_value[selector_value]
@@ -1214,7 +1047,7 @@ class Interpreter:
       # handle literal keys
       elif is_expression_of_class(key, LiteralExpression):
         # validate key type
-        if not self.is_value_of_type(key.value, OBJECT_KEY_TYPES):
+        if not is_value_of_type(key.value, *OBJECT_KEY_TYPES):
           raise SyntaxError('Invalid key expression')
         
         parsed_key: Token = key.value
@@ -1240,7 +1073,7 @@ class Interpreter:
         
         # validate key type
         first_container_value = first_container.read()
-        if not self.is_value_of_type(first_container_value, *OBJECT_KEY_TYPES):
+        if not is_value_of_type(first_container_value, *OBJECT_KEY_TYPES):
           raise SyntaxError(f'Key expression has to be literal but {get_value_type(first_container_value)} received')
 
         parsed_key: Token = first_container_value
@@ -1256,37 +1089,46 @@ class Interpreter:
     return self.create_readable_container(obj)
 
   # fundamental expressions
+  # address of identifier is resolved before execution (see ScopeResolver)
   def evaluate_identifier_expression(self, expression: IdentifierExpression):
-    return self.current_stack.get_container_by_name(expression.name.code)
+    return self.current_stack.get_container_by_address(expression.name.code, *expression.address)
 
   def evaluate_literal_expression(self, expression: LiteralExpression):
+    return self.create_readable_container(self.get_literal_value(expression))
+
+  # returns value of literal token
+  def get_literal_value(self, expression: LiteralExpression):
     if is_token_of_type(expression.value, STRING_TOKEN):
-      return self.create_readable_container(expression.value.code)
+      return expression.value.code
     if is_token_of_type(expression.value, NUMBER_TOKEN):
-      return self.create_readable_container(float(expression.value.code))
+      return float(expression.value.code)
     if is_token_of_type(expression.value, map_keyword_to_token(TRUE_KEYWORD)):
-      return self.create_readable_container(True)
+      return True
     if is_token_of_type(expression.value, map_keyword_to_token(FALSE_KEYWORD)):
-      return self.create_readable_container(False)
+      return False
     if is_token_of_type(expression.value, map_keyword_to_token(NULL_KEYWORD)):
-      return self.create_readable_container(None)
+      return None
     
     raise ExpressionError(f'Error during literal parsing: {expression.value}')
 
+  # value of constant is computed by Optimizer
+  def evaluate_constant_expression(self, expression: ConstantExpression):
+    return self.create_readable_container(expression.value)
+
   # builtin declarations
-  def execute_builtin_declaration(self, declaration: BuiltInDeclaration):
+  def execute_builtin_declaration(self, declaration: BuiltInDeclaration, slot: int):
     if is_declaration_of_type(declaration, ConstantBuiltInDeclaration):
-      return self.execute_builtin_constant_declaration(declaration)
+      return self.execute_builtin_constant_declaration(declaration, slot)
     if is_declaration_of_type(declaration, FunctionBuiltInDeclaration):
-      return self.execute_builtin_function_declaration(declaration)
+      return self.execute_builtin_function_declaration(declaration, slot)
     
     raise ExpressionError('Builtin declaration of invalid type is executed')
 
-  def execute_builtin_constant_declaration(self, declaration: ConstantBuiltInDeclaration):
+  def execute_builtin_constant_declaration(self, declaration: ConstantBuiltInDeclaration, slot: int):
     container = ReadableContainer(declaration.name, declaration.value)
-    self.builtins.add_container(container)
+    self.builtins.declare_container(container, slot)
 
-  def execute_builtin_function_declaration(self, declaration: FunctionBuiltInDeclaration):
+  def execute_builtin_function_declaration(self, declaration: FunctionBuiltInDeclaration, slot: int):
     def declared_function(*arguments):
       if len(arguments) != declaration.arguments:
         raise ValueError(f'{len(declaration.arguments)} arguments required but {len(arguments)} received')
@@ -1306,13 +1148,17 @@ class Interpreter:
     function_value = FunctionValue(declared_function, None)
     function_container = ReadableContainer(declaration.name, function_value)
 
-    self.builtins.add_container(function_container)
+    self.builtins.declare_container(function_container, slot)
+
+  # returns static scope of builtins (every builtin is declared in its slot)
+  def get_builtins_static_scope(self) -> StaticScope:
+    scope = StaticScope()
+
+    for container in self.builtins.slots:
+      scope.declare(container.name)
+
+    return scope
 
   # creates anonymous readable containers for expression evaluations
   def create_readable_container(self, value):
     return ReadableContainer('', value)
-  
-  # check data types of values
-  def is_value_of_type(self, value, *types: str):
-    return get_value_type(value) in types
-  
\ No newline at end of file
@@ -0,0 +1,176 @@
+from interpreter.exceptions import *
+from interpreter.types import *
+
+from lexer.token import *
+
+from shared.tokens import *
+
+# operations on values (without containers)
+# used by Interpreter to evaluate expressions and by Optimizer to fold constant expressions
+# so both have the same semantics
+# every operation receives operator token (used in error messages) and operand values
+
+# unary operations
+def compute_not(operator: Token, value):
+  return not value
+
+def compute_bit_not(operator: Token, value):
+  if is_value_of_type(value, NUMBER_TYPE):
+    return ~round(value)
+
+  raise TypeError(f'Unary operator {operator.code} with type {get_value_type(value)} is not supported')
+
+# binary operations
+def compute_addition(operator: Token, left_value, right_value):
+  # handle number addition
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return left_value + right_value
+
+  # handle string concatenation
+  if is_value_of_type(left_value, STRING_TYPE) and is_value_of_type(right_value, STRING_TYPE):
+    return left_value + right_value
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_subtraction(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return left_value - right_value
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_multiplication(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return left_value * right_value
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_division(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    if right_value == 0:
+      raise ValueError('Division by zero is not allowed')
+
+    return left_value / right_value
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_exponential(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    if left_value < 0:
+      raise ValueError('Exponential with negative base is not allowed')
+
+    return left_value ** right_value
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_remainder(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return left_value % right_value
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_bit_and(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return round(left_value) & round(right_value)
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_bit_or(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return round(left_value) | round(right_value)
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_bit_xor(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return round(left_value) ^ round(right_value)
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_left_shift(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return round(left_value) << round(right_value)
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_right_shift(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return round(left_value) >> round(right_value)
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_equal(operator: Token, left_value, right_value):
+  return left_value == right_value
+
+def compute_not_equal(operator: Token, left_value, right_value):
+  return left_value != right_value
+
+def compute_greater_than(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return left_value > right_value
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_less_than(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return left_value < right_value
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_greater_than_or_equal(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return left_value >= right_value
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+def compute_less_than_or_equal(operator: Token, left_value, right_value):
+  if is_value_of_type(left_value, NUMBER_TYPE) and is_value_of_type(right_value, NUMBER_TYPE):
+    return left_value <= right_value
+
+  raise_binary_operation_error(operator, left_value, right_value)
+
+# raises error of binary operation with unsupported operand types
+def raise_binary_operation_error(operator: Token, left_value, right_value):
+  raise TypeError(f'Binary operation {operator.code} with types {get_value_type(left_value)} and {get_value_type(right_value)} is not supported')
+
+# maps pure unary operator token type to its operation
+# operations do not change operand, so they can be computed ahead of time
+UNARY_OPERATIONS = {
+  NOT_TOKEN[0]: compute_not,
+  BIT_NOT_TOKEN[0]: compute_bit_not,
+}
+
+# maps pure binary operator token type to its operation
+BINARY_OPERATIONS = {
+  PLUS_TOKEN[0]: compute_addition,
+  MINUS_TOKEN[0]: compute_subtraction,
+  MULTIPLICATION_TOKEN[0]: compute_multiplication,
+  DIVISION_TOKEN[0]: compute_division,
+  EXPONENTIAL_TOKEN[0]: compute_exponential,
+  REMAINDER_TOKEN[0]: compute_remainder,
+  BIT_AND_TOKEN[0]: compute_bit_and,
+  BIT_OR_TOKEN[0]: compute_bit_or,
+  BIT_XOR_TOKEN[0]: compute_bit_xor,
+  LEFT_SHIFT_TOKEN[0]: compute_left_shift,
+  RIGHT_SHIFT_TOKEN[0]: compute_right_shift,
+  EQUAL_TOKEN[0]: compute_equal,
+  NOT_EQUAL_TOKEN[0]: compute_not_equal,
+  GREATER_THAN_TOKEN[0]: compute_greater_than,
+  LESS_THAN_TOKEN[0]: compute_less_than,
+  GREATER_THAN_OR_EQUAL_TOKEN[0]: compute_greater_than_or_equal,
+  LESS_THAN_OR_EQUAL_TOKEN[0]: compute_less_than_or_equal,
+}
+
+# maps assignment operator token type to binary operation that computes assigned value
+ASSIGNMENT_OPERATIONS = {
+  PLUS_ASSIGN_TOKEN[0]: compute_addition,
+  MINUS_ASSIGN_TOKEN[0]: compute_subtraction,
+  MULTIPLICATION_ASSIGN_TOKEN[0]: compute_multiplication,
+  DIVISION_ASSIGN_TOKEN[0]: compute_division,
+  EXPONENTIAL_ASSIGN_TOKEN[0]: compute_exponential,
+  REMAINDER_ASSIGN_TOKEN[0]: compute_remainder,
+  BIT_AND_ASSIGN_TOKEN[0]: compute_bit_and,
+  BIT_OR_ASSIGN_TOKEN[0]: compute_bit_or,
+  BIT_XOR_ASSIGN_TOKEN[0]: compute_bit_xor,
+  LEFT_SHIFT_ASSIGN_TOKEN[0]: compute_left_shift,
+  RIGHT_SHIFT_ASSIGN_TOKEN[0]: compute_right_shift,
+}
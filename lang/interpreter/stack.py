@@ -4,51 +4,63 @@ from interpreter.exceptions import *
 # defines the Scope (slice of stack)
 # Scope stores containers with values
 # Provides methods to add, get and delete containers
+# declarations are also stored in slots that are assigned before execution (see ScopeResolver),
+# so identifiers are accessed by index instead of searching by name
 class Scope:
-  def __init__(self):
-    self.containers: list[Container] = []
+  def __init__(self, size: int = 0):
+    # maps names to containers (in order of declaration)
+    self.containers: dict[str, Container] = {}
+    # slot is empty until its declaration is executed
+    self.slots: list[Container | None] = [None] * size
+
+  # creates scope of containers that are already bound to slots (used for arguments of calls)
+  # names of containers have to be unique, they are not checked
+  @classmethod
+  def from_bound(cls, containers: dict[str, Container], slots: list[Container | None]) -> 'Scope':
+    scope = cls.__new__(cls)
+    scope.containers = containers
+    scope.slots = slots
+
+    return scope
 
   def add_container(self, container: Container):
     if self.is_container_added(container.name):
       raise NameError(f'The symbol "{container.name}" is already declared')
     
-    self.containers.append(container)
+    self.containers[container.name] = container
+
+  # adds container of declaration to its slot
+  def declare_container(self, container: Container, slot: int):
+    self.add_container(container)
+    self.slots[slot] = container
 
   def is_container_added(self, name: str):
-    return bool(self.get_container_by_name(name))
+    return name in self.containers
 
   # return None is container is not found
   def get_container_by_name(self, name):
-    for container in self.containers:
-      if container.name == name:
-        return container
-      
-    return None
+    return self.containers.get(name)
 
   # returns boolean indicating if container was deleted
   def remove_container_by_name(self, name):
-    rest_containers = []
-    is_deleted = False
+    container = self.containers.pop(name, None)
 
-    for container in self.containers:
-      if container.name != name:
-        rest_containers.append(container)
-      else:
-        is_deleted = True
-        break
+    if container is None:
+      return False
 
-    self.containers = rest_containers
-    return is_deleted
+    # slot of removed declaration is empty
+    self.slots = [None if slot is container else slot for slot in self.slots]
+    return True
 
 
 # defines the environment Stack 
 # contains list of Scopes
 class Stack:
-  def __init__(self):
-    self.scopes: list[Scope] = []
+  def __init__(self, scopes: list[Scope] | None = None):
+    self.scopes: list[Scope] = [] if scopes is None else scopes
 
-  def add_scope(self):
-    self.scopes.append(Scope())
+  def add_scope(self, size: int = 0):
+    self.scopes.append(Scope(size))
 
   def insert_scope(self, scope: Scope):
     self.scopes.append(scope)
@@ -63,15 +75,29 @@ class Stack:
 
     self.scopes[-1].add_container(container)
 
+  # adds container of declaration to slot of last scope
+  def declare_container(self, container: Container, slot: int):
+    if not len(self.scopes):
+      raise StackError('No scopes available!')
+
+    self.scopes[-1].declare_container(container, slot)
+
+  # gets container by address of declaration: depth is index of scope from last one, slot is index in scope
+  # searches by name if declaration is not executed yet (it can be shadowed by declaration in outer scope)
+  def get_container_by_address(self, name, depth: int, slot: int):
+    container = self.scopes[-1 - depth].slots[slot]
+
+    if container is None:
+      return self.get_container_by_name(name)
+
+    return container
+
   # gets container searching from last to first scope
   def get_container_by_name(self, name):
     if not len(self.scopes):
       raise StackError('No scopes available!')
 
-    reversed_scopes = self.scopes.copy()
-    reversed_scopes.reverse()
-
-    for scope in reversed_scopes:
+    for scope in reversed(self.scopes):
       container = scope.get_container_by_name(name)
 
       if container: 
@@ -84,10 +110,7 @@ class Stack:
     if not len(self.scopes):
       raise StackError('No scopes available!')
 
-    reversed_scopes = self.scopes.copy()
-    reversed_scopes.reverse()
-
-    for scope in reversed_scopes:
+    for scope in reversed(self.scopes):
       is_deleted = scope.remove_container_by_name(name)
 
       if is_deleted: 
@@ -99,11 +122,5 @@ class Stack:
   # 1) Scopes will be copied using shallow copy (modifying scopes list in origin stack wont affect copied stacks)
   # 2) Containers are connected (copied by reference)
   def copy(self):
-    # create new stack instance
-    stack = Stack()
-
-    # shallow copy of scopes
-    stack.scopes = list(self.scopes)
-
-    # return copy of stack
-    return stack
+    # create new stack instance with shallow copy of scopes
+    return Stack(list(self.scopes))
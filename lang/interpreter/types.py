@@ -19,9 +19,9 @@ FUNCTION_TYPE = 'FUNCTION'
 OBJECT_KEY_TYPES = [STRING_TYPE, NUMBER_TYPE]
 
 # function type stored in container
-# closure represents stack where the function was declared
+# closure is environment of captured declarations where the function was declared (see Environment)
 class FunctionValue:
-  def __init__(self, callable, closure: Stack):
+  def __init__(self, callable, closure: 'Environment'):
     self.callable = callable
     self.closure = closure
 
@@ -48,3 +48,7 @@ def get_value_type(value):
     return FUNCTION_TYPE
   
   return UNKNOWN_TYPE
+
+# check data types of values
+def is_value_of_type(value, *types: str):
+  return get_value_type(value) in types
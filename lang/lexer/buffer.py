@@ -0,0 +1,52 @@
+from lexer.token import *
+from shared.position import TokenPosition
+
+from array import array
+from typing import Iterable
+
+import sys
+
+# compact storage of module tokens (struct of arrays)
+# every token field is kept in its own array instead of separate objects
+# Token objects are created only when accessed
+class TokenBuffer:
+  def __init__(self, tokens: Iterable[Token] = ()):
+    # integer codes of token types
+    self.type_codes = array('B')
+    # token positions
+    self.rows = array('L')
+    self.columns = array('L')
+    # token codes (interned strings are shared between tokens)
+    self.codes: list[str] = []
+
+    self.extend(tokens)
+
+  def append(self, token: Token):
+    self.type_codes.append(token.type_code)
+    self.rows.append(token.position.row)
+    self.columns.append(token.position.column)
+    self.codes.append(token.code)
+
+  def extend(self, tokens: Iterable[Token]):
+    for token in tokens:
+      self.append(token)
+
+  # creates Token object by index
+  def get_token(self, index: int) -> Token:
+    position = TokenPosition(self.rows[index], self.columns[index])
+    return Token(position, TOKEN_TYPES[self.type_codes[index]], self.codes[index])
+
+  # returns amount of bytes used by buffer (without shared code strings)
+  def get_size(self) -> int:
+    arrays = [self.type_codes, self.rows, self.columns]
+    return sum(sys.getsizeof(item) for item in arrays) + sys.getsizeof(self.codes)
+
+  def __len__(self):
+    return len(self.codes)
+
+  def __getitem__(self, index: int) -> Token:
+    return self.get_token(index)
+
+  def __iter__(self):
+    for index in range(len(self)):
+      yield self.get_token(index)
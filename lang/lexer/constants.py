@@ -0,0 +1,7 @@
+# amount of characters read from file at once during streaming
+LEXER_CHUNK_SIZE = 64 * 1024
+
+# amount of characters that has to be available after matched token
+# if buffer ends earlier, next chunk is read and token is matched again
+# (token could continue in the next chunk, e.g. identifier or "==" after "=")
+LEXER_LOOKAHEAD = 16
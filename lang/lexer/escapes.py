@@ -0,0 +1,27 @@
+from functools import lru_cache
+
+import codecs
+import re
+
+# amount of decoded string literals that are cached
+ESCAPES_CACHE_SIZE = 4096
+
+# matches escape sequence in string literal
+# unknown escapes (e.g. "\q") are not matched and stay unchanged
+# incomplete escapes (e.g. "\x4") are matched to raise decoding error
+ESCAPE_PATTERN = re.compile(r'\\(?:x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|N\{[^}]*\}|[0-7]{1,3}|[\\\'"abfnrtv\n]|[xuUN])')
+
+# decodes single escape sequence
+def decode_escape(match: re.Match):
+  return codecs.decode(match.group(), 'unicode_escape')
+
+# decodes escape sequences of string literal content
+# other symbols (including non-ASCII) are kept as they are
+# raises UnicodeDecodeError for invalid escape sequence
+@lru_cache(maxsize=ESCAPES_CACHE_SIZE)
+def decode_escapes(code: str) -> str:
+  # fast path for literals without escapes
+  if '\\' not in code:
+    return code
+
+  return ESCAPE_PATTERN.sub(decode_escape, code)
@@ -1,93 +1,236 @@
 from lexer.exceptions import LexerError
+from lexer.constants import *
+from lexer.escapes import *
 from lexer.token import *
+from lexer.classes import *
+from lexer.unicode import *
 from shared.tokens import *
 from shared.keywords import *
 from shared.position import *
 
 # standard modules
+import functools
+import mmap
+import os
 import re
+import unicodedata
+
+# combined pattern of all tokens from specification
+# every token is a named group, alternatives keep specification order
+# so the first matching token wins (same as checking tokens one by one)
+TOKEN_PATTERN = re.compile('|'.join(f'(?P<{type}>{regex})' for type, regex in TOKEN_SPECIFICATION))
+
+# maps token type to indexes of its inner groups in combined pattern
+# used to extract string content from string literal
+TOKEN_INNER_GROUPS = {
+  type: range(TOKEN_PATTERN.groupindex[type] + 1, TOKEN_PATTERN.groupindex[type] + 1 + re.compile(regex).groups)
+  for type, regex in TOKEN_SPECIFICATION
+}
+
+# set of keywords for constant time lookup
+KEYWORDS_SET = frozenset(KEYWORDS)
+
+# matches run of spaces (all whitespace symbols except new line)
+# used to skip spaces at once when trivia is not kept
+SPACES_PATTERN = re.compile(r'[^\S\n]+')
+
+# returns bytes pattern that matches UTF-8 sequence of one symbol matched by text class (for example \\s or \\d)
+# code point ranges are generated for Unicode database of Python (lexer/classes.py),
+# symbols are enumerated only if Python uses another Unicode version
+def encode_symbols_class(text_class: str) -> bytes:
+  if UNICODE_VERSION == unicodedata.unidata_version and text_class in CLASS_RANGES:
+    ranges = CLASS_RANGES[text_class]
+  else:
+    ranges = find_class_ranges(text_class)
+
+  return encode_class_ranges(ranges)
+
+# returns patterns to match UTF-8 encoded code (memory-mapped files)
+# they accept the same symbols as text patterns, groups are the same too
+# patterns are created once when they are used first time
+@functools.cache
+def get_binary_patterns() -> tuple[re.Pattern, re.Pattern]:
+  digit = encode_symbols_class(r'\d')
+
+  # tokens with symbols classes
+  regexes = {
+    SPACE_TOKEN[0]: encode_symbols_class(SPACE_TOKEN[1]),
+    NUMBER_TOKEN[0]: digit + b'(?:' + digit + b'|\\.)*',
+  }
+
+  token_pattern = re.compile(b'|'.join(b'(?P<%s>%s)' % (type.encode(), regexes.get(type, regex.encode())) for type, regex in TOKEN_SPECIFICATION))
+  spaces_pattern = re.compile(encode_symbols_class(SPACES_PATTERN.pattern[:-1]) + b'+')
+
+  return token_pattern, spaces_pattern
 
 # class that parses code to tokens
+# tokens are generated lazily from the buffer that is filled by chunks
 class Lexer:
-  def __init__(self):
-    # input
+  # trivia flag specifies if SPACE tokens and repeated NEWLINE tokens are emitted
+  # without trivia only one NEWLINE token is emitted for several new lines (it terminates statements)
+  def __init__(self, trivia: bool = True):
+    self.trivia = trivia
+
+    # input buffer (consumed code is dropped when next chunk is read)
     self.code = ""
     self.position = 0
 
-    # output
-    self.tokens: list[Token] = []
+    # pointer position in rows and columns (counted from 1)
+    self.row = 1
+    self.column = 1
 
-  # for code loading 
-  # resets position and tokens
+  # for code loading
+  # resets position
   def load_code(self, code):
     self.code = code
     self.position = 0
-    self.tokens = []
+    self.row = 1
+    self.column = 1
 
-  # for moving pointer by delta
-  def move_position_by_delta(self, delta):
-    self.position += delta
+  # appends chunk to buffer and drops consumed code
+  def append_code(self, chunk: str):
+    # do not copy chunk if buffer is consumed
+    if self.position >= len(self.code):
+      self.code = chunk
+    else:
+      self.code = self.code[self.position:] + chunk
+
+    self.position = 0
+
+  # for moving pointer over consumed code
+  # end is buffer index after consumed code
+  # updates row and column incrementally, so the code before pointer is never rescanned
+  def move_position_by_code(self, end: int, code: str):
+    self.position = end
+
+    # count new lines inside consumed code
+    lines = code.count('\n')
+
+    if lines:
+      self.row += lines
+      # column starts after the last new line
+      self.column = len(code) - code.rfind('\n')
+    else:
+      self.column += len(code)
 
   # parses code (module) to tokens
+  # list-based wrapper around tokenize
   def parse(self, code: str):
-    self.load_code(code)
-
-    # iterate through code
-    while self.position < len(self.code):
-      # flag that indicates if token found for current position
-      current_position_match = False
-
-      # check every token from specification
-      for type, regex in TOKEN_SPECIFICATION:
-        # check if token is matched
-        match = re.search(f"^{regex}", self.code[self.position:])
-      
-        if match:
-          # get whole match value
-          token = match.group()
-          
-          # move position
-          self.move_position_by_delta(len(token))
-
-          # handle extracting part of token for .code field
-          # used to extract string content from string literal
-          if match.groups():
-            for group in match.groups():
-              if group:
-                token = group
-                break
-
-          # handle keywords
-          if type == IDENTIFIER_TOKEN[0] and token in KEYWORDS:
-            # type is a keyword itself
-            type = token
-
-          # escape special symbols in token
-          token = token.encode("utf-8").decode("unicode_escape")
-
-          # add token
-          position = self.compute_current_token_position()
-          self.tokens.append(Token(position, type, token))
-
-          # update flag to set current position matched
-          current_position_match = True
-          
-          # continue with new token
-          break
-        
-      if not current_position_match:
+    return list(self.tokenize(code))
+
+  # generates tokens of code (module) lazily
+  def tokenize(self, code: str):
+    chunks = iter([code])
+    return self.generate_tokens(lambda: next(chunks, ''))
+
+  # generates tokens of file content lazily
+  # file is read by chunks, so the whole content is never loaded
+  def stream(self, file, chunk_size: int = LEXER_CHUNK_SIZE):
+    return self.generate_tokens(lambda: file.read(chunk_size))
+
+  # generates tokens of file opened in binary mode lazily
+  # file is memory-mapped and lexed as UTF-8 bytes without decoded copy
+  # only tokens are decoded to strings
+  def map(self, file):
+    # empty file cannot be mapped
+    if not os.fstat(file.fileno()).st_size:
+      return
+
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+      chunks = iter([buffer])
+      yield from self.generate_tokens(lambda: next(chunks, b''), binary=True)
+
+  # generates tokens from chunks returned by read callable
+  # read returns empty chunk when input is finished
+  # binary flag indicates that chunks are UTF-8 bytes (or bytes-like objects)
+  def generate_tokens(self, read, binary: bool = False):
+    self.load_code(b"" if binary else "")
+
+    # patterns for chunks type
+    token_pattern, spaces_pattern = get_binary_patterns() if binary else (TOKEN_PATTERN, SPACES_PATTERN)
+
+    # flag that indicates that all chunks are read
+    is_read = False
+    # type of previous emitted token
+    previous_type = None
+
+    while True:
+      # skip spaces at once if trivia is not kept
+      if not self.trivia:
+        spaces = spaces_pattern.match(self.code, self.position)
+
+        if spaces:
+          # spaces do not contain new lines (non-ASCII spaces are several bytes in UTF-8)
+          self.column += len(self.decode_code(spaces.group())) if binary else spaces.end() - self.position
+          self.position = spaces.end()
+
+      # match combined pattern at current position
+      match = token_pattern.match(self.code, self.position)
+
+      # token could continue in the next chunk - read it and match again
+      if not is_read and (not match or match.end() + LEXER_LOOKAHEAD > len(self.code)):
+        chunk = read()
+
+        if chunk:
+          self.append_code(chunk)
+        else:
+          is_read = True
+
+        continue
+
+      # stop if code is finished
+      if self.position >= len(self.code):
+        return
+
+      if not match:
         raise LexerError(self.compute_current_token_position(), 'Invalid token found')
 
-    # return list of found tokens      
-    return self.tokens.copy()
-  
+      # name of matched group is token type
+      type = match.lastgroup
+
+      # get whole match value
+      token = self.decode_code(match.group()) if binary else match.group()
+
+      # move position
+      self.move_position_by_code(match.end(), token)
+
+      # skip trivia tokens if they are not kept
+      if not self.trivia and (type == SPACE_TOKEN[0] or (type == NEWLINE_TOKEN[0] and previous_type == type)):
+        continue
+
+      previous_type = type
+
+      # handle extracting part of token for .code field
+      # used to extract string content from string literal
+      for group in TOKEN_INNER_GROUPS[type]:
+        if match.group(group):
+          token = self.decode_code(match.group(group)) if binary else match.group(group)
+          break
+
+      # handle keywords
+      if type == IDENTIFIER_TOKEN[0] and token in KEYWORDS_SET:
+        # type is a keyword itself
+        type = token
+
+      # escape special symbols in string literals
+      if type == STRING_TOKEN[0]:
+        try:
+          token = decode_escapes(token)
+        except UnicodeDecodeError:
+          raise LexerError(self.compute_current_token_position(), f'Invalid escape sequence in string: {token}')
+
+      # emit token
+      position = self.compute_current_token_position()
+      yield Token(position, type, token)
+
+  # decodes UTF-8 bytes of token
+  def decode_code(self, code: bytes) -> str:
+    try:
+      return code.decode('utf-8')
+    except UnicodeDecodeError:
+      raise LexerError(self.compute_current_token_position(), 'Invalid UTF-8 symbols found')
+
   # method that computes token position based on current pont position pointer
+  # row and column are tracked while pointer moves (see move_position_by_code)
   def compute_current_token_position(self):
-    lines = self.code[0:self.position].split('\n')
-    
-    # rows are counted from 1
-    row = len(lines)
-    # columns are counted from 1 and target position next to pointer
-    column = len(lines[-1]) + 1
-
-    return TokenPosition(row, column)
+    return TokenPosition(self.row, self.column)
@@ -1,25 +1,38 @@
-from shared.tokens import TOKEN_NAMES
+from shared.tokens import TOKEN_NAMES, STRING_TOKEN
 from shared.keywords import KEYWORDS
 from shared.position import TokenPosition
 from lexer.exceptions import LexerError
 
+import sys
+
+# list of all token types (tokens and keywords)
+# index in list is small integer code of type
+TOKEN_TYPES = [*TOKEN_NAMES, *KEYWORDS]
+
+# maps token type to its integer code (constant time validation)
+TOKEN_TYPE_CODES = {type: code for code, type in enumerate(TOKEN_TYPES)}
+
+# code of string literal type (string literals content is not interned)
+STRING_TOKEN_TYPE_CODE = TOKEN_TYPE_CODES[STRING_TOKEN[0]]
+
 # token - standalone part of code
 # represents identifiers, operators and others
+# slots keep tokens compact (no instance dictionary)
 class Token:
+  __slots__ = ('position', 'type', 'type_code', 'code')
+
   def __init__(self, position: TokenPosition, type: str, code: str):
-    self.position = position
-    self.type = type
-    self.code = code
+    # validate type and get its code
+    type_code = TOKEN_TYPE_CODES.get(type)
+    if type_code is None:
+      raise LexerError(position, f'Token "{code}" has invalid type: {type}')
 
-  @property
-  def type(self):
-    return self._type
-  
-  @type.setter
-  def type(self, type):
-    if type not in TOKEN_NAMES and type not in KEYWORDS:
-      raise LexerError(self.position, f'Token "{self.code}" has invalid type: {type}')
-    self._type = type
+    self.position = position
+    # type is shared string from types list
+    self.type = TOKEN_TYPES[type_code]
+    self.type_code = type_code
+    # identifiers, keywords and operators repeat a lot, so their code is interned
+    self.code = code if type_code == STRING_TOKEN_TYPE_CODE else sys.intern(code)
 
   # overload equality operator
   # tokens are the same if they have same type and content
@@ -29,7 +42,11 @@ class Token:
       return None
 
     # compare tokens
-    return self.type == other.type and self.code == other.code
+    return self.type_code == other.type_code and self.code == other.code
+
+  # tokens are pickled as constructor arguments (compact and fast to load)
+  def __reduce__(self):
+    return (Token, (self.position, self.type, self.code))
 
   # defines mapping to string
   def __str__(self):
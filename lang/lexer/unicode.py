@@ -0,0 +1,107 @@
+# code point ranges of text classes and their UTF-8 byte patterns
+# classes of bytes patterns match ASCII only, so memory-mapped code is matched with alternatives of byte ranges
+# that accept UTF-8 sequences of the same symbols as text class (see get_binary_patterns)
+# module has no imports of lexer package: it is run as script to generate lexer/classes.py
+
+# standard modules
+import re
+import sys
+import unicodedata
+
+# text classes of token patterns that are matched in memory-mapped code
+SYMBOLS_CLASSES = [r'\s', r'\d', r'[^\S\n]']
+
+# the largest code points encoded with 1, 2 and 3 bytes
+UTF8_LIMITS = [0x7f, 0x7ff, 0xffff]
+
+# surrogates are not valid UTF-8
+SURROGATES = (0xd800, 0xdfff)
+
+# returns sorted ranges (first, last) of code points matched by text class
+# every code point is checked, so it is slow (used only to generate lexer/classes.py
+# and when Unicode database of Python differs from the generated one)
+def find_class_ranges(text_class: str) -> tuple[tuple[int, int], ...]:
+  pattern = re.compile(text_class)
+  ranges: list[list[int]] = []
+
+  # symbols are checked by planes (string of all symbols is big)
+  for plane in range(0, sys.maxunicode + 1, 0x10000):
+    for match in pattern.finditer(''.join(map(chr, range(plane, plane + 0x10000)))):
+      code = plane + match.start()
+
+      if ranges and ranges[-1][1] == code - 1:
+        ranges[-1][1] = code
+      else:
+        ranges.append([code, code])
+
+  return tuple((first, last) for first, last in ranges)
+
+# splits range of code points to ranges that are encoded to sequences of byte ranges
+# (every byte of sequence is range of bytes, all combinations are valid code points of range)
+# returns list of sequences, sequence is list of (first byte, last byte)
+def split_utf8_range(first: int, last: int) -> list[list[tuple[int, int]]]:
+  # surrogates are skipped
+  if first <= SURROGATES[1] and SURROGATES[0] <= last:
+    ranges = [(first, SURROGATES[0] - 1), (SURROGATES[1] + 1, last)]
+    return [sequence for start, end in ranges if start <= end for sequence in split_utf8_range(start, end)]
+
+  # sequences of range have the same length
+  for limit in UTF8_LIMITS:
+    if first <= limit < last:
+      return split_utf8_range(first, limit) + split_utf8_range(limit + 1, last)
+
+  # continuation bytes have to be complete ranges (except the first differing byte)
+  for index in range(1, 4):
+    mask = (1 << (6 * index)) - 1
+
+    if first & ~mask != last & ~mask:
+      if first & mask:
+        return split_utf8_range(first, first | mask) + split_utf8_range((first | mask) + 1, last)
+      if last & mask != mask:
+        return split_utf8_range(first, (last & ~mask) - 1) + split_utf8_range(last & ~mask, last)
+
+  return [list(zip(chr(first).encode(), chr(last).encode()))]
+
+# returns bytes pattern that matches UTF-8 sequence of one symbol of code point ranges
+# ASCII symbols are one class, other sequences are alternatives of byte ranges
+def encode_class_ranges(ranges: tuple[tuple[int, int], ...]) -> bytes:
+  sequences = [sequence for first, last in ranges for sequence in split_utf8_range(first, last)]
+
+  def escape_range(first: int, last: int) -> bytes:
+    return b'\\x%02x' % first if first == last else b'\\x%02x-\\x%02x' % (first, last)
+
+  ascii_ranges = [sequence[0] for sequence in sequences if len(sequence) == 1]
+  other_sequences = [sequence for sequence in sequences if len(sequence) > 1]
+
+  alternatives = [b'[' + b''.join(escape_range(*byte_range) for byte_range in ascii_ranges) + b']'] if ascii_ranges else []
+
+  if other_sequences:
+    # lookahead skips sequences for ASCII symbols at once
+    alternatives.append(b'(?=[\\x80-\\xff])(?:' + b'|'.join(b''.join(b'[' + escape_range(*byte_range) + b']' for byte_range in sequence) for sequence in other_sequences) + b')')
+
+  return b'(?:' + b'|'.join(alternatives) + b')'
+
+# prints source of lexer/classes.py (python lang/lexer/unicode.py > lang/lexer/classes.py)
+def print_classes_module():
+  print('# generated by lang/lexer/unicode.py, do not edit')
+  print('# code point ranges of text classes for Unicode database of Python (see get_class_ranges)')
+  print()
+  print(f'UNICODE_VERSION = {unicodedata.unidata_version!r}')
+  print()
+  print('CLASS_RANGES = {')
+
+  for text_class in SYMBOLS_CLASSES:
+    ranges = [f'(0x{first:x}, 0x{last:x}),' for first, last in find_class_ranges(text_class)]
+
+    print(f'  {text_class!r}: (')
+
+    # several ranges in line
+    for index in range(0, len(ranges), 6):
+      print('    ' + ' '.join(ranges[index:index + 6]))
+
+    print('  ),')
+
+  print('}')
+
+if __name__ == '__main__':
+  print_classes_module()
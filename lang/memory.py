@@ -0,0 +1,48 @@
+from config.config import get_config
+from config.constants import *
+
+from resolution.resolver import Resolver
+from parser.accounting import *
+
+# prints table row with aligned columns
+def print_row(*columns):
+  print(f'{columns[0]:<48}' + ''.join(f'{str(column):>12}' for column in columns[1:]))
+
+# reports AST node counts and memory usage of every module of the application
+# bytes include nodes, tokens, positions, lists and strings of AST
+def report_memory_usage():
+  config = get_config()
+
+  # resolve modules dependency graph
+  resolver = Resolver(config[CONFIGURATION_ALIASES_KEY], config[CONFIGURATION_MMAP_KEY], config[CONFIGURATION_WORKERS_KEY])
+  resolver.resolve_modules(config[CONFIGURATION_ENTRYPOINT_KEY])
+
+  # total usage of all modules by type
+  total_usage = dict()
+
+  print_row('module', 'nodes', 'tokens', 'bytes')
+
+  for module in resolver.sort_modules():
+    usage = compute_ast_usage(module.content)
+
+    nodes = sum(count for type, (count, _) in usage.items() if issubclass(type, Node))
+    tokens = usage.get(Token, [0, 0])[0]
+    size = sum(size for _, size in usage.values())
+
+    print_row(module.path[-48:], nodes, tokens, size)
+
+    for type, (count, size) in usage.items():
+      entry = total_usage.setdefault(type, [0, 0])
+      entry[0] += count
+      entry[1] += size
+
+  # usage by type
+  print()
+  print_row('type', 'count', 'bytes', 'bytes/item')
+
+  for type, (count, size) in sorted(total_usage.items(), key=lambda item: -item[1][1]):
+    print_row(type.__name__, count, size, size // count)
+
+# entry point of the report
+if __name__ == '__main__':
+  report_memory_usage()
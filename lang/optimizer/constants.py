@@ -0,0 +1,4 @@
+# maximal right operand of left shift and integer exponential that is folded
+# results of these operations grow with right operand,
+# so bigger ones are computed at runtime only (if expression is reached)
+FOLDING_GROWTH_LIMIT = 64
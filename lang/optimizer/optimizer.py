@@ -0,0 +1,314 @@
+from optimizer.constants import *
+
+from interpreter.operations import *
+from interpreter.types import *
+
+from parser.types.statements import *
+from parser.types.expressions import *
+
+from lexer.token import *
+
+from shared.tokens import *
+from shared.keywords import *
+
+# class that optimizes AST before execution
+# literals are converted to constants (Python values) once
+# operations with constant operands are folded (computed with the same operations as Interpreter uses)
+# statically dead branches of conditions and no-op statements are removed
+# AST is changed in place and returned
+class Optimizer:
+  # optimizes AST of module
+  # entry point
+  def optimize(self, ast: BlockStatement) -> BlockStatement:
+    ast.statements = self.optimize_statements(ast.statements)
+
+    return ast
+
+  # optimize statements
+
+  # returns list of optimized statements without removed ones
+  def optimize_statements(self, statements: list[Statement]) -> list[Statement]:
+    optimized = []
+
+    for statement in statements:
+      statement = self.optimize_statement(statement)
+
+      if statement is not None:
+        optimized.append(statement)
+
+    return optimized
+
+  # returns optimized statement or None if statement can be removed
+  # this methods delegates optimization based on statement type
+  def optimize_statement(self, statement: Statement) -> Statement | None:
+    if is_statement_of_class(statement, ExpressionStatement):
+      return self.optimize_expression_statement(statement)
+    if is_statement_of_class(statement, BlockStatement):
+      return self.optimize_block_statement(statement)
+    if is_statement_of_class(statement, VariableDeclarationStatement, ConstantDeclarationStatement):
+      return self.optimize_declaration_statement(statement)
+    if is_statement_of_class(statement, ConditionStatement):
+      return self.optimize_condition_statement(statement)
+    if is_statement_of_class(statement, WhileStatement):
+      return self.optimize_while_statement(statement)
+    if is_statement_of_class(statement, ForStatement):
+      return self.optimize_for_statement(statement)
+    if is_statement_of_class(statement, FunctionDeclarationStatement):
+      return self.optimize_function_declaration_statement(statement)
+    if is_statement_of_class(statement, ReturnStatement):
+      return self.optimize_return_statement(statement)
+    if is_statement_of_class(statement, ExportStatement):
+      return self.optimize_export_statement(statement)
+
+    # imports, breaks, continues and other statements have nothing to optimize
+    return statement
+
+  # returns optimized statement that is executed as branch of other statement
+  # removed statement is replaced with empty block
+  def optimize_branch(self, statement: Statement) -> Statement:
+    optimized = self.optimize_statement(statement)
+
+    return BlockStatement([]) if optimized is None else optimized
+
+  def optimize_expression_statement(self, statement: ExpressionStatement):
+    statement.expression = self.optimize_expression(statement.expression)
+
+    # constant and empty expressions (comments) do nothing
+    if is_expression_of_class(statement.expression, ConstantExpression, NullExpression):
+      return None
+
+    return statement
+
+  def optimize_block_statement(self, statement: BlockStatement):
+    statement.statements = self.optimize_statements(statement.statements)
+
+    return statement
+
+  def optimize_declaration_statement(self, statement: VariableDeclarationStatement | ConstantDeclarationStatement):
+    if statement.initialization:
+      statement.initialization = self.optimize_expression(statement.initialization)
+
+    return statement
+
+  def optimize_condition_statement(self, statement: ConditionStatement):
+    statement.condition = self.optimize_expression(statement.condition)
+    statement.then_branch = self.optimize_branch(statement.then_branch)
+
+    if statement.else_branch:
+      statement.else_branch = self.optimize_branch(statement.else_branch)
+
+    # condition has to be known before execution
+    if not is_expression_of_class(statement.condition, ConstantExpression):
+      return statement
+
+    branch = statement.then_branch if statement.condition.value else statement.else_branch
+
+    # branch is missed or empty
+    if branch is None or self.is_empty_statement(branch):
+      return None
+
+    # block creates its own scope and keeps its statements nested,
+    # so it can replace the condition (other statements are executed in scope of condition)
+    if is_statement_of_class(branch, BlockStatement):
+      return branch
+
+    return statement
+
+  def optimize_while_statement(self, statement: WhileStatement):
+    statement.condition = self.optimize_expression(statement.condition)
+    statement.body = self.optimize_branch(statement.body)
+
+    return statement
+
+  def optimize_for_statement(self, statement: ForStatement):
+    statement.initializer = self.optimize_branch(statement.initializer)
+    statement.condition = self.optimize_expression(statement.condition)
+    statement.increment = self.optimize_expression(statement.increment)
+    statement.body = self.optimize_branch(statement.body)
+
+    return statement
+
+  def optimize_function_declaration_statement(self, statement: FunctionDeclarationStatement):
+    for param in statement.params:
+      if param.defaultValue:
+        param.defaultValue = self.optimize_expression(param.defaultValue)
+
+    statement.body = self.optimize_branch(statement.body)
+
+    return statement
+
+  def optimize_return_statement(self, statement: ReturnStatement):
+    statement.returns = self.optimize_expression(statement.returns)
+
+    return statement
+
+  def optimize_export_statement(self, statement: ExportStatement):
+    # exported declaration is never removed
+    statement.exports = self.optimize_statement(statement.exports)
+
+    return statement
+
+  # checks that statement does nothing
+  def is_empty_statement(self, statement: Statement):
+    if is_statement_of_class(statement, BlockStatement):
+      return not statement.statements
+    if is_statement_of_class(statement, ExpressionStatement):
+      return is_expression_of_class(statement.expression, ConstantExpression, NullExpression)
+
+    return False
+
+  # optimize expressions
+
+  # returns optimized expression
+  # expressions are optimized with explicit stack (as they are parsed), so deep expressions do not hit recursion limit
+  def optimize_expression(self, expression: Expression) -> Expression:
+    # stack of expression generators
+    # generator yields nested expression and receives optimized nested expression
+    stack = [self.generate_expression(expression)]
+    # last optimized expression
+    optimized = None
+
+    while stack:
+      try:
+        nested = stack[-1].send(optimized)
+      # generator is finished - its expression is passed to the previous one
+      except StopIteration as result:
+        stack.pop()
+        optimized = result.value
+        continue
+
+      # start nested expression
+      stack.append(self.generate_expression(nested))
+      optimized = None
+
+    return optimized
+
+  # generates optimized expression (see optimize_expression)
+  # this methods delegates optimization based on expression type
+  def generate_expression(self, expression: Expression):
+    if is_expression_of_class(expression, LiteralExpression):
+      return self.optimize_literal_expression(expression)
+    if is_expression_of_class(expression, UnaryOperationExpression):
+      return (yield from self.generate_unary_expression(expression))
+    if is_expression_of_class(expression, BinaryOperationExpression):
+      return (yield from self.generate_binary_expression(expression))
+    if is_expression_of_class(expression, GroupingExpression):
+      return (yield from self.generate_grouping_expression(expression))
+    if is_expression_of_class(expression, GroupingApplicationExpression):
+      return (yield from self.generate_grouping_application_expression(expression))
+    if is_expression_of_class(expression, AssociationExpression):
+      return (yield from self.generate_association_expression(expression))
+
+    # identifiers, constants and empty expressions have nothing to optimize
+    return expression
+
+  # converts literal token to its value once
+  # conversion is the same as in Interpreter.evaluate_literal_expression
+  def optimize_literal_expression(self, expression: LiteralExpression):
+    if is_token_of_type(expression.value, STRING_TOKEN):
+      return ConstantExpression(expression.value.code)
+    if is_token_of_type(expression.value, NUMBER_TOKEN):
+      return self.fold_number_literal(expression)
+    if is_token_of_type(expression.value, map_keyword_to_token(TRUE_KEYWORD)):
+      return ConstantExpression(True)
+    if is_token_of_type(expression.value, map_keyword_to_token(FALSE_KEYWORD)):
+      return ConstantExpression(False)
+    if is_token_of_type(expression.value, map_keyword_to_token(NULL_KEYWORD)):
+      return ConstantExpression(None)
+
+    # invalid literal fails during execution
+    return expression
+
+  # malformed number (lexer matches digits and dots, so "1.2.3" is NUMBER) is not converted,
+  # it fails during execution when it is reached (as fold_operation keeps operations that raise)
+  def fold_number_literal(self, expression: LiteralExpression):
+    try:
+      return ConstantExpression(float(expression.value.code))
+    except Exception:
+      return expression
+
+  def generate_unary_expression(self, expression: UnaryOperationExpression):
+    expression.operand = yield expression.operand
+
+    operation = UNARY_OPERATIONS.get(expression.operator.type)
+
+    # fold pure operation on constant
+    if operation and is_expression_of_class(expression.operand, ConstantExpression):
+      return self.fold_operation(expression, operation, expression.operand.value)
+
+    return expression
+
+  def generate_binary_expression(self, expression: BinaryOperationExpression):
+    expression.left = yield expression.left
+
+    # member name is not evaluated
+    if is_token_of_type(expression.operator, DOT_TOKEN):
+      return expression
+
+    expression.right = yield expression.right
+
+    left_constant = is_expression_of_class(expression.left, ConstantExpression)
+
+    # logical operators return one of operands (right one is evaluated only if left does not decide)
+    if is_token_of_type(expression.operator, OR_TOKEN) and left_constant:
+      return expression.left if expression.left.value else expression.right
+    if is_token_of_type(expression.operator, AND_TOKEN) and left_constant:
+      return expression.right if expression.left.value else expression.left
+
+    operation = BINARY_OPERATIONS.get(expression.operator.type)
+
+    # fold pure operation on constants
+    if operation and left_constant and is_expression_of_class(expression.right, ConstantExpression):
+      if not self.is_growing_operation(expression.operator, expression.left.value, expression.right.value):
+        return self.fold_operation(expression, operation, expression.left.value, expression.right.value)
+
+    return expression
+
+  def generate_grouping_expression(self, expression: GroupingExpression):
+    expressions = []
+
+    for exp in expression.expressions:
+      expressions.append((yield exp))
+
+    expression.expressions = expressions
+
+    return expression
+
+  def generate_grouping_application_expression(self, expression: GroupingApplicationExpression):
+    expression.left = yield expression.left
+    expression.right = yield expression.right
+
+    return expression
+
+  def generate_association_expression(self, expression: AssociationExpression):
+    entries = []
+
+    for key, value in expression.entries:
+      # only dynamic keys (in []) are evaluated, other keys are kept as they are written
+      if is_expression_of_class(key, GroupingExpression):
+        key = yield key
+
+      entries.append((key, (yield value)))
+
+    expression.entries = entries
+
+    return expression
+
+  # returns constant with result of operation
+  # expression is kept if operation fails, so error is raised during execution (if expression is reached)
+  def fold_operation(self, expression: Expression, operation, *values):
+    try:
+      return ConstantExpression(operation(expression.operator, *values))
+    except Exception:
+      return expression
+
+  # checks if operation result grows with right operand (see FOLDING_GROWTH_LIMIT)
+  def is_growing_operation(self, operator: Token, left_value, right_value):
+    if not is_value_of_type(right_value, NUMBER_TYPE) or abs(right_value) <= FOLDING_GROWTH_LIMIT:
+      return False
+
+    if is_token_of_type(operator, LEFT_SHIFT_TOKEN):
+      return True
+
+    # float exponential overflows instead of growing
+    return is_token_of_type(operator, EXPONENTIAL_TOKEN) and isinstance(left_value, int) and isinstance(right_value, int)
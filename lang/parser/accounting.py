@@ -0,0 +1,58 @@
+from parser.types.node import Node
+from lexer.token import Token
+from shared.position import TokenPosition
+
+import sys
+
+# types of objects that are counted in AST
+ACCOUNTED_TYPES = (Node, Token, TokenPosition, list, tuple, str)
+
+# returns names of all fields of object (slots of all classes and instance dictionary)
+def get_object_fields(object) -> list[str]:
+  fields = []
+
+  for object_class in type(object).__mro__:
+    slots = object_class.__dict__.get('__slots__', ())
+    fields.extend([slots] if isinstance(slots, str) else slots)
+
+  if hasattr(object, '__dict__'):
+    fields.extend(vars(object))
+
+  return fields
+
+# computes memory usage of AST
+# returns dict (type -> [count, bytes])
+# objects shared by several nodes (interned strings) are counted once
+# AST is walked with explicit stack, so deep trees are supported
+def compute_ast_usage(ast: Node) -> dict[type, list[int]]:
+  usage = dict()
+  visited = set()
+
+  stack = [ast]
+
+  while stack:
+    object = stack.pop()
+
+    # skip other values (numbers, None) and visited objects
+    if not isinstance(object, ACCOUNTED_TYPES) or id(object) in visited:
+      continue
+
+    visited.add(id(object))
+
+    size = sys.getsizeof(object)
+
+    # instance dictionary is a separate object
+    if hasattr(object, '__dict__'):
+      size += sys.getsizeof(vars(object))
+
+    entry = usage.setdefault(type(object), [0, 0])
+    entry[0] += 1
+    entry[1] += size
+
+    # walk children
+    if isinstance(object, (list, tuple)):
+      stack.extend(object)
+    elif not isinstance(object, str):
+      stack.extend(getattr(object, field) for field in get_object_fields(object))
+
+  return usage
@@ -4,7 +4,6 @@ from shared.tokens import *
 from shared.keywords import *
 
 import math
-import inspect
 
 # base precedence 
 # use for initializing expression parsing
@@ -73,50 +72,51 @@ OPERATOR_PRECEDENCE = [
   (LEFT_CURLY_BRACE_TOKEN, AssociationExpression),
 ]
 
-# get operator tokens
-OPERATOR_TOKENS = list(map(lambda group: group[0], OPERATOR_PRECEDENCE))
+# maps operator token type to its precedence (index in OPERATOR_PRECEDENCE)
+OPERATOR_PRECEDENCE_TABLE = {token[0]: index for index, (token, _) in enumerate(OPERATOR_PRECEDENCE)}
+
+# maps operator token type to its expression class
+OPERATOR_CLASS_TABLE = {token[0]: token_class for token, token_class in OPERATOR_PRECEDENCE}
+
+# returns set of operator token types assigned to the expression class or its derived subclass
+def get_operator_types_of_class(expression_class):
+  return frozenset(type for type, token_class in OPERATOR_CLASS_TABLE.items() if issubclass(token_class, expression_class))
+
+# operator kinds tables
+UNARY_OPERATOR_TYPES = get_operator_types_of_class(UnaryOperationExpression)
+PREFIX_UNARY_OPERATOR_TYPES = get_operator_types_of_class(PrefixUnaryOperationExpression)
+SUFFIX_UNARY_OPERATOR_TYPES = get_operator_types_of_class(SuffixUnaryOperationExpression)
+AFFIX_UNARY_OPERATOR_TYPES = get_operator_types_of_class(AffixUnaryOperationExpression)
+BINARY_OPERATOR_TYPES = get_operator_types_of_class(BinaryOperationExpression)
+GROUPING_OPERATOR_TYPES = get_operator_types_of_class(GroupingExpression)
+ASSOCIATION_OPERATOR_TYPES = get_operator_types_of_class(AssociationExpression)
 
 # operator token precedence getter
-# smaller precedence = more important operator
+# bigger precedence = more important operator
 def get_operator_precedence(token: Token):
-  # iterate through tokens
-  for index in range(len(OPERATOR_TOKENS)):
-    # check each token
-    if token.type == OPERATOR_TOKENS[index][0]:
-      # return precedence
-      return index
-    
-  # fallback value
-  return math.inf
+  return OPERATOR_PRECEDENCE_TABLE.get(token.type, math.inf)
+
+# checks if token is operator
+def is_operator(token: Token):
+  return token.type in OPERATOR_PRECEDENCE_TABLE
 
 def is_unary_operator(operator: Token):
-  return is_operator_of_class(operator, UnaryOperationExpression)
+  return operator.type in UNARY_OPERATOR_TYPES
 def is_prefix_unary_operator(operator: Token):
-  return is_operator_of_class(operator, PrefixUnaryOperationExpression)
+  return operator.type in PREFIX_UNARY_OPERATOR_TYPES
 def is_suffix_unary_operator(operator: Token):
-  return is_operator_of_class(operator, SuffixUnaryOperationExpression)
+  return operator.type in SUFFIX_UNARY_OPERATOR_TYPES
 def is_affix_unary_operator(operator: Token):
-  return is_operator_of_class(operator, AffixUnaryOperationExpression)
+  return operator.type in AFFIX_UNARY_OPERATOR_TYPES
 
 def is_binary_operator(operator: Token):
-  return is_operator_of_class(operator, BinaryOperationExpression)
+  return operator.type in BINARY_OPERATOR_TYPES
 
 def is_grouping_operator(operator: Token):
-  return is_operator_of_class(operator, GroupingExpression)
+  return operator.type in GROUPING_OPERATOR_TYPES
 
 def is_association_operator(operator: Token):
-  return is_operator_of_class(operator, AssociationExpression)
-
-# receives token and class from hierarchy of expression classes
-# returns if the token is assigned to the expression class or its derived subclass
-def is_operator_of_class(operator: Token, expression_class):
-  # iterate through operators
-  for token, token_class in OPERATOR_PRECEDENCE:
-    if is_token_of_type(operator, token):
-      return inspect.isclass(expression_class) and issubclass(token_class, expression_class)
-  
-  # return False if not found
-  return False
+  return operator.type in ASSOCIATION_OPERATOR_TYPES
 
 # specifies grouping close tokens
 GROUPING_OPERATOR_CLOSING_TOKENS = [
@@ -124,11 +124,10 @@ GROUPING_OPERATOR_CLOSING_TOKENS = [
   (LEFT_PARENTHESES_TOKEN, RIGHT_PARENTHESES_TOKEN),
 ]
 
+# maps opening token type to closing token
+GROUPING_OPERATOR_CLOSING_TABLE = {opening[0]: closing for opening, closing in GROUPING_OPERATOR_CLOSING_TOKENS}
+
 # util to get closing token by opening token
+# returns None if token is not grouping operator
 def get_grouping_operator_closing_token(operator: Token):
-  for opening, closing in GROUPING_OPERATOR_CLOSING_TOKENS:
-    if is_token_of_type(operator, opening):
-      return closing
-    
-  # fallback
-  return None 
+  return GROUPING_OPERATOR_CLOSING_TABLE.get(operator.type)
@@ -4,6 +4,7 @@ from parser.exceptions import *
 from parser.constants import *
 from parser.operators import *
 from parser.tokens import *
+from parser.stream import *
 
 from lexer.token import Token
 
@@ -13,15 +14,20 @@ from shared.keywords import *
 # class that parses token list to AST
 # AST is built with Statements and Expressions
 class Parser:
-  def __init__(self):
-    # list of tokens that are in use to build AST
-    self.tokens: list[Token] = []
-    # list position
+  # trivia flag specifies if tokens contain SPACE tokens (see Lexer)
+  # without trivia skipping of spaces is omitted
+  def __init__(self, trivia: bool = True):
+    self.trivia = trivia
+
+    # stream of tokens that are in use to build AST
+    self.tokens = TokenStream([])
+    # stream position
     self.position = 0
 
-  # parses token list to AST
+  # parses tokens to AST
+  # receives list of tokens or lazy generator of tokens
   # entry point
-  def parse(self, tokens: list[Token]):
+  def parse(self, tokens: Iterable[Token]):
     # load tokens
     self.load_tokens(tokens)
 
@@ -32,6 +38,9 @@ class Parser:
     while not self.is_end():
       statements.append(self.parse_statement())
 
+      # tokens of parsed top-level statement are not needed anymore
+      self.tokens.release(self.position)
+
     # return block of statements
     return BlockStatement(statements)
 
@@ -53,6 +62,10 @@ class Parser:
       return self.parse_for_statement(*terminators)
     if self.match_while_statement():
       return self.parse_while_statement(*terminators)
+    if self.match_break_statement():
+      return self.parse_break_statement()
+    if self.match_continue_statement():
+      return self.parse_continue_statement()
     if self.match_function_declaration_statement():
       return self.parse_function_declaration_statement()
     if self.match_return_statement():
@@ -272,8 +285,8 @@ class Parser:
     self.require_token(map_keyword_to_token(BREAK_KEYWORD))
     self.consume_current_token()
 
-    # require newline
-    self.require_newline_for_next_statements()
+    # require end of statement
+    self.require_statement_end()
 
     return BreakStatement()
   def parse_continue_statement(self):
@@ -281,8 +294,8 @@ class Parser:
     self.require_token(map_keyword_to_token(CONTINUE_KEYWORD))
     self.consume_current_token()
 
-    # require newline
-    self.require_newline_for_next_statements()
+    # require end of statement
+    self.require_statement_end()
 
     return ContinueStatement()
   def parse_function_declaration_statement(self):
@@ -473,6 +486,9 @@ class Parser:
     # iterate for nested statements
     # stop if end is reached
     while not self.is_end():
+      # indentation of closing brace is skipped (AST does not depend on trivia)
+      self.skip_tokens(SPACE_TOKEN)
+
       # check if end is not reached
       if self.match_token(RIGHT_CURLY_BRACE_TOKEN):
         # pass closing token
@@ -517,6 +533,16 @@ class Parser:
     self.require_token(NEWLINE_TOKEN)
     self.consume_current_token()
 
+  # requires newline, closing brace or end of code after statement without consuming it
+  # (as return statement ends), so block is closed the same way with and without trivia
+  def require_statement_end(self):
+    self.skip_tokens(SPACE_TOKEN)
+
+    if self.is_end() or self.match_token(RIGHT_CURLY_BRACE_TOKEN):
+      return
+
+    self.require_token(NEWLINE_TOKEN)
+
   # Methods to check statements (without requiring)
   # check if current statement is of type
 
@@ -555,59 +581,112 @@ class Parser:
   # base_expression is used to continue parsing after UNARY operations and GROUPINGS
   # base_precedence specifies the precedence of previous expression to form a hierarchy
   # specify tokens after which search stops
-  # composes AST and bases on parse_expression_from_tokens method
+  # nested expressions (operands, grouped expressions, entries) are parsed with explicit stack
+  # so length of operator chains and depth of nesting are not limited by Python stack
   def parse_expression(
     self, 
     base_expression: Expression | None, # contains node of currently parsing expression
     base_precedence: int, # contains precedence of previous operator to handle hierarchy
     *terminators: list[Token] # list of tokens that end expression if it is ready
   ):
-    # handle if base expression is finished
-    if base_expression:
-      # skip only spaces
-      self.skip_tokens(SPACE_TOKEN)
-
-      # if new line or terminator - finish
-      if self.is_end() or self.match_token(NEWLINE_TOKEN, *terminators):
-        return base_expression
-    
-    # skip spaces and newlines (expressions can take several lines if needed)
-    self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
-
-    # init node tokens
-    passed_tokens: list[Token] = []
-    
-    # go until operators
-    while not self.is_end() and not self.match_token(*OPERATOR_TOKENS):
-      # if base_expression is followed by non-operator tokens - error in composition
+    # stack of expression generators
+    # generator yields arguments of nested expression and receives parsed nested expression
+    stack = [self.generate_expression(base_expression, base_precedence, *terminators)]
+    # last parsed expression
+    expression = None
+
+    while stack:
+      try:
+        arguments = stack[-1].send(expression)
+      # generator is finished - its expression is passed to the previous one
+      except StopIteration as result:
+        stack.pop()
+        expression = result.value
+        continue
+
+      # start nested expression
+      stack.append(self.generate_expression(*arguments))
+      expression = None
+
+    return expression
+
+  # generates expression node (see parse_expression)
+  # composes AST and bases on parse_expression_from_tokens method
+  # tokens are passed once: precedence of operator is checked before it is consumed
+  # continuation with composed expression is a next iteration of the loop
+  # nested expression is requested by yielding its arguments
+  def generate_expression(
+    self, 
+    base_expression: Expression | None,
+    base_precedence: int,
+    *terminators: list[Token]
+  ):
+    while True:
+      # handle if base expression is finished
       if base_expression:
-        print(base_expression, self.get_current_token())
-        raise ParserError(self.get_current_token_position(), 'Invalid expression')
+        # skip only spaces
+        self.skip_tokens(SPACE_TOKEN)
+
+        # if new line or terminator - finish
+        if self.is_end() or self.match_token(NEWLINE_TOKEN, *terminators):
+          return base_expression
       
-      # check if terminators or end of module are not reached
-      # when reach terminator or end of module, finish expression parsing
-      if self.match_token(*terminators) or self.is_end():
-        return self.parse_expression_from_tokens(passed_tokens)
+      # skip spaces and newlines (expressions can take several lines if needed)
+      self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
+
+      # init node tokens
+      passed_tokens: list[Token] = []
       
-      # append tokens to list
-      passed_tokens.append(self.consume_current_token())
+      # go until operators
+      while not self.is_end() and not self.match_operator():
+        # if base_expression is followed by non-operator tokens - error in composition
+        if base_expression:
+          print(base_expression, self.get_current_token())
+          raise ParserError(self.get_current_token_position(), 'Invalid expression')
+        
+        # check if terminators or end of module are not reached
+        # when reach terminator or end of module, finish expression parsing
+        if self.match_token(*terminators) or self.is_end():
+          return self.parse_expression_from_tokens(passed_tokens)
+        
+        # append tokens to list
+        passed_tokens.append(self.consume_current_token())
 
-      # skip spaces again
-      self.skip_tokens(SPACE_TOKEN)
+        # skip spaces again
+        self.skip_tokens(SPACE_TOKEN)
 
-    # stop if end or terminator is reached
-    if self.is_end() or self.match_token(*terminators):
-      return self.parse_expression_from_tokens(passed_tokens)
+      # stop if end or terminator is reached
+      if self.is_end() or self.match_token(*terminators):
+        return self.parse_expression_from_tokens(passed_tokens)
 
-    # get found operator. Consume and move position
-    operator = self.consume_current_token()
-    precedence = get_operator_precedence(operator)
+      # get found operator without consuming
+      operator = self.get_current_token()
+      precedence = get_operator_precedence(operator)
+
+      # operator with smaller precedence finishes previous expression
+      # it is left unconsumed and analysed after
+      # association operator does not depend on precedence
+      if not is_association_operator(operator):
+        # unary operator of the same precedence continues expression
+        if is_unary_operator(operator):
+          is_finishing = base_precedence > precedence
+        else:
+          is_finishing = base_precedence >= precedence
+
+        if is_finishing:
+          # continue parsing operations with base_expression
+          if base_expression:
+            base_precedence = BASE_PRECEDENCE
+            continue
+
+          # finish previous expression with passed tokens
+          return self.parse_expression_from_tokens(passed_tokens)
+
+      # consume operator
+      self.increment_position()
 
-    # handle unary operations
-    if is_unary_operator(operator):
-      # handle case if current operator has higher precedence
-      # higher precedence - work with this expression
-      if base_precedence <= precedence:
+      # handle unary operations
+      if is_unary_operator(operator):
         # if passed_tokens are present - suffix operator
         if base_expression or len(passed_tokens):
           # if there are tokens - suffix operator
@@ -624,11 +703,10 @@ class Parser:
           if is_expression_of_class(operand, NullExpression):
             raise ParserError(self.get_current_token_position(), f'Unary operator {operator.code} requires operand')
           
-          # compose expression
-          expression = SuffixUnaryOperationExpression(operator, operand)
-          
           # pass this expression for further parsing
-          return self.parse_expression(expression, precedence, *terminators)
+          base_expression = SuffixUnaryOperationExpression(operator, operand)
+          base_precedence = precedence
+          continue
 
         # if no tokens and no base expression - prefix operator
         # validate operator
@@ -636,34 +714,20 @@ class Parser:
           raise ParserError(self.get_current_token_position(), 'Suffix operator is used in prefix form')
         
         # no base expression because no tokens, started with operator
-        operand = self.parse_expression(None, precedence, *terminators)
+        operand = yield (None, precedence, *terminators)
         
         # validate operand
         if is_expression_of_class(operand, NullExpression):
           raise ParserError(self.get_current_token_position(), f'Unary operator {operator.code} requires operand')
 
-        expression = PrefixUnaryOperationExpression(operator, operand)
-
         # use this expression as base and continue parsing
-        return self.parse_expression(expression, precedence, *terminators)
-      
-      # if this operator has smaller precedence:
-      # finish previous expression and analyse operator after
-      
-      # to "give operator back"
-      self.decrement_position()
-
-      # parse based on base_expression
-      if base_expression: 
-        return self.parse_expression(base_expression, BASE_PRECEDENCE, *terminators)
-      
-      # finish previous expression with passed tokens
-      return self.parse_expression_from_tokens(passed_tokens)
+        base_expression = PrefixUnaryOperationExpression(operator, operand)
+        base_precedence = precedence
+        continue
 
-    # handle binary operations
-    if is_binary_operator(operator):
-      # if found operation precedence is smaller than or equal to, current tokens is its left branch
-      if base_precedence < precedence:
+      # handle binary operations
+      if is_binary_operator(operator):
+        # current tokens are left branch of found operation
         # if left_branch is base_expression
         left_branch = base_expression
         # override with passed tokens if needed
@@ -674,83 +738,22 @@ class Parser:
         if is_expression_of_class(left_branch, NullExpression):
           raise ParserError(self.get_current_token_position(), f'Binary operator {operator.code} requires left operand')
 
-        right_branch = self.parse_expression(None, precedence, *terminators)
+        right_branch = yield (None, precedence, *terminators)
 
         # validate operand
         if is_expression_of_class(right_branch, NullExpression):
           raise ParserError(self.get_current_token_position(), f'Binary operator {operator.code} requires right operand')
         
-        # compose expression
-        expression = BinaryOperationExpression(operator, left_branch, right_branch)
-
         # use this expression as base one
-        return self.parse_expression(expression, precedence, *terminators)
-      
-      # if found operation precedence is higher:
-      # finish previous expression first
+        base_expression = BinaryOperationExpression(operator, left_branch, right_branch)
+        base_precedence = precedence
+        continue
       
-      # to "give operator back"
-      self.decrement_position()
-
-      # parse based on base_expression 
-      if base_expression: 
-        return self.parse_expression(base_expression, BASE_PRECEDENCE, *terminators)
-      
-      # finish previous expression with passed tokens
-      return self.parse_expression_from_tokens(passed_tokens)
-    
-    # handle grouping operations
-    if is_grouping_operator(operator):
-      # remember position before parsing group
-      position_before_grouping_operator = self.position - 1
-      
-      # get closing token - terminator
-      closing_operator = get_grouping_operator_closing_token(operator)
-      # add new terminators
-      grouping_terminators = [*terminators, COMMA_TOKEN, closing_operator]
-
-      # start list of grouped expressions
-      expressions: list[Expression] = []
-
-      # parse expressions until reach closing operator
-      while not self.match_token(closing_operator):
-        # require comma separator
-        if len(expressions):
-          self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
-
-          self.require_token(COMMA_TOKEN)
-          self.consume_current_token()
-
-          self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
-
-          if self.match_token(closing_operator):
-            self.consume_current_token()
-            break
-
-        # add found expression
-        expressions.append(self.parse_expression(None, BASE_PRECEDENCE, *grouping_terminators))
-
-        self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
-
-      # validate expressions
-      if len(expressions):
-        # do not check last expression (trailing commas are allowed)
-        for i in range(len(expressions) - 1):
-          if is_expression_of_class(expressions[i], NullExpression):
-            raise ParserError(self.get_current_token_position(), 'Incorrect expression in group')
-          
-        # remove last NullExpression (trailing comma case)
-        if is_expression_of_class(expressions[-1], NullExpression):
-          expressions.pop()
-
-      # consume closing token
-      self.consume_current_token()
-
-      # compose grouping expression
-      grouping_expression = GroupingExpression(operator, expressions)
+      # handle grouping operations
+      if is_grouping_operator(operator):
+        # compose grouping expression
+        grouping_expression = yield from self.generate_grouping_expression(operator, *terminators)
 
-      # if grouping precedence is higher, return grouping or grouping application
-      if base_precedence < precedence:
         # if no previously passed tokens or base_expression - return expression
         if not base_expression and not len(passed_tokens):
           return grouping_expression
@@ -763,85 +766,128 @@ class Parser:
 
         # validate left expression
         if is_expression_of_class(left, NullExpression):
-          return self.parse_expression(grouping_expression, BASE_PRECEDENCE, *terminators)
-        
-        # compose expression
-        expression = GroupingApplicationExpression(left, grouping_expression)
+          base_expression = grouping_expression
+          base_precedence = BASE_PRECEDENCE
+          continue
         
         # use expression as base for further parsing 
-        return self.parse_expression(expression, precedence, *terminators)
-      
-      # if found operation precedence is higher:
-      # finish previous expression first
-      
-      # to "give operator back"
-      self.position = position_before_grouping_operator
-
-      # continue parsing operations with base_expression
-      if base_expression: 
-        return self.parse_expression(base_expression, BASE_PRECEDENCE, *terminators)
-      
-      # finish previous expression with passed tokens
-      return self.parse_expression_from_tokens(passed_tokens)
-
-    # handle association operations
-    if is_association_operator(operator):
-      # initialize entries
-      entries: list[tuple[Expression, Expression]] = []
+        base_expression = GroupingApplicationExpression(left, grouping_expression)
+        base_precedence = precedence
+        continue
+
+      # handle association operations
+      # previous tokens are not used
+      base_expression = yield from self.generate_association_expression()
+      base_precedence = precedence
+
+  # generates expressions of group until closing token
+  # opening operator is consumed
+  def generate_grouping_expression(self, operator: Token, *terminators: Token):
+    # get closing token - terminator
+    closing_operator = get_grouping_operator_closing_token(operator)
+    # add new terminators
+    # duplicates are removed, so terminators of nested groups do not grow with depth
+    grouping_terminators = list(dict.fromkeys([*terminators, COMMA_TOKEN, closing_operator]))
+
+    # start list of grouped expressions
+    expressions: list[Expression] = []
+
+    # parse expressions until reach closing operator
+    while not self.match_token(closing_operator):
+      # require comma separator
+      if len(expressions):
+        self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
 
-      while not self.match_token(RIGHT_CURLY_BRACE_TOKEN):
-        # require comma separator
-        if len(entries):
-          self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
+        self.require_token(COMMA_TOKEN)
+        self.consume_current_token()
 
-          self.require_token(COMMA_TOKEN)
-          self.consume_current_token()
-          
         self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
 
-        if self.match_token(RIGHT_CURLY_BRACE_TOKEN):
+        if self.match_token(closing_operator):
           self.consume_current_token()
           break
 
-        # parse key expression
-        # search until association closing or colon
-        key_expression = self.parse_expression(None, BASE_PRECEDENCE, RIGHT_CURLY_BRACE_TOKEN, COLON_TOKEN)
+      # add found expression
+      expressions.append((yield (None, BASE_PRECEDENCE, *grouping_terminators)))
 
-        if is_expression_of_class(key_expression, NullExpression):
-          raise ParserError(self.get_current_token_position(), 'Invalid key expression')
+      self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
 
-        # require and consume colon
-        self.require_token(COLON_TOKEN)
-        self.consume_current_token()
+    # validate expressions
+    if len(expressions):
+      # do not check last expression (trailing commas are allowed)
+      for i in range(len(expressions) - 1):
+        if is_expression_of_class(expressions[i], NullExpression):
+          raise ParserError(self.get_current_token_position(), 'Incorrect expression in group')
+        
+      # remove last NullExpression (trailing comma case)
+      if is_expression_of_class(expressions[-1], NullExpression):
+        expressions.pop()
 
-        # parse value expression
-        # search until association closing or comma
-        value_expression = self.parse_expression(None, BASE_PRECEDENCE, RIGHT_CURLY_BRACE_TOKEN, COMMA_TOKEN)
+    # consume closing token
+    self.consume_current_token()
 
-        if is_expression_of_class(value_expression, NullExpression):
-          raise ParserError(self.get_current_token_position(), 'Invalid value expression')
+    return GroupingExpression(operator, expressions)
 
-        # append entry
-        entries.append((key_expression, value_expression))
+  # generates entries of association until closing token
+  # opening operator is consumed
+  def generate_association_expression(self):
+    # initialize entries
+    entries: list[tuple[Expression, Expression]] = []
 
+    while not self.match_token(RIGHT_CURLY_BRACE_TOKEN):
+      # require comma separator
+      if len(entries):
         self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
 
-      # validate expressions
-      if len(entries):
-        # do not check last expression (trailing commas are allowed)
-        for i in range(len(entries) - 1):
-          if is_expression_of_class(entries[i], NullExpression):
-            raise ParserError(self.get_current_token_position(), 'Incorrect expression in group')
-          
-        # remove last NullExpression (trailing comma case)
-        if is_expression_of_class(entries[-1], NullExpression):
-          entries.pop()
-      
-      # compose association
-      expression = AssociationExpression(entries)
+        self.require_token(COMMA_TOKEN)
+        self.consume_current_token()
+        
+      self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
+
+      # closing brace is consumed after loop
+      if self.match_token(RIGHT_CURLY_BRACE_TOKEN):
+        break
 
-      # continue parsing
-      return self.parse_expression(expression, precedence, *terminators)
+      # parse key expression
+      # search until association closing or colon
+      key_expression = yield (None, BASE_PRECEDENCE, RIGHT_CURLY_BRACE_TOKEN, COLON_TOKEN)
+
+      if is_expression_of_class(key_expression, NullExpression):
+        raise ParserError(self.get_current_token_position(), 'Invalid key expression')
+
+      # require and consume colon
+      self.require_token(COLON_TOKEN)
+      self.consume_current_token()
+
+      # parse value expression
+      # search until association closing or comma
+      value_expression = yield (None, BASE_PRECEDENCE, RIGHT_CURLY_BRACE_TOKEN, COMMA_TOKEN)
+
+      if is_expression_of_class(value_expression, NullExpression):
+        raise ParserError(self.get_current_token_position(), 'Invalid value expression')
+
+      # append entry
+      entries.append((key_expression, value_expression))
+
+      self.skip_tokens(SPACE_TOKEN, NEWLINE_TOKEN)
+
+    # consume closing brace (loop is not entered for empty object without spaces)
+    self.require_token(RIGHT_CURLY_BRACE_TOKEN)
+    self.consume_current_token()
+
+    # validate expressions
+    if len(entries):
+      # do not check last expression (trailing commas are allowed)
+      for i in range(len(entries) - 1):
+        if is_expression_of_class(entries[i], NullExpression):
+          raise ParserError(self.get_current_token_position(), 'Incorrect expression in group')
+        
+      # remove last NullExpression (trailing comma case)
+      if is_expression_of_class(entries[-1], NullExpression):
+        entries.pop()
+    
+    # compose association
+    return AssociationExpression(entries)
 
   # parses expression from limited set of tokens
   def parse_expression_from_tokens(self, tokens: list[Token]):
@@ -874,6 +920,10 @@ class Parser:
     if not self.match_token(token):
       raise ParserError(self.get_current_token_position(), f'Expected token {token}. Received {current}')
     
+  # checks if current token is operator. Returns bool
+  def match_operator(self):
+    return not self.is_end() and is_operator(self.get_current_token())
+
   # checks current token. Returns bool
   # receives tokens
   def match_token(self, *tokens):
@@ -892,6 +942,10 @@ class Parser:
   
   # to skip spaces until gets meaningful token
   def skip_tokens(self, *tokens: Token):
+    # tokens without trivia have no spaces
+    if not self.trivia and len(tokens) == 1 and tokens[0] is SPACE_TOKEN:
+      return
+
     # while current token is in tokens list
     while self.match_token(*tokens):
       # move position forward
@@ -912,11 +966,11 @@ class Parser:
   
   # returns current token
   def get_current_token(self):
-    return self.tokens[self.position]
+    return self.tokens.get_token(self.position)
   
   # returns previous token
   def get_previous_token(self):
-    return self.tokens[self.position - 1]
+    return self.tokens.get_token(self.position - 1)
 
   # get position
   def get_current_token_position(self):
@@ -930,13 +984,13 @@ class Parser:
   def decrement_position(self):
     self.position -= 1 
 
-  # indicates end of token list
+  # indicates end of token stream
   def is_end(self):
-    return self.position >= len(self.tokens)
+    return self.tokens.is_end(self.position)
 
   # Helper methods to handle data attributes
 
   # loader
-  def load_tokens(self, tokens: list[Token]):
-    self.tokens = tokens
+  def load_tokens(self, tokens: Iterable[Token]):
+    self.tokens = TokenStream(tokens)
     self.position = 0
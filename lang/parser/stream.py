@@ -0,0 +1,43 @@
+from lexer.token import Token
+
+from typing import Iterable
+
+# lookahead buffer over lazily generated tokens
+# tokens are pulled from iterable only when parser reaches them
+# positions are absolute (counted from the first token of module)
+class TokenStream:
+  def __init__(self, tokens: Iterable[Token]):
+    # source of tokens
+    self.iterator = iter(tokens)
+    # pulled tokens that can still be accessed
+    self.buffer: list[Token] = []
+    # absolute position of first buffered token
+    self.offset = 0
+    # flag that indicates that source has no more tokens
+    self.is_exhausted = False
+
+  # returns token by absolute position
+  def get_token(self, position: int) -> Token:
+    self.fill(position)
+    return self.buffer[position - self.offset]
+
+  # indicates that there is no token by absolute position
+  def is_end(self, position: int) -> bool:
+    self.fill(position)
+    return position - self.offset >= len(self.buffer)
+
+  # drops tokens before absolute position
+  # parser never returns to released tokens
+  def release(self, position: int):
+    del self.buffer[:position - self.offset]
+    self.offset = position
+
+  # pulls tokens from source until position is buffered or source is exhausted
+  def fill(self, position: int):
+    while not self.is_exhausted and position - self.offset >= len(self.buffer):
+      token = next(self.iterator, None)
+
+      if token is None:
+        self.is_exhausted = True
+      else:
+        self.buffer.append(token)
@@ -4,20 +4,22 @@ from parser.types.node import Node
 # parent class for all expressions
 # has no behavior
 class Expression(Node):
-  pass
+  __slots__ = ()
 
 # for expression fallback
 # use to indicate lack of optional expression
 class NullExpression(Expression):
-  pass
+  __slots__ = ()
 
 # parent class for operations
 # has no behavior
 class OperationExpression(Expression): 
-  pass
+  __slots__ = ()
 
 # define types of unary operation
 class UnaryOperationExpression(OperationExpression):
+  __slots__ = ('operator', 'operand')
+
   def __init__(self, operator: Token, operand: Expression):
     super().__init__()
 
@@ -26,21 +28,29 @@ class UnaryOperationExpression(OperationExpression):
 
 # for prefix unary operations
 class PrefixUnaryOperationExpression(UnaryOperationExpression):
+  __slots__ = ()
+
   def __init__(self, operator: Token, operand: Expression):
     super().__init__(operator, operand)
 
 # for suffix unary operations
 class SuffixUnaryOperationExpression(UnaryOperationExpression):
+  __slots__ = ()
+
   def __init__(self, operator: Token, operand: Expression):
     super().__init__(operator, operand)
 
 # for either prefix or suffix (affix)
 class AffixUnaryOperationExpression(UnaryOperationExpression):
+  __slots__ = ()
+
   def __init__(self, operator: Token, operand: Expression):
     super().__init__(operator, operand)
 
 # defines binary operations
 class BinaryOperationExpression(OperationExpression):
+  __slots__ = ('operator', 'left', 'right')
+
   def __init__(self, operator: Token, left: Expression, right: Expression):
     super().__init__()
 
@@ -50,21 +60,39 @@ class BinaryOperationExpression(OperationExpression):
 
 # for strings and numbers
 class LiteralExpression(Expression):
+  __slots__ = ('value',)
+
   def __init__(self, value: Token):
     super().__init__()
 
     self.value = value
 
+# for values computed before execution (by Optimizer)
+# value is Python value of literal or folded expression
+class ConstantExpression(Expression):
+  __slots__ = ('value',)
+
+  def __init__(self, value):
+    super().__init__()
+
+    self.value = value
+
 # for accessing/writing to identifiers
+# address is (depth, slot) of declaration (see ScopeResolver)
 class IdentifierExpression(Expression):
+  __slots__ = ('name', 'address')
+
   def __init__(self, name: Token):
     super().__init__()
 
     self.name = name
+    self.address: tuple[int, int] | None = None
 
 # for grouping expressions
 # handle (), [] etc.
 class GroupingExpression(Expression):
+  __slots__ = ('operator', 'expressions')
+
   def __init__(self, operator: Token, expressions: list[Expression]):
     super().__init__()
 
@@ -74,6 +102,8 @@ class GroupingExpression(Expression):
 # for handling function calls and array indexing
 # has to explicit operator and specifies right side
 class GroupingApplicationExpression(Expression):
+  __slots__ = ('left', 'right')
+
   def __init__(self, left: Expression, right: GroupingExpression):
     super().__init__()
 
@@ -83,6 +113,8 @@ class GroupingApplicationExpression(Expression):
 # for association (hashmap) expressions
 # represents { a: 1, b: 2, c: 3 } maps
 class AssociationExpression(Expression):
+  __slots__ = ('entries',)
+
   def __init__(self, entries: list[tuple[Expression, Expression]]):
     super().__init__()
 
@@ -90,6 +122,8 @@ class AssociationExpression(Expression):
 
 # to be used only in functions
 class FunctionParameterExpression(Expression):
+  __slots__ = ('name', 'defaultValue')
+
   def __init__(self, name: Token, defaultValue: Expression):
     super().__init__()
 
@@ -1,3 +1,4 @@
 # this class is parent to statement and expression
+# nodes use __slots__ (no instance dictionary), so AST is compact and attribute access is fast
 class Node:
-  pass
\ No newline at end of file
+  __slots__ = ()
@@ -5,42 +5,57 @@ from parser.types.expressions import *
 # parent class for all statements
 # has no behavior
 class Statement(Node):
-  pass
+  __slots__ = ()
 
 # handles standalone expression as statement
 class ExpressionStatement(Statement):
+  __slots__ = ('expression',)
+
   def __init__(self, expression: Expression):
     super().__init__()
 
     self.expression = expression
 
 # defines block of statements 
+# size is amount of slots in scope of block (see ScopeResolver)
 class BlockStatement(Statement):
+  __slots__ = ('statements', 'size')
+
   def __init__(self, statements: list[Statement] = []):
     super().__init__()
 
     self.statements = statements
+    self.size = 0
 
 # defines statement of variable declaration
 # can be used without initialization
+# slot is index of variable in its scope (see ScopeResolver)
 class VariableDeclarationStatement(Statement):
+  __slots__ = ('name', 'initialization', 'slot')
+
   def __init__(self, name: Token, initialization: Expression):
     super().__init__()
 
     self.name = name
     self.initialization = initialization
+    self.slot = 0
 
 # defines statement for constant declaration
 class ConstantDeclarationStatement(Statement):
+  __slots__ = ('name', 'initialization', 'slot')
+
   def __init__(self, name: Token, initialization: Expression):
     super().__init__()
 
     self.name = name
     self.initialization = initialization
+    self.slot = 0
 
 # defines statement for if/else
 # statement for branches allow using single line branches and "else if"
 class ConditionStatement(Statement):
+  __slots__ = ('condition', 'then_branch', 'else_branch')
+
   def __init__(self, condition: Expression, then_branch: Statement, else_branch: Statement = None):
     super().__init__()
     
@@ -50,6 +65,8 @@ class ConditionStatement(Statement):
 
 # defines statement for while loop
 class WhileStatement(Statement):
+  __slots__ = ('condition', 'body')
+
   def __init__(self, condition: Expression, body: Statement):
     super().__init__()
 
@@ -57,7 +74,10 @@ class WhileStatement(Statement):
     self.body = body
 
 # defines statement for for loop
+# size is amount of slots in scope of loop
 class ForStatement(Statement):
+  __slots__ = ('initializer', 'condition', 'increment', 'body', 'size')
+
   def __init__(self, initializer: Statement, condition: Expression, increment: Expression, body: Statement):
     super().__init__()
 
@@ -65,28 +85,42 @@ class ForStatement(Statement):
     self.condition = condition
     self.increment = increment
     self.body = body
+    self.size = 0
 
 # define break statement
 class BreakStatement(Statement):
+  __slots__ = ()
+
   def __init__(self):
     super().__init__()
 
 # define continue statement
 class ContinueStatement(Statement):
+  __slots__ = ()
+
   def __init__(self):
     super().__init__()
 
 # defines statement of function declaration
+# slot is index of function in its scope, size is amount of slots in scope of parameters
+# captures are names and addresses of declarations from enclosing scopes that are used by function (see ScopeResolver)
 class FunctionDeclarationStatement(Statement):
+  __slots__ = ('name', 'params', 'body', 'slot', 'size', 'captures')
+
   def __init__(self, name: Token, params: list[FunctionParameterExpression], body: BlockStatement):
     super().__init__()
 
     self.name = name
     self.params = params
     self.body = body
+    self.slot = 0
+    self.size = 0
+    self.captures = ()
 
 # defines return statement
 class ReturnStatement(Statement):
+  __slots__ = ('returns',)
+
   def __init__(self, returns: Expression):
     super().__init__()
 
@@ -94,21 +128,29 @@ class ReturnStatement(Statement):
 
 # defines class statement
 class ClassDeclarationStatement(Statement):
+  __slots__ = ('name',)
+
   def __init__(self, name: Token):
     super().__init__()
 
     self.name = name
 
 # defines import statement 
+# slots maps imported names to their indexes in module scope
 class ImportStatement(Statement):
+  __slots__ = ('path', 'imports', 'slots')
+
   def __init__(self, path: Token, imports: list[Token]):
     super().__init__()
 
     self.path = path
     self.imports = imports
+    self.slots: dict[str, int] = {}
 
 # defines export statement
 class ExportStatement(Statement):
+  __slots__ = ('exports',)
+
   def __init__(self, exports: Statement):
     super().__init__()
 
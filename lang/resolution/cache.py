@@ -0,0 +1,122 @@
+from resolution.constants import *
+from resolution.serialization import *
+from parser.types.statements import BlockStatement
+from shared.version import *
+
+import hashlib
+import os
+
+# this class stores parsed ASTs of modules in cache directory
+# AST is stored in file named by hash of interpreter version and module content
+# so changed modules and ASTs of other interpreter versions are never loaded
+# total size of directory is limited, least recently used ASTs are removed first
+class Cache:
+  def __init__(self, directory: str, size_limit: int = CACHE_SIZE_LIMIT):
+    # ABSOLUTE path to cache directory
+    self.directory = directory
+    # maximal total size of cached ASTs (bytes)
+    self.size_limit = size_limit
+    # total size of cached ASTs counted since directory was scanned last time (None before first scan)
+    # other processes can store ASTs too, so directory is scanned again when counter exceeds the limit
+    self.size: int | None = None
+
+  # returns cache key of module by ABSOLUTE path
+  # file is hashed by chunks
+  def compute_key(self, path: str) -> str:
+    hash = hashlib.sha256(INTERPRETER_VERSION.encode())
+
+    with open(path, 'rb') as file:
+      while chunk := file.read(CACHE_HASH_CHUNK_SIZE):
+        hash.update(chunk)
+
+    return hash.hexdigest()
+
+  # returns path of cached AST file by key
+  def get_file_path(self, key: str) -> str:
+    return os.path.join(self.directory, f'{key}.{CACHE_FILE_EXTENSION}')
+
+  # returns cached AST by key
+  # returns None if AST is not cached
+  def get_ast(self, key: str) -> BlockStatement | None:
+    path = self.get_file_path(key)
+
+    try:
+      with open(path, 'rb') as file:
+        ast = load_ast(file.read())
+    except FileNotFoundError:
+      return None
+    # damaged file is removed and module is parsed again
+    except Exception:
+      self.remove_file(path)
+      return None
+
+    # modification time marks recently used files
+    os.utime(path)
+
+    return ast
+
+  # stores AST by key
+  # removes least recently used ASTs if size limit is exceeded
+  def set_ast(self, key: str, ast: BlockStatement):
+    path = self.get_file_path(key)
+
+    try:
+      content = dump_ast(ast)
+    # very deep AST cannot be serialized, module will be parsed next time
+    except RecursionError:
+      return
+
+    os.makedirs(self.directory, exist_ok=True)
+
+    # file is written under temporary name and replaced atomically
+    # several processes can store ASTs at the same time
+    temporary_path = f'{path}.{os.getpid()}.tmp'
+
+    with open(temporary_path, 'wb') as file:
+      file.write(content)
+
+    os.replace(temporary_path, path)
+
+    # directory is scanned once, then only when counted size exceeds the limit
+    if self.size is None:
+      self.evict()
+    else:
+      self.size += len(content)
+
+      if self.size > self.size_limit:
+        self.evict()
+
+  # removes least recently used ASTs if total size exceeds the limit
+  # part of limit is freed (see CACHE_EVICTION_RATIO), remaining size is counter of stored ASTs
+  def evict(self):
+    files = []
+
+    for entry in os.scandir(self.directory):
+      if entry.name.endswith(f'.{CACHE_FILE_EXTENSION}'):
+        # file can be removed by another process
+        try:
+          stat = entry.stat()
+        except FileNotFoundError:
+          continue
+
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+
+    size = sum(file_size for _, file_size, _ in files)
+    kept_size = self.size_limit * CACHE_EVICTION_RATIO if size > self.size_limit else size
+
+    # remove oldest files first
+    for _, file_size, path in sorted(files):
+      if size <= kept_size:
+        break
+
+      self.remove_file(path)
+      size -= file_size
+
+    self.size = size
+
+  # removes file if it exists
+  def remove_file(self, path: str):
+    try:
+      os.remove(path)
+    except FileNotFoundError:
+      pass
@@ -0,0 +1,102 @@
+from resolution.module import *
+from resolution.exceptions import *
+from resolution.constants import *
+from resolution.serialization import *
+from shared.version import *
+from shared.extensions import *
+
+import os
+import pickle
+import struct
+
+# compiled module file layout:
+# - header: magic, format version, interpreter version size, dependencies size
+# - interpreter version (UTF-8)
+# - dependency paths relative to module directory (UTF-8, separated by new line)
+# - serialized AST
+COMPILED_MODULE_HEADER = struct.Struct('>4sHHI')
+
+# returns path of compiled module by path of source module
+# compiled module is placed next to source module
+def get_compiled_module_path(path: str) -> str:
+  return f'{path[:-len(SOURCE_MODULE_EXTENSION)]}{COMPILED_MODULE_EXTENSION}'
+
+# writes compiled module file by ABSOLUTE path
+# module dependencies have to be resolved
+def write_compiled_module(module: Module, path: str):
+  directory = os.path.dirname(path)
+
+  version = INTERPRETER_VERSION.encode()
+  dependencies = '\n'.join(os.path.relpath(dependency, directory) for dependency in module.dependencies).encode()
+
+  try:
+    content = dump_ast(module.content)
+  # parser accepts deeper ASTs than serialization does
+  except RecursionError:
+    raise ModuleError(f'Module is too deep to be compiled. Received {module.path}')
+
+  with open(path, 'wb') as file:
+    file.write(COMPILED_MODULE_HEADER.pack(COMPILED_MODULE_MAGIC, COMPILED_MODULE_FORMAT_VERSION, len(version), len(dependencies)))
+    file.write(version)
+    file.write(dependencies)
+    file.write(content)
+
+# reads compiled module file by ABSOLUTE path
+# returns Module instance with resolved dependencies
+def read_compiled_module(path: str) -> Module:
+  with open(path, 'rb') as file:
+    content = file.read()
+
+  dependency_paths, offset = read_compiled_module_header(content, path)
+
+  # load AST (only AST classes are created, see ASTUnpickler)
+  try:
+    ast = load_ast(content[offset:])
+  except (pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError) as error:
+    raise ModuleError(f'Invalid compiled module ({error}). Received {path}')
+
+  return Module(path, dependency_paths, ast, compiled=True)
+
+# reads dependencies of compiled module file by ABSOLUTE path
+# AST is not read and loaded
+def read_compiled_module_dependencies(path: str) -> list[str]:
+  with open(path, 'rb') as file:
+    header = file.read(COMPILED_MODULE_HEADER.size)
+
+    if len(header) < COMPILED_MODULE_HEADER.size:
+      raise ModuleError(f'Invalid compiled module. Received {path}')
+
+    _, _, version_size, dependencies_size = COMPILED_MODULE_HEADER.unpack(header)
+    content = header + file.read(version_size + dependencies_size)
+
+  dependency_paths, _ = read_compiled_module_header(content, path)
+
+  return dependency_paths
+
+# checks header and interpreter version of compiled module content
+# returns ABSOLUTE dependency paths and offset of serialized AST
+def read_compiled_module_header(content: bytes, path: str) -> tuple[list[str], int]:
+  directory = os.path.dirname(path)
+
+  # check header
+  if len(content) < COMPILED_MODULE_HEADER.size:
+    raise ModuleError(f'Invalid compiled module. Received {path}')
+
+  magic, format_version, version_size, dependencies_size = COMPILED_MODULE_HEADER.unpack_from(content)
+
+  if magic != COMPILED_MODULE_MAGIC or format_version != COMPILED_MODULE_FORMAT_VERSION:
+    raise ModuleError(f'Invalid compiled module. Received {path}')
+
+  # check interpreter version
+  offset = COMPILED_MODULE_HEADER.size
+  version = content[offset:offset + version_size].decode()
+
+  if version != INTERPRETER_VERSION:
+    raise ModuleError(f'Compiled module is created by interpreter version {version}. Received {path}')
+
+  # resolve dependencies
+  offset += version_size
+  dependencies = content[offset:offset + dependencies_size].decode()
+  dependency_paths = [os.path.realpath(os.path.join(directory, dependency)) for dependency in dependencies.split('\n') if dependency]
+
+  return dependency_paths, offset + dependencies_size
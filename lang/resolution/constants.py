@@ -0,0 +1,22 @@
+# name of directory (inside of working directory) that stores cached ASTs
+CACHE_DIRECTORY_NAME = '.breeze_cache'
+
+# extension of cached AST files
+CACHE_FILE_EXTENSION = 'ast'
+
+# maximal total size (bytes) of cached ASTs
+# least recently used ASTs are removed when limit is exceeded
+CACHE_SIZE_LIMIT = 64 * 1024 * 1024
+
+# part of size limit that is kept when ASTs are removed
+# the rest is free, so directory is not scanned again for every stored AST
+CACHE_EVICTION_RATIO = 0.75
+
+# amount of bytes read from file at once during hashing
+CACHE_HASH_CHUNK_SIZE = 64 * 1024
+
+# first bytes of compiled module file
+COMPILED_MODULE_MAGIC = b'BRC\0'
+
+# version of compiled module file layout
+COMPILED_MODULE_FORMAT_VERSION = 1
@@ -0,0 +1,52 @@
+from lexer.escapes import *
+from shared.tokens import *
+from shared.keywords import *
+
+import re
+
+# pattern of import statement head (the same forms as Parser accepts):
+# import from 'path', import * from 'path', import { names } from 'path'
+IMPORT_STATEMENT_PATTERN = (
+  rf'(?<![\w]){IMPORT_KEYWORD}(?![\w])'
+  r'(?:\s*(?:\*|\{[^}]*\}))?'
+  rf'\s*(?<![\w]){FROM_KEYWORD}(?![\w])\s*'
+  rf'(?P<path>{STRING_TOKEN[1]})'
+)
+
+# single pattern that finds import statements and everything that changes nesting of code
+# comments and string literals are matched to skip brackets and keywords inside of them
+# other code is skipped by search without tokens being created
+IMPORT_SCAN_PATTERN = re.compile(
+  rf'(?P<import>{IMPORT_STATEMENT_PATTERN})'
+  rf'|(?P<comment>{COMMENT_TOKEN[1]}[^\n]*)'
+  rf'|(?P<string>{STRING_TOKEN[1]})'
+  r'|(?P<open>[\{\(\[])'
+  r'|(?P<close>[\}\)\]])'
+)
+
+# returns import paths (as written in code) of top-level import statements in order of statements
+# code is not lexed and parsed, so it is used to discover dependencies before ASTs are created
+# invalid code is not reported (Parser reports it when module is parsed)
+def scan_import_paths(code: str) -> list[str]:
+  paths = []
+
+  # nesting level of brackets (top-level statements have zero depth)
+  depth = 0
+
+  for match in IMPORT_SCAN_PATTERN.finditer(code):
+    kind = match.lastgroup
+
+    if kind == 'open':
+      depth += 1
+    elif kind == 'close':
+      depth -= 1
+    elif kind == 'import' and not depth:
+      # remove quotes and decode escapes as Lexer does
+      path = match.group('path')[1:-1]
+
+      try:
+        paths.append(decode_escapes(path))
+      except UnicodeDecodeError:
+        continue
+
+  return paths
@@ -3,10 +3,12 @@ from parser.types.statements import BlockStatement
 # this class represents independent module of the app
 # modules are files
 class Module:
-  def __init__(self, path: str, dependencies: list[str], content: BlockStatement):
+  def __init__(self, path: str, dependencies: list[str], content: BlockStatement, compiled: bool = False):
     # absolute path of current module (ID)
     self.path = path
     # absolute paths to dependencies
     self.dependencies = dependencies
     # parsed AST of the module
     self.content = content
+    # flag that indicates that module is loaded from compiled file (dependencies are already resolved)
+    self.compiled = compiled
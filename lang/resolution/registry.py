@@ -1,11 +1,17 @@
 from resolution.module import *
 from resolution.exceptions import *
 
+import heapq
+
 # this class is used to contain application modules (files)
 # it provides utils for topological sort based on dependencies
 class Registry:
   def __init__(self):
     self.modules: list[Module] = []
+    # maps ABSOLUTE paths to modules
+    self.modules_by_path: dict[str, Module] = {}
+    # maps ABSOLUTE paths to paths of modules that import them (graph for topological sort)
+    self.dependents: dict[str, list[str]] = {}
 
   # adds new module to storage if it was NOT added earlier
   # add modules with computed dependencies list
@@ -17,106 +23,88 @@ class Registry:
     
     # append module
     self.modules.append(module)
+    self.modules_by_path[module.path] = module
+
+    # index edges of graph
+    for dependency in module.dependencies:
+      self.dependents.setdefault(dependency, []).append(module.path)
 
   # checks if module by ABSOLUTE path is already added to prevent duplicates
   def is_module_added_by_path(self, path: str):
     # search module with path
-    return bool(self.get_module_by_absolute_path(path))
+    return path in self.modules_by_path
 
   # returns stored module by its ABSOLUTE path
   # returns None if file is not found
   def get_module_by_absolute_path(self, path: str) -> Module | None:
-    # search for module by path
-    for module in self.modules:
-      if module.path == path:
-        return module
-      
-    # fallback      
-    return None
+    return self.modules_by_path.get(path)
 
   # returns list of modules
   def get_modules(self) -> list[Module]:
     return self.modules
 
-  # sorts modules topologically in place
+  # sorts modules topologically in place (Kahn's algorithm)
+  # module is ready when all its dependencies are sorted
+  # the earliest added ready module is taken first, so modules are sorted in the same order as depth-first search
+  # from entry point (dependencies in order of imports, modules are added in order of discovery)
   def sort_topologically(self):
-    # set of all module paths in registry
-    undiscovered: set[str] = set(map(lambda module: module.path, self.modules))
-    # set of module paths that are discovered but not analyzed
-    discovered = set()
-    # set of module paths that are analyzed 
-    analyzed = set()
+    # index of module in order of addition
+    indexes = {module.path: index for index, module in enumerate(self.modules)}
+    # amount of unsorted dependencies of every module
+    unsorted_dependencies: dict[str, int] = {}
+    # ready modules (heap of addition indexes)
+    ready: list[int] = []
+
+    for index, module in enumerate(self.modules):
+      for dependency in module.dependencies:
+        if dependency not in indexes:
+          raise ModuleError('Module was not accessible during topological sort')
+
+      unsorted_dependencies[module.path] = len(module.dependencies)
+
+      if not module.dependencies:
+        ready.append(index)
 
     # list of nodes in topologically sorted order
     sorted = []
 
-    # DFS algorithm iteration (recursive)
-    def depth_first_search(path: str):
-      # if path is analyzed
-      if path in analyzed:
-        # do not analyze this module again
-        return
-      
-      # if cycle is completed and depth-first search reached discovered node
-      if path in discovered:
-        raise ResolutionError(f'Circular dependency including module by path {path}')
-      
-      # discover node
-      undiscovered.remove(path)
-      discovered.add(path)
-      
-      # get module from current registry
-      module: Module = self.get_module_by_absolute_path(path)
-      if not module:
-        raise ModuleError('Module was not accessible during topological sort')
-
-      # discover all successors
-      # dependencies are paths
-      for dependency in module.dependencies:
-        depth_first_search(dependency)
+    while ready:
+      module = self.modules[heapq.heappop(ready)]
+      sorted.append(module)
 
-      # analyze node (all dependencies are analyzed)
-      discovered.remove(path)
-      analyzed.add(path)
+      # dependents are ready when their last dependency is sorted
+      for dependent in self.dependents.get(module.path, []):
+        unsorted_dependencies[dependent] -= 1
 
-      # add module to sorted
-      sorted.append(module)
+        if not unsorted_dependencies[dependent]:
+          heapq.heappush(ready, indexes[dependent])
 
-    # in_degree is needed to start DFS only from 0 in-degree nodes (requirement of algorithm)
-    modules_in_degree: list[int] = []
-
-    # compute in-degree for each module
-    for module in self.modules:
-      # compute in_degree
-      in_degree = 0
-
-      # analyze potential dependent modules
-      for dependent in self.modules:
-        # skip current module
-        if dependent.path == module.path:
-          continue
-        
-        # increment in_degree if needed
-        if module.path in dependent.dependencies:
-          in_degree += 1
-
-      modules_in_degree.append(in_degree)
-
-    # execute DFS
-    for module_index in range(len(self.modules)):
-      # check for zero in_degree
-      if modules_in_degree[module_index] == 0: 
-        # call DFS with PATH
-        depth_first_search(self.modules[module_index].path)
-
-    # check if DFS is executed
-    # if registry contains modules but no module was analyzed and added to sorted
-    # Indicates that every module has in-degree. It indicates Circular Dependency
-    if len(self.modules) and not len(sorted):
-      raise ResolutionError('Circular dependency in modules. Every module is dependent on others')
+    # modules that are not sorted depend on cycle
+    if len(sorted) != len(self.modules):
+      raise create_cycle_error(self.find_cycle(unsorted_dependencies))
 
     # update modules field with sorted modules
     self.modules = sorted
 
     return sorted
-  
\ No newline at end of file
+
+  # returns cycle of modules that are not sorted (the first path is repeated at the end)
+  # every unsorted module has unsorted dependency, so following them always reaches cycle
+  def find_cycle(self, unsorted_dependencies: dict[str, int]) -> list[str]:
+    # paths of walk and their positions
+    walk: list[str] = []
+    positions: dict[str, int] = {}
+
+    path = next(path for path, amount in unsorted_dependencies.items() if amount)
+
+    while path not in positions:
+      positions[path] = len(walk)
+      walk.append(path)
+
+      path = next(dependency for dependency in self.modules_by_path[path].dependencies if unsorted_dependencies[dependency])
+
+    return walk[positions[path]:] + [path]
+
+# returns error of circular dependency that names all modules of cycle
+def create_cycle_error(cycle: list[str]) -> ResolutionError:
+  return ResolutionError(f'Circular dependency of modules: {" -> ".join(cycle)}')
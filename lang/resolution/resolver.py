@@ -2,73 +2,136 @@ from resolution.module import *
 from resolution.registry import *
 from resolution.exceptions import *
 from resolution.aliases import *
+from resolution.cache import *
+from resolution.compiled import *
+from resolution.imports import *
+from optimizer.optimizer import *
 from parser.parser import *
 from lexer.lexer import *
 from shared.extensions import *
 
+from concurrent.futures import ProcessPoolExecutor
+
 import os
 import re
 
 # this class receives entry module path and gets all its dependencies recursively.
 # Instance has Lexer, Parser and Registry instances as fields to perform operations.
 # Instance has aliases field which is dictionary (str -> str)
+# Instance has mmap flag that specifies if module files are memory-mapped instead of read
+# Instance has workers field that specifies number of processes that parse modules (0 - no processes)
+# Instance has cache field (Cache or None) that stores parsed ASTs between runs
+# Instance has optimizer field (Optimizer or None) that optimizes ASTs of resolved modules
 # it provides modules being topologically sorted (based on their dependencies).
 # Topological sort is required to execute modules in correct order.
 # Circular dependencies are not allowed!
 class Resolver:
-  def __init__(self, aliases = dict()):
+  def __init__(self, aliases = dict(), mmap: bool = False, workers: int = 0, cache: Cache | None = None, optimizer: Optimizer | None = None):
     # instances required for operations
-    self.lexer = Lexer()
-    self.parser = Parser()
+    # spaces are not needed to build AST
+    self.lexer = Lexer(trivia=False)
+    self.parser = Parser(trivia=False)
     self.registry = Registry()
 
     # aliases dict
     self.aliases: dict = aliases
 
+    # memory-mapping flag
+    self.mmap = mmap
+
+    # number of worker processes
+    self.workers = workers
+
+    # AST cache
+    self.cache = cache
+
+    # AST optimizer
+    self.optimizer = optimizer
+
   # Step 1: Resolve module graph (dependency tree)
   # this method receives the ABSOLUTE path to entry point module
   # It recursively receives modules dependencies and adds them to Registry
   def resolve_modules(self, entrypoint: str):
     # initialize analyzed modules paths
     analyzed_paths = set()
-    # initialize currently analyzing modules paths
-    analyzing_paths = set()
-
-    # get module by ABSOLUTE path
-    # gets module dependencies
-    # continues search until tree is not searched
-    def search(path):
-      # do not search analyzed path again
-      if path in analyzed_paths:
-        return
 
-      # if this module is analyzing - Circular Dependency
-      if path in analyzing_paths:
-        raise ResolutionError(f'Circular dependency including module by path {path}')
+    # modules parsed by worker processes (path -> Module)
+    # search below is the same for both modes, so Registry order is deterministic
+    parsed_modules = self.parse_modules_in_parallel(entrypoint) if self.workers else dict()
 
-      # get module and dependency paths
-      module = self.get_module_by_absolute_path(path)
-      dependencies = self.get_module_dependency_paths(module)
+    # gets module by ABSOLUTE path and adds it to registry
+    # returns iterator of module dependencies
+    def discover(path):
+      module = parsed_modules[path] if path in parsed_modules else self.parse_module_by_absolute_path(path)
 
-      # set module dependency paths
-      module.dependencies = dependencies
-      
       # add resolved module in registry
       self.registry.add_module(module)
 
+      return iter(module.dependencies)
+
+    # depth-first search with explicit stack, so long chains of imports do not hit recursion limit
+    # stack contains currently analyzing modules paths and iterators of their dependencies
+    # (paths of stack are the chain of imports from entry point)
+    analyzing_paths = [entrypoint]
+    dependencies_stack = [discover(entrypoint)]
+    # positions of analyzing paths in stack
+    analyzing_positions = { entrypoint: 0 }
+
+    while dependencies_stack:
+      dependency = next(dependencies_stack[-1], None)
+
+      # make path analyzed when all dependencies are searched
+      if dependency is None:
+        path = analyzing_paths.pop()
+        dependencies_stack.pop()
+
+        del analyzing_positions[path]
+        analyzed_paths.add(path)
+        continue
+
+      # do not search analyzed path again
+      if dependency in analyzed_paths:
+        continue
+
+      # if this module is analyzing - Circular Dependency
+      if dependency in analyzing_positions:
+        raise create_cycle_error(analyzing_paths[analyzing_positions[dependency]:] + [dependency])
+
       # make path currently analyzing
-      analyzing_paths.add(path)
+      analyzing_positions[dependency] = len(analyzing_paths)
+      analyzing_paths.append(dependency)
+      dependencies_stack.append(discover(dependency))
+
+  # discovers dependency tree from entry point without parsing modules (see scan_import_paths)
+  # returns dict (ABSOLUTE path -> dependency paths)
+  def discover_modules(self, entrypoint: str) -> dict[str, list[str]]:
+    graph = dict()
+    # paths of modules to scan
+    pending = [entrypoint]
+
+    while pending:
+      path = pending.pop()
+
+      if path in graph:
+        continue
+
+      graph[path] = self.scan_module_dependency_paths(path)
+      pending.extend(graph[path])
 
-      # search dependencies
-      for dependency in dependencies:
-        search(dependency)
+    return graph
 
-      # make path analyzed
-      analyzing_paths.remove(path)
-      analyzed_paths.add(path)
+  # parses all modules of dependency tree in worker processes
+  # the whole tree is discovered by scanning imports, so every module is submitted before any module is parsed
+  # returns dict (path -> Module), dependencies of modules are set from ASTs
+  # (module missed by scanning is parsed during search in resolve_modules)
+  def parse_modules_in_parallel(self, entrypoint: str) -> dict[str, Module]:
+    paths = self.discover_modules(entrypoint)
 
-    # start search from entry point
-    search(entrypoint)
+    with ProcessPoolExecutor(self.workers, initializer=initialize_worker, initargs=(self.aliases, self.mmap, self.cache, self.optimizer)) as executor:
+      # errors of worker are raised here
+      modules = executor.map(parse_module_in_worker, paths)
+
+      return {module.path: module for module in modules}
 
   # Step 2: Topological sort of modules graph
   # this method sorts modules in place and returns the sorted list
@@ -108,28 +171,88 @@ class Resolver:
 
   # receives the ABSOLUTE path 
   # returns Module instance
-  # does NOT parse dependencies
+  # does NOT parse dependencies (compiled module has them resolved)
   def get_module_by_absolute_path(self, path: str) -> Module:
-    # get file content
-    content = self.read_module_by_absolute_path(path)
+    # source module can be shipped as compiled module
+    file_path = self.get_module_file_path(path)
+
+    # check module file
+    self.validate_module_path(file_path, (SOURCE_MODULE_EXTENSION, COMPILED_MODULE_EXTENSION))
+
+    # load compiled module
+    # module path is kept as requested, because imports are resolved by it
+    if file_path.endswith(f'.{COMPILED_MODULE_EXTENSION}'):
+      module = read_compiled_module(file_path)
+      module.path = path
+      module.content = self.optimize_ast(module.content)
+
+      return module
 
-    # parse module content
-    tokens = self.lexer.parse(content)
-    ast = self.parser.parse(tokens)
+    # load cached AST if module content is not changed
+    if self.cache:
+      key = self.cache.compute_key(path)
+      ast = self.cache.get_ast(key)
+
+      if ast is None:
+        ast = self.parse_module_file(path)
+        self.cache.set_ast(key, ast)
+    else:
+      ast = self.parse_module_file(path)
 
     # return parsed module
     # leave dependencies as empty list until they are parsed
-    return Module(path, [], ast)    
+    return Module(path, [], self.optimize_ast(ast))
+
+  # optimizes AST if optimizer is set
+  # cached ASTs are not optimized, so optimization does not change cache keys
+  def optimize_ast(self, ast: BlockStatement) -> BlockStatement:
+    return self.optimizer.optimize(ast) if self.optimizer else ast
+
+  # parses module file by ABSOLUTE path
+  # returns AST of module
+  def parse_module_file(self, path: str) -> BlockStatement:
+    # tokens are generated lazily while file is read and parser consumes them
+    # memory-mapped file is lexed as bytes, so decoded copy of content is not created
+    if self.mmap:
+      with open(path, "rb") as file:
+        tokens = self.lexer.map(file)
+        return self.parser.parse(tokens)
+
+    with open(path, "r", encoding="utf-8") as file:
+      tokens = self.lexer.stream(file)
+      return self.parser.parse(tokens)
+
+  # receives the ABSOLUTE path
+  # returns Module instance with dependency paths
+  def parse_module_by_absolute_path(self, path: str) -> Module:
+    module = self.get_module_by_absolute_path(path)
+
+    if not module.compiled:
+      module.dependencies = self.get_module_dependency_paths(module)
+
+    return module
+
+  # returns ABSOLUTE path of file that contains module
+  # compiled module is used if source module file does not exist
+  def get_module_file_path(self, path: str) -> str:
+    if path.endswith(f'.{SOURCE_MODULE_EXTENSION}') and not os.path.isfile(path):
+      compiled_path = get_compiled_module_path(path)
+
+      if os.path.isfile(compiled_path):
+        return compiled_path
+
+    return path
 
   # returns list of dependency absolute paths 
   # does not return duplicated dependencies
+  # dependencies keep order of import statements
   # based on IMPORT statements
   def get_module_dependency_paths(self, module: Module) -> list[str]:
     # extract statements from module
     statements = module.content.statements
 
-    # dependency paths set to prevent duplicates
-    dependencies = set()
+    # dependency paths dict to prevent duplicates (keys keep insertion order)
+    dependencies = dict()
 
     # get import statements
     # check only first-level statements
@@ -149,13 +272,41 @@ class Resolver:
         absolute_path = self.resolve_absolute_path(module.path, relative_path)
 
         # add module
-        dependencies.add(absolute_path)
+        dependencies[absolute_path] = True
 
     # return dependency paths list
     return list(dependencies)
 
+  # receives the ABSOLUTE path
+  # returns list of dependency absolute paths found without parsing module (see scan_import_paths)
+  # dependencies keep order of import statements
+  def scan_module_dependency_paths(self, path: str) -> list[str]:
+    file_path = self.get_module_file_path(path)
+
+    # compiled module has resolved dependencies in header
+    if file_path.endswith(f'.{COMPILED_MODULE_EXTENSION}'):
+      self.validate_module_path(file_path, (COMPILED_MODULE_EXTENSION,))
+      return read_compiled_module_dependencies(file_path)
+
+    # dependency paths dict to prevent duplicates (keys keep insertion order)
+    dependencies = dict()
+
+    for relative_path in scan_import_paths(self.read_module_by_absolute_path(path)):
+      dependencies[self.resolve_absolute_path(path, relative_path)] = True
+
+    return list(dependencies)
+
   # get module content (str) by ABSOLUTE path
   def read_module_by_absolute_path(self, path: str) -> str:
+    # check module file
+    self.validate_module_path(path, (SOURCE_MODULE_EXTENSION,))
+
+    # read file content
+    with open(path, "r", encoding="utf-8") as file:
+      return file.read()
+
+  # checks that ABSOLUTE path leads to module file with one of extensions
+  def validate_module_path(self, path: str, extensions: tuple[str, ...]):
     # check for path to be ABSOLUTE
     if not os.path.isabs(path):
       raise PathError(f"Absolute path expected. Received {path}")
@@ -165,9 +316,18 @@ class Resolver:
       raise ModuleError(f"Invalid module path. Received {path}")
     
     # check file extension
-    if not path.endswith(f'.{SOURCE_MODULE_EXTENSION}'):
+    if not path.endswith(tuple(f'.{extension}' for extension in extensions)):
       raise ModuleError(f'Invalid module extension. Received {path}')
-    
-    # read file content
-    with open(path, "r", encoding="utf-8") as file:
-      return file.read()
+
+# resolver instance of worker process
+worker_resolver: Resolver | None = None
+
+# creates resolver instance when worker process is started
+def initialize_worker(aliases: dict, mmap: bool, cache: Cache | None, optimizer: Optimizer | None):
+  global worker_resolver
+  worker_resolver = Resolver(aliases, mmap, cache=cache, optimizer=optimizer)
+
+# parses module by ABSOLUTE path in worker process
+# returned module is pickled and sent to main process
+def parse_module_in_worker(path: str) -> Module:
+  return worker_resolver.parse_module_by_absolute_path(path)
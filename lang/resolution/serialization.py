@@ -0,0 +1,46 @@
+from parser.types.statements import BlockStatement
+
+import gc
+import io
+import pickle
+
+# modules of classes that AST consists of (nodes, tokens and their positions)
+AST_MODULES = frozenset([
+  'parser.types.node',
+  'parser.types.statements',
+  'parser.types.expressions',
+  'lexer.token',
+  'shared.position',
+])
+
+# unpickler that creates only classes of AST
+# serialized AST can be received from other machine (compiled module), and pickle can call any importable callable,
+# so classes of other modules (and functions of AST modules) are rejected
+class ASTUnpickler(pickle.Unpickler):
+  def find_class(self, module: str, name: str):
+    if module in AST_MODULES and '.' not in name:
+      value = super().find_class(module, name)
+
+      # names imported into AST modules are rejected too
+      if isinstance(value, type) and value.__module__ == module:
+        return value
+
+    raise pickle.UnpicklingError(f'{module}.{name} is not allowed in serialized AST')
+
+# serializes AST to bytes
+# raises RecursionError for very deep AST
+def dump_ast(ast: BlockStatement) -> bytes:
+  return pickle.dumps(ast, pickle.HIGHEST_PROTOCOL)
+
+# deserializes AST from bytes
+# raises pickle.UnpicklingError if content has objects that are not part of AST
+# garbage collector is paused, because AST loading creates a lot of objects without cycles
+def load_ast(content: bytes) -> BlockStatement:
+  is_gc_enabled = gc.isenabled()
+  gc.disable()
+
+  try:
+    return ASTUnpickler(io.BytesIO(content)).load()
+  finally:
+    if is_gc_enabled:
+      gc.enable()
@@ -0,0 +1,185 @@
+from scopes.scope import *
+
+from interpreter.exceptions import *
+
+from parser.types.statements import *
+from parser.types.expressions import *
+
+from lexer.token import *
+
+from shared.tokens import *
+
+# resolves identifiers of module to addresses of their declarations before module is executed
+# every declaration gets slot in its scope and every identifier gets address (depth, slot),
+# where depth is amount of scopes between identifier and declaration
+# scopes are the same as scopes created by engines: module, block, for loop and function parameters
+# function scopes are enclosed by scope of captures instead of scope where function is declared (see Environment)
+# (branches of conditions and loops without block are executed in current scope)
+# raises NameError if identifier is not declared in any enclosing scope
+# AST is changed in place
+class ScopeResolver:
+  def __init__(self, builtins: StaticScope, get_imported_names):
+    # scope of builtins (parent of module scope)
+    self.builtins = builtins
+    # callable that returns names imported by import statement
+    self.get_imported_names = get_imported_names
+
+  # resolves module AST
+  # amount of slots of module scope is saved to AST
+  def resolve_module(self, ast: BlockStatement):
+    scope = StaticScope(self.builtins)
+
+    self.resolve_scope_statements(ast.statements, scope)
+    ast.size = scope.size
+
+  # resolve statements
+
+  # resolves statements of new scope
+  # declarations of scope are found first, because function can use declarations that follow it
+  # (and identifier can be resolved to declaration that is not executed yet, see Stack.get_container_by_address)
+  def resolve_scope_statements(self, statements: list[Statement], scope: StaticScope):
+    for statement in statements:
+      self.declare_statement(statement, scope)
+
+    for statement in statements:
+      self.resolve_statement(statement, scope)
+
+  # declares names of statement in scope
+  # statements that create their own scopes are skipped
+  def declare_statement(self, statement: Statement, scope: StaticScope):
+    if is_statement_of_class(statement, VariableDeclarationStatement, ConstantDeclarationStatement, FunctionDeclarationStatement):
+      statement.slot = scope.declare(statement.name.code)
+    elif is_statement_of_class(statement, ImportStatement):
+      statement.slots = {name: scope.declare(name) for name in self.get_imported_names(statement)}
+    elif is_statement_of_class(statement, ExportStatement):
+      self.declare_statement(statement.exports, scope)
+    elif is_statement_of_class(statement, ConditionStatement):
+      self.declare_statement(statement.then_branch, scope)
+
+      if statement.else_branch:
+        self.declare_statement(statement.else_branch, scope)
+    elif is_statement_of_class(statement, WhileStatement):
+      self.declare_statement(statement.body, scope)
+
+  # this methods delegates resolution based on statement type
+  def resolve_statement(self, statement: Statement, scope: StaticScope):
+    if is_statement_of_class(statement, ExpressionStatement):
+      return self.resolve_expression(statement.expression, scope)
+    if is_statement_of_class(statement, BlockStatement):
+      return self.resolve_block_statement(statement, scope)
+    if is_statement_of_class(statement, VariableDeclarationStatement, ConstantDeclarationStatement):
+      return self.resolve_declaration_statement(statement, scope)
+    if is_statement_of_class(statement, ConditionStatement):
+      return self.resolve_condition_statement(statement, scope)
+    if is_statement_of_class(statement, WhileStatement):
+      return self.resolve_while_statement(statement, scope)
+    if is_statement_of_class(statement, ForStatement):
+      return self.resolve_for_statement(statement, scope)
+    if is_statement_of_class(statement, FunctionDeclarationStatement):
+      return self.resolve_function_declaration_statement(statement, scope)
+    if is_statement_of_class(statement, ReturnStatement):
+      return self.resolve_expression(statement.returns, scope)
+    if is_statement_of_class(statement, ExportStatement):
+      return self.resolve_statement(statement.exports, scope)
+
+    # imports are declared only (see declare_statement)
+    # breaks, continues and other statements have no identifiers
+
+  def resolve_block_statement(self, statement: BlockStatement, scope: StaticScope):
+    # block of statements has new scope
+    block_scope = StaticScope(scope)
+
+    self.resolve_scope_statements(statement.statements, block_scope)
+    statement.size = block_scope.size
+
+  def resolve_declaration_statement(self, statement: VariableDeclarationStatement | ConstantDeclarationStatement, scope: StaticScope):
+    if statement.initialization:
+      self.resolve_expression(statement.initialization, scope)
+
+  def resolve_condition_statement(self, statement: ConditionStatement, scope: StaticScope):
+    self.resolve_expression(statement.condition, scope)
+    self.resolve_statement(statement.then_branch, scope)
+
+    if statement.else_branch:
+      self.resolve_statement(statement.else_branch, scope)
+
+  def resolve_while_statement(self, statement: WhileStatement, scope: StaticScope):
+    self.resolve_expression(statement.condition, scope)
+    self.resolve_statement(statement.body, scope)
+
+  def resolve_for_statement(self, statement: ForStatement, scope: StaticScope):
+    # loop has new scope for initializer
+    loop_scope = StaticScope(scope)
+
+    self.declare_statement(statement.initializer, loop_scope)
+    self.declare_statement(statement.body, loop_scope)
+
+    self.resolve_statement(statement.initializer, loop_scope)
+    self.resolve_expression(statement.condition, loop_scope)
+    self.resolve_expression(statement.increment, loop_scope)
+    self.resolve_statement(statement.body, loop_scope)
+
+    statement.size = loop_scope.size
+
+  def resolve_function_declaration_statement(self, statement: FunctionDeclarationStatement, scope: StaticScope):
+    # function captures declarations of enclosing scopes that it uses (see CaptureScope)
+    capture_scope = CaptureScope(scope)
+
+    # function call has new scope for parameters
+    # slots of parameters are their positions (duplicated parameter fails when function is called)
+    function_scope = StaticScope(capture_scope)
+
+    for param in statement.params:
+      function_scope.declare(param.name.code)
+
+    # default values are evaluated in scope of parameters
+    for param in statement.params:
+      if param.defaultValue:
+        self.resolve_expression(param.defaultValue, function_scope)
+
+    self.declare_statement(statement.body, function_scope)
+    self.resolve_statement(statement.body, function_scope)
+    statement.size = function_scope.size
+    statement.captures = tuple(capture_scope.captures)
+
+  # resolve expressions
+
+  # expressions are resolved with explicit stack, so deep expressions do not hit recursion limit
+  def resolve_expression(self, expression: Expression, scope: StaticScope):
+    stack = [expression]
+
+    while stack:
+      expression = stack.pop()
+
+      if is_expression_of_class(expression, IdentifierExpression):
+        expression.address = self.resolve_identifier(expression, scope)
+      elif is_expression_of_class(expression, UnaryOperationExpression):
+        stack.append(expression.operand)
+      elif is_expression_of_class(expression, BinaryOperationExpression):
+        # member name is not an identifier
+        if not is_token_of_type(expression.operator, DOT_TOKEN):
+          stack.append(expression.right)
+
+        stack.append(expression.left)
+      elif is_expression_of_class(expression, GroupingExpression):
+        stack.extend(reversed(expression.expressions))
+      elif is_expression_of_class(expression, GroupingApplicationExpression):
+        stack.append(expression.right)
+        stack.append(expression.left)
+      elif is_expression_of_class(expression, AssociationExpression):
+        for key, value in reversed(expression.entries):
+          stack.append(value)
+
+          # identifier keys are names of members
+          if not is_expression_of_class(key, IdentifierExpression):
+            stack.append(key)
+
+      # literals, constants and empty expressions have no identifiers
+
+  def resolve_identifier(self, expression: IdentifierExpression, scope: StaticScope) -> tuple[int, int]:
+    address = scope.resolve(expression.name.code)
+
+    if address is None:
+      raise NameError(f'{expression.name.code} is not found!')
+
+    return address
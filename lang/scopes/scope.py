@@ -0,0 +1,80 @@
+# scope known before execution
+# maps names declared in scope to slots (indexes of their containers in runtime Scope)
+class StaticScope:
+  # names that are not declared in scope are resolved in parent scope
+  # (scope of function captures are resolved by scope itself, see CaptureScope)
+  closed = False
+
+  def __init__(self, parent: 'StaticScope | None' = None):
+    self.parent = parent
+    self.slots: dict[str, int] = {}
+
+  # amount of slots of runtime scope
+  @property
+  def size(self) -> int:
+    return len(self.slots)
+
+  # returns slot of name (declarations of one name in one scope share slot)
+  def declare(self, name: str) -> int:
+    if name not in self.slots:
+      self.slots[name] = len(self.slots)
+
+    return self.slots[name]
+
+  # returns slot of name in this scope or None
+  def find(self, name: str) -> int | None:
+    return self.slots.get(name)
+
+  # returns address (depth, slot) of the closest declaration of name
+  # returns None if name is not declared
+  def resolve(self, name: str) -> tuple[int, int] | None:
+    scope = self
+    depth = 0
+
+    while scope:
+      slot = scope.find(name)
+
+      if slot is not None:
+        # declaration can be accessed before it is executed, then shadowed declaration is used (see Stack.get_container_by_address),
+        # so function that contains declaration captures shadowed declaration too
+        if not scope.closed:
+          enclosing = scope.parent
+
+          while enclosing and not enclosing.closed:
+            enclosing = enclosing.parent
+
+          if enclosing:
+            enclosing.find(name)
+
+        return (depth, slot)
+
+      if scope.closed:
+        return None
+
+      scope = scope.parent
+      depth += 1
+
+    return None
+
+# scope of declarations captured by function (outer scope of function call, see Environment)
+# name that is declared outside of function gets slot here when it is resolved inside of function,
+# capture (name and address of declaration relative to scope where function is declared) is saved with slot
+class CaptureScope(StaticScope):
+  closed = True
+
+  def __init__(self, parent: StaticScope):
+    super().__init__(parent)
+    self.captures: list[tuple[str, int, int]] = []
+
+  # returns slot of captured name or None if name is not declared outside of function
+  def find(self, name: str) -> int | None:
+    if name in self.slots:
+      return self.slots[name]
+
+    address = self.parent.resolve(name)
+
+    if address is None:
+      return None
+
+    self.captures.append((name, *address))
+    return self.declare(name)
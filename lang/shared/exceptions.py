@@ -7,3 +7,7 @@ class Error(Exception):
 
     self.position = position
     self.message = message
+
+  # errors are pickled when they are raised in worker processes
+  def __reduce__(self):
+    return (self.__class__, (self.position, self.message))
@@ -1,2 +1,5 @@
 # standard extension for files with code
 SOURCE_MODULE_EXTENSION = 'br'
+
+# extension for files with compiled code (AST and dependencies)
+COMPILED_MODULE_EXTENSION = 'brc'
@@ -0,0 +1,12 @@
+import resource
+import sys
+
+# returns peak resident set size (MB) of current process
+# ru_maxrss is measured in kilobytes on Linux and in bytes on macOS
+def get_peak_memory() -> float:
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+  if sys.platform == 'darwin':
+    return peak / 1024 / 1024
+
+  return peak / 1024
@@ -1,8 +1,14 @@
 # indicates position of first token symbol
 class TokenPosition:
+  __slots__ = ('row', 'column')
+
   def __init__(self, row: int, column: int):
     self.row = row
     self.column = column
 
+  # positions are pickled as constructor arguments (compact and fast to load)
+  def __reduce__(self):
+    return (TokenPosition, (self.row, self.column))
+
   def __str__(self):
     return f"{self.row}:{self.column}"
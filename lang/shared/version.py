@@ -0,0 +1,3 @@
+# version of the interpreter
+# it has to be changed when AST format is changed, because cached and compiled ASTs depend on it
+INTERPRETER_VERSION = '0.4.0'
@@ -0,0 +1,200 @@
+from interpreter.interpreter import *
+
+# tree-walking interpreter that evaluates rvalues to values (unboxed temporaries)
+# Interpreter wraps result of every operation in readable container that is read right away,
+# so operands, conditions, initializers and right sides of assignments are evaluated to values here (see evaluate_value)
+# containers are created only for lvalues (variables and object members), elements of tuples, lists and objects,
+# function arguments and returned values (function callables receive and return containers)
+# errors are the same as in Interpreter (values are checked where Interpreter checks containers)
+class UnboxedInterpreter(Interpreter):
+  # execute statements
+
+  def execute_variable_declaration_statement(self, statement: VariableDeclarationStatement):
+    # default variable value
+    value = None
+
+    if statement.initialization:
+      value = self.evaluate_value(statement.initialization, 'Variable initializer is not readable', ValueError)
+
+    variable_container = TransformContainer(statement.name.code, value)
+    self.current_stack.declare_container(variable_container, statement.slot)
+
+    return variable_container
+
+  def execute_constant_declaration_statement(self, statement: ConstantDeclarationStatement):
+    value = self.evaluate_value(statement.initialization, 'Constant initializer is not readable', ValueError)
+
+    constant_container = ReadableContainer(statement.name.code, value)
+    self.current_stack.declare_container(constant_container, statement.slot)
+
+    return constant_container
+
+  def execute_condition_statement(self, statement: ConditionStatement, depth: int):
+    if self.evaluate_value(statement.condition, 'Condition is not a readable container'):
+      return self.execute_statement(statement.then_branch, depth + 1)
+
+    elif statement.else_branch:
+      return self.execute_statement(statement.else_branch, depth + 1)
+
+  def execute_while_statement(self, statement: WhileStatement, depth: int):
+    while self.evaluate_value(statement.condition, 'Condition is not readable'):
+      completion = self.execute_statement(statement.body, depth + 1)
+
+      # handle breaks and continues, pass return to function
+      if isinstance(completion, Completion):
+        if completion is BREAK:
+          break
+        if completion is not CONTINUE:
+          return completion
+
+  def execute_for_statement(self, statement: ForStatement, depth: int):
+    self.current_stack.add_scope(statement.size)
+
+    try:
+      self.execute_statement(statement.initializer, depth + 1)
+
+      while self.evaluate_value(statement.condition, 'Condition is not readable'):
+        completion = self.execute_statement(statement.body, depth + 1)
+
+        # handle breaks and continues, pass return to function
+        if isinstance(completion, Completion):
+          if completion is BREAK:
+            break
+          if completion is not CONTINUE:
+            return completion
+
+        self.evaluate_expression(statement.increment)
+
+    # remove scope afterwards (even if loop is left by return)
+    finally:
+      self.current_stack.remove_scope()
+
+  # evaluate expressions
+  # expressions that are evaluated to containers box their values once (when result is not read right away)
+
+  def evaluate_unary_expression(self, expression: UnaryOperationExpression):
+    if expression.operator.type in UNARY_OPERATIONS:
+      return self.create_readable_container(self.evaluate_value(expression))
+
+    return super().evaluate_unary_expression(expression)
+
+  def evaluate_binary_expression(self, expression: BinaryOperationExpression):
+    operator = expression.operator
+
+    if operator.type in BINARY_OPERATIONS:
+      return self.create_readable_container(self.evaluate_binary_value(expression, BINARY_OPERATIONS[operator.type]))
+    if operator.type in ASSIGNMENT_OPERATIONS:
+      return self.evaluate_operation_and_assign_expression(expression, ASSIGNMENT_OPERATIONS[operator.type])
+
+    return super().evaluate_binary_expression(expression)
+
+  def evaluate_assign_expression(self, expression: BinaryOperationExpression):
+    left: WriteableContainer = self.evaluate_expression(expression.left)
+    if not isinstance(left, WriteableContainer):
+      raise ExpressionError('Left value is not writable')
+
+    left.write(self.evaluate_value(expression.right, 'Right container is not readable'))
+
+    return left
+
+  # evaluates assignment with operation (+=, -= etc.)
+  def evaluate_operation_and_assign_expression(self, expression: BinaryOperationExpression, operation):
+    left: TransformContainer = self.evaluate_expression(expression.left)
+    if not isinstance(left, TransformContainer):
+      raise ExpressionError('Left value is not readable and writable')
+
+    right = self.evaluate_value(expression.right, 'Right container is not readable')
+
+    left.write(operation(expression.operator, left.read(), right))
+    return left
+
+  def evaluate_parentheses_application_expression(self, expression: GroupingApplicationExpression):
+    return self.create_readable_container(self.evaluate_call_value(expression))
+
+  # evaluate values
+
+  # evaluates expression to value
+  # message and class of error describe expression that is not evaluated to readable container
+  def evaluate_value(self, expression: Expression, message: str = '', error = ExpressionError):
+    if is_expression_of_class(expression, IdentifierExpression):
+      container = self.current_stack.get_container_by_address(expression.name.code, *expression.address)
+
+    elif is_expression_of_class(expression, BinaryOperationExpression):
+      operator = expression.operator
+
+      if operator.type in BINARY_OPERATIONS:
+        return self.evaluate_binary_value(expression, BINARY_OPERATIONS[operator.type])
+      if is_token_of_type(operator, OR_TOKEN):
+        return self.evaluate_or_value(expression)
+      if is_token_of_type(operator, AND_TOKEN):
+        return self.evaluate_and_value(expression)
+
+      container = self.evaluate_binary_expression(expression)
+
+    elif is_expression_of_class(expression, LiteralExpression):
+      return self.get_literal_value(expression)
+
+    elif is_expression_of_class(expression, ConstantExpression):
+      return expression.value
+
+    elif is_expression_of_class(expression, GroupingApplicationExpression) and is_token_of_type(expression.right.operator, LEFT_PARENTHESES_TOKEN):
+      return self.evaluate_call_value(expression)
+
+    elif is_expression_of_class(expression, UnaryOperationExpression) and expression.operator.type in UNARY_OPERATIONS:
+      operand = self.evaluate_value(expression.operand, 'Operand value is not readable')
+      return UNARY_OPERATIONS[expression.operator.type](expression.operator, operand)
+
+    elif is_expression_of_class(expression, NullExpression):
+      return None
+
+    # lvalues and composite values
+    else:
+      container = self.evaluate_expression(expression)
+
+    if not isinstance(container, ReadableContainer):
+      raise error(message)
+
+    return container.read()
+
+  # evaluates binary operation that does not change operands (see interpreter/operations.py)
+  def evaluate_binary_value(self, expression: BinaryOperationExpression, operation):
+    left = self.evaluate_value(expression.left, 'Left value is not readable')
+    right = self.evaluate_value(expression.right, 'Right container is not readable')
+
+    return operation(expression.operator, left, right)
+
+  def evaluate_or_value(self, expression: BinaryOperationExpression):
+    left = self.evaluate_value(expression.left, 'Left value is not readable')
+
+    # if left is true - return and skip right
+    if left: return left
+
+    return self.evaluate_value(expression.right, 'Right container is not readable')
+
+  def evaluate_and_value(self, expression: BinaryOperationExpression):
+    left = self.evaluate_value(expression.left, 'Left value is not readable')
+
+    # if left is false - return and skip right
+    if not left: return left
+
+    return self.evaluate_value(expression.right, 'Right container is not readable')
+
+  # evaluates function call to returned value
+  def evaluate_call_value(self, expression: GroupingApplicationExpression):
+    function_value: FunctionValue = self.evaluate_value(expression.left, 'Left value is not readable')
+    if not is_value_of_type(function_value, FUNCTION_TYPE):
+      raise ValueError(f'{function_value} is not callable')
+
+    # arguments are elements of tuple literal
+    arguments = [self.evaluate_expression(exp) for exp in expression.right.expressions]
+
+    for argument in arguments:
+      if not isinstance(argument, ReadableContainer):
+        raise ExpressionError('Argument is not readable')
+
+    # execute function
+    return_value: ReadableContainer = function_value.callable(*arguments)
+    if not isinstance(return_value, ReadableContainer):
+      raise ExpressionError('Returned value is not readable')
+
+    return return_value.read()